@@ -1,4 +1,44 @@
-from .base_client import BaseAPIClient
-from .pet_client import PetClient
+from typing import TYPE_CHECKING
 
-__all__ = ["BaseAPIClient", "PetClient"]
+from api_tests.utils.lazy import lazy_exports
+
+_EXPORTS = {
+    "BaseAPIClient": ".base_client",
+    "PetClient": ".pet_client",
+    "BulkItemResult": ".bulk",
+    "BulkResult": ".bulk",
+    "FileUpload": ".bulk",
+    "UploadResult": ".bulk",
+    "ResponseCache": ".cache",
+    "Cassette": ".cassette",
+    "CassetteMiss": ".cassette",
+    "CircuitBreaker": ".resilience",
+    "CircuitOpenError": ".resilience",
+    "HedgePolicy": ".resilience",
+    "Resilience": ".resilience",
+    "RetryBudget": ".resilience",
+    "PooledHTTPAdapter": ".session_pool",
+    "SessionPool": ".session_pool",
+    "RequestsTransport": ".transport",
+    "Transport": ".transport",
+    "HttpxTransport": ".httpx_transport",
+    "AsyncBaseAPIClient": ".async_base_client",
+    "AsyncPetClient": ".async_pet_client",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .base_client import BaseAPIClient
+    from .pet_client import PetClient
+    from .bulk import BulkItemResult, BulkResult, FileUpload, UploadResult
+    from .cache import ResponseCache
+    from .cassette import Cassette, CassetteMiss
+    from .resilience import CircuitBreaker, CircuitOpenError, HedgePolicy, Resilience, RetryBudget
+    from .session_pool import PooledHTTPAdapter, SessionPool
+    from .transport import RequestsTransport, Transport
+    from .httpx_transport import HttpxTransport
+    from .async_base_client import AsyncBaseAPIClient
+    from .async_pet_client import AsyncPetClient
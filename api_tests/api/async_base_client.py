@@ -0,0 +1,220 @@
+import asyncio
+import logging
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Any
+import httpx
+
+from api_tests.api.base_client import RETRY_ALLOWED_METHODS, RETRY_STATUS_FORCELIST
+from api_tests.api.instrumentation import HttpxTrace, RequestHook, RequestTiming, current_test, emit, global_hooks
+from api_tests.config.settings import settings
+from api_tests.utils.endpoints import endpoint_template
+
+logger = logging.getLogger(__name__)
+
+RETRY_AFTER_STATUS_CODES = frozenset({413, 429, 503})
+BACKOFF_MAX = 120.0
+
+
+class AsyncBaseAPIClient:
+    """asyncio counterpart of BaseAPIClient on a pooled keep-alive httpx.AsyncClient.
+
+    At most ``max_concurrency`` requests are in flight at once; retries mirror
+    the urllib3 ``Retry`` configured on the sync client.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None
+    ):
+        self.base_url = base_url or settings.get_base_url()
+        self.max_concurrency = max_concurrency or settings.ASYNC_MAX_CONCURRENCY
+        self.max_retries = settings.MAX_RETRIES
+        self.backoff_factor = settings.RETRY_BACKOFF_FACTOR
+        self.hooks: List[RequestHook] = []
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.client = self._create_client(
+            max_connections or settings.ASYNC_MAX_CONNECTIONS,
+            max_keepalive_connections or settings.ASYNC_MAX_KEEPALIVE_CONNECTIONS
+        )
+
+    def _create_client(self, max_connections: int, max_keepalive_connections: int) -> httpx.AsyncClient:
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections
+        )
+        return httpx.AsyncClient(
+            limits=limits,
+            timeout=settings.TIMEOUT,
+            verify=settings.VERIFY_SSL,
+            headers={"Accept": "application/json"}
+        )
+
+    def _build_url(self, endpoint: str) -> str:
+        endpoint = endpoint.lstrip("/")
+        return f"{self.base_url.rstrip('/')}/{endpoint}"
+
+    def _backoff_time(self, consecutive_errors: int) -> float:
+        if consecutive_errors <= 1:
+            return 0.0
+        return min(BACKOFF_MAX, self.backoff_factor * (2 ** (consecutive_errors - 1)))
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> Optional[float]:
+        if response.status_code not in RETRY_AFTER_STATUS_CODES:
+            return None
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs
+    ) -> httpx.Response:
+        url = self._build_url(endpoint)
+        if headers:
+            headers = {key: value for key, value in headers.items() if value is not None}
+
+        hooks = global_hooks()
+        if self.hooks:
+            hooks = hooks + tuple(self.hooks)
+        timing = None
+        if hooks:
+            timing = RequestTiming(
+                method=method,
+                url=url,
+                endpoint=endpoint_template(endpoint),
+                test=current_test(),
+                started_at=time.time()
+            )
+            kwargs["extensions"] = {**kwargs.get("extensions", {}), "trace": HttpxTrace(timing)}
+
+        logger.info("Making %s request to %s", method, url)
+        started = time.perf_counter()
+        response = None
+        try:
+            async with self._semaphore:
+                response = await self._send_with_retries(
+                    method,
+                    url,
+                    params=params,
+                    json=json_data,
+                    data=data,
+                    files=files,
+                    headers=headers,
+                    timing=timing,
+                    **kwargs
+                )
+        except httpx.HTTPError as e:
+            if timing is not None:
+                timing.error = str(e)
+            raise
+        finally:
+            if timing is not None:
+                timing.total = time.perf_counter() - started
+                if response is not None:
+                    timing.status = response.status_code
+                emit(hooks, timing, response)
+
+        logger.info("Response status: %s", response.status_code)
+        return response
+
+    async def _send_with_retries(
+        self,
+        method: str,
+        url: str,
+        timing: Optional[RequestTiming] = None,
+        **kwargs
+    ) -> httpx.Response:
+        retryable = method.upper() in RETRY_ALLOWED_METHODS
+        attempt = 0
+        while True:
+            if timing is not None:
+                timing.retries = attempt
+            try:
+                response = await self.client.request(method=method, url=url, **kwargs)
+            except httpx.TransportError as e:
+                attempt += 1
+                if not retryable or attempt > self.max_retries:
+                    logger.error("Request failed: %s", e)
+                    raise
+                delay = self._backoff_time(attempt)
+                logger.warning("Retrying %s %s (%d/%d) after error: %s", method, url, attempt, self.max_retries, e)
+                await asyncio.sleep(delay)
+                continue
+
+            if not retryable or response.status_code not in RETRY_STATUS_FORCELIST:
+                return response
+
+            attempt += 1
+            if attempt > self.max_retries:
+                raise httpx.HTTPStatusError(
+                    f"Max retries exceeded with url: {url} "
+                    f"(too many {response.status_code} error responses)",
+                    request=response.request,
+                    response=response
+                )
+            delay = self._retry_after(response)
+            if delay is None:
+                delay = self._backoff_time(attempt)
+            logger.warning(
+                "Retrying %s %s (%d/%d) after status %s",
+                method, url, attempt, self.max_retries, response.status_code
+            )
+            await response.aclose()
+            await asyncio.sleep(delay)
+
+    async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> httpx.Response:
+        return await self._make_request("GET", endpoint, params=params, **kwargs)
+
+    async def post(
+        self,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> httpx.Response:
+        return await self._make_request("POST", endpoint, json_data=json_data, data=data, files=files, **kwargs)
+
+    async def put(
+        self,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> httpx.Response:
+        return await self._make_request("PUT", endpoint, json_data=json_data, data=data, **kwargs)
+
+    async def delete(self, endpoint: str, **kwargs) -> httpx.Response:
+        return await self._make_request("DELETE", endpoint, **kwargs)
+
+    async def close(self):
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncBaseAPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
@@ -0,0 +1,69 @@
+import asyncio
+from typing import List, Optional
+import httpx
+from api_tests.api.async_base_client import AsyncBaseAPIClient
+from api_tests.models.pet import Pet
+from api_tests.utils.multipart import SNIFF_BYTES, sniff_content_type
+
+
+class AsyncPetClient(AsyncBaseAPIClient):
+
+    async def add_pet(self, pet: Pet) -> httpx.Response:
+        return await self.post("pet", json_data=pet.model_dump(exclude_none=True))
+
+    async def update_pet(self, pet: Pet) -> httpx.Response:
+        return await self.put("pet", json_data=pet.model_dump(exclude_none=True))
+
+    async def find_pets_by_status(self, status: List[str]) -> httpx.Response:
+        params = {"status": status}
+        return await self.get("pet/findByStatus", params=params)
+
+    async def find_pets_by_tags(self, tags: List[str]) -> httpx.Response:
+        params = {"tags": tags}
+        return await self.get("pet/findByTags", params=params)
+
+    async def get_pet_by_id(self, pet_id: int) -> httpx.Response:
+        return await self.get(f"pet/{pet_id}")
+
+    async def update_pet_with_form(
+        self,
+        pet_id: int,
+        name: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> httpx.Response:
+        data = {}
+        if name:
+            data["name"] = name
+        if status:
+            data["status"] = status
+
+        return await self.post(f"pet/{pet_id}", data=data)
+
+    async def delete_pet(self, pet_id: int) -> httpx.Response:
+        return await self.delete(f"pet/{pet_id}")
+
+    async def upload_image(
+        self,
+        pet_id: int,
+        file_path: str,
+        additional_metadata: Optional[str] = None
+    ) -> httpx.Response:
+        file_data = await asyncio.to_thread(self._read_file, file_path)
+
+        filename = file_path.split("/")[-1]
+        files = {"file": (filename, file_data, sniff_content_type(file_data[:SNIFF_BYTES], filename))}
+        data = {}
+
+        if additional_metadata:
+            data["additionalMetadata"] = additional_metadata
+
+        return await self.post(
+            f"pet/{pet_id}/uploadImage",
+            files=files,
+            data=data if data else None
+        )
+
+    @staticmethod
+    def _read_file(file_path: str) -> bytes:
+        with open(file_path, "rb") as f:
+            return f.read()
@@ -1,38 +1,124 @@
 import logging
-from typing import Dict, Optional, Any
+import time
+from typing import Callable, Dict, List, Optional, Any, Tuple
 import requests
-from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from api_tests.api.cache import ResponseCache
+from api_tests.api.cassette import Cassette, body_hash, open_cassette
+from api_tests.api.resilience import Resilience, retry_after_seconds
+from api_tests.api.session_pool import PooledHTTPAdapter, SessionPool
+from api_tests.api.transport import RequestsTransport, Transport
+from api_tests.api.instrumentation import (
+    RequestHook,
+    RequestTiming,
+    current_test,
+    emit,
+    finish_timing,
+    global_hooks,
+    response_retries,
+    start_timing,
+)
 from api_tests.config.settings import settings
+from api_tests.utils.endpoints import endpoint_template
+from api_tests.utils.rate_limit import SharedRateLimiter
 
 logger = logging.getLogger(__name__)
 
+RETRY_STATUS_FORCELIST = [429, 500, 502, 503, 504]
+RETRY_ALLOWED_METHODS = ["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE", "POST"]
+RATE_LIMITED_STATUS = 429
+
 
 class BaseAPIClient:
 
-    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        resilience: Optional[Resilience] = None,
+        cassette: Optional[Cassette] = None,
+        sessions: Optional[SessionPool] = None,
+        transport: Optional[Transport] = None,
+        rate_limiter: Optional[SharedRateLimiter] = None
+    ):
         self.base_url = base_url or settings.get_base_url()
-        self.session = self._create_session()
+        self.hooks: List[RequestHook] = []
+        if cache is None and settings.CACHE_ENABLED:
+            cache = ResponseCache(max_entries=settings.CACHE_MAX_ENTRIES, ttl=settings.CACHE_TTL)
+        self.cache = cache
+        if resilience is None and settings.RESILIENCE_ENABLED:
+            resilience = Resilience.from_settings()
+        self.resilience = resilience
+        if cassette is None and settings.CASSETTE_MODE != "off":
+            cassette = open_cassette(settings.CASSETTE_PATH, settings.CASSETTE_MODE)
+        self.cassette = cassette
+        if rate_limiter is None:
+            rate_limiter = SharedRateLimiter.from_settings(self.base_url)
+        self.rate_limiter = rate_limiter
+        self.sessions = sessions or self._create_session_pool()
+        self.transport = transport or self._create_transport()
+
+    @property
+    def session(self) -> requests.Session:
+        return self.sessions.current()
     
-    def _create_session(self) -> requests.Session:
-        session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE", "POST"]
+    def _retry_strategy(self) -> Retry:
+        if self.resilience is not None:
+            return Retry.from_int(0)
+        if self.rate_limiter is not None:
+            # 429s are retried through the shared limiter, which paces every worker;
+            # urllib3 would otherwise retry any response carrying Retry-After itself.
+            return Retry(
+                total=settings.MAX_RETRIES,
+                backoff_factor=settings.RETRY_BACKOFF_FACTOR,
+                status_forcelist=[status for status in RETRY_STATUS_FORCELIST if status != RATE_LIMITED_STATUS],
+                allowed_methods=RETRY_ALLOWED_METHODS,
+                respect_retry_after_header=False
+            )
+        return Retry(
+            total=settings.MAX_RETRIES,
+            backoff_factor=settings.RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUS_FORCELIST,
+            allowed_methods=RETRY_ALLOWED_METHODS
         )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        
-        session.headers.update({
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        })
-        return session
+    
+    def _create_session_pool(self) -> SessionPool:
+        adapter = PooledHTTPAdapter(
+            max_retries=self._retry_strategy(),
+            pool_connections=settings.POOL_CONNECTIONS,
+            pool_maxsize=settings.POOL_MAXSIZE_PER_HOST,
+            pool_block=settings.POOL_BLOCK
+        )
+        return SessionPool(
+            adapter,
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json"
+            },
+            mode=settings.SESSION_POOL_MODE,
+            size=settings.SESSION_POOL_SIZE,
+            timeout=settings.SESSION_POOL_TIMEOUT
+        )
+    
+    def _create_transport(self) -> Transport:
+        if settings.TRANSPORT == "httpx":
+            # Imported here so that requests-only runs never pay for httpx and h2.
+            from api_tests.api.httpx_transport import HttpxTransport
+
+            return HttpxTransport(
+                http2=settings.HTTP2_ENABLED,
+                prior_knowledge=settings.HTTP2_PRIOR_KNOWLEDGE,
+                max_connections=settings.POOL_MAXSIZE_PER_HOST,
+                max_keepalive_connections=settings.POOL_MAXSIZE_PER_HOST,
+                verify=settings.VERIFY_SSL,
+                timeout=settings.TIMEOUT,
+                retry=self._retry_strategy()
+            )
+        if settings.TRANSPORT != "requests":
+            raise ValueError(f"Unknown transport: {settings.TRANSPORT}")
+        return RequestsTransport(self.sessions)
     
     def _build_url(self, endpoint: str) -> str:
         
@@ -51,34 +137,127 @@ class BaseAPIClient:
         **kwargs
     ) -> requests.Response:
         url = self._build_url(endpoint)
+        use_cache = kwargs.pop("use_cache", True)
     
         request_headers = self.session.headers.copy()
         if headers:
             request_headers.update(headers)
         
-        logger.info(f"Making {method} request to {url}")
-        try:
-            response = self.session.request(
+        cache_key = None
+        if self.cache is not None and method == "GET" and use_cache and not kwargs.get("stream"):
+            cache_key = self.cache.key(url, params)
+            cached = self.cache.get_fresh(cache_key)
+            if cached is not None:
+                logger.debug("Serving %s from cache", cache_key)
+                return cached
+            request_headers.update(self.cache.validators(cache_key))
+        
+        hooks = global_hooks()
+        if self.hooks:
+            hooks = hooks + tuple(self.hooks)
+        timing = None
+        if hooks:
+            timing = RequestTiming(
                 method=method,
                 url=url,
-                params=params,
-                json=json_data,
-                data=data,
-                files=files,
-                headers=request_headers,
-                timeout=settings.TIMEOUT,
-                verify=settings.VERIFY_SSL,
-                **kwargs
+                endpoint=endpoint_template(endpoint),
+                test=current_test(),
+                started_at=time.time(),
+                streamed=bool(kwargs.get("stream"))
             )
+            start_timing(timing)
+        
+        logger.info("Making %s request to %s", method, url)
+        started = time.perf_counter()
+        response = None
+        retries = None
+        try:
+            def send() -> requests.Response:
+                if hasattr(data, "seek"):
+                    data.seek(0)
+                return self.transport.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json_data,
+                    data=data,
+                    files=files,
+                    headers=request_headers,
+                    timeout=settings.TIMEOUT,
+                    verify=settings.VERIFY_SSL,
+                    **kwargs
+                )
+
+            def limited() -> requests.Response:
+                if self.rate_limiter is None:
+                    return send()
+                return self._send_rate_limited(endpoint_template(endpoint), send)
+
+            def transmit() -> requests.Response:
+                nonlocal retries
+                if self.resilience is None:
+                    return limited()
+                response, retries = self.resilience.execute(method, endpoint_template(endpoint), limited)
+                return response
+
+            if self.cassette is not None:
+                prepared_url = requests.Request(method, url, params=params).prepare().url
+                key = self.cassette.key(method, prepared_url, self.base_url, body_hash(json_data, data, files))
+                response = self.cassette.play(key, transmit)
+            else:
+                response = transmit()
             
-            logger.info(f"Response status: {response.status_code}")
-            logger.debug(f"Response body: {response.text[:500]}")
+            logger.info("Response status: %s", response.status_code)
+            if not kwargs.get("stream") and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response body: %r", response.content[:500])
             
+            if cache_key is not None:
+                return self.cache.resolve(cache_key, response)
             return response
             
         except requests.RequestException as e:
-            logger.error(f"Request failed: {str(e)}")
+            if timing is not None:
+                timing.error = str(e)
+            logger.error("Request failed: %s", e)
             raise
+        finally:
+            if timing is not None:
+                self._finish_timing(timing, started, response, hooks, retries)
+            if self.cache is not None and method != "GET":
+                self._invalidate_cache(endpoint, json_data)
+    
+    def _send_rate_limited(self, key: str, send: Callable[[], requests.Response]) -> requests.Response:
+        """Send once a slot for ``key`` is free; on 429 pause every worker and retry up to MAX_RETRIES times."""
+        for attempt in range(settings.MAX_RETRIES + 1):
+            self.rate_limiter.acquire(key)
+            response = send()
+            if response.status_code != RATE_LIMITED_STATUS or attempt == settings.MAX_RETRIES:
+                return response
+            self.rate_limiter.throttle(key, retry_after_seconds(response))
+            response.close()
+        return response
+
+    def _invalidate_cache(self, endpoint: str, json_data: Optional[Dict[str, Any]] = None) -> None:
+        self.cache.invalidate(self._build_url(endpoint))
+    
+    @staticmethod
+    def _finish_timing(
+        timing: RequestTiming,
+        started: float,
+        response: Optional[requests.Response],
+        hooks: Tuple[RequestHook, ...],
+        retries: Optional[int] = None
+    ) -> None:
+        timing.total = time.perf_counter() - started
+        finish_timing()
+        if response is not None:
+            headers_received = response.elapsed.total_seconds()
+            timing.status = response.status_code
+            timing.retries = response_retries(response) if retries is None else retries
+            timing.ttfb = max(0.0, headers_received - timing.connect - timing.tls)
+            if not timing.streamed:
+                timing.download = max(0.0, timing.total - headers_received)
+        emit(hooks, timing, response)
     
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> requests.Response:
         return self._make_request("GET", endpoint, params=params, **kwargs)
@@ -105,5 +284,15 @@ class BaseAPIClient:
     def delete(self, endpoint: str, **kwargs) -> requests.Response:
         return self._make_request("DELETE", endpoint, **kwargs)
     
+    def pool_stats(self) -> Dict[str, object]:
+        return self.transport.stats()
+    
     def close(self):
-        self.session.close()
+        self.transport.close()
+        self.sessions.close()
+        if self.resilience is not None:
+            self.resilience.close()
+        if self.rate_limiter is not None:
+            self.rate_limiter.close()
+        if self.cassette is not None:
+            self.cassette.save()
@@ -0,0 +1,93 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, List, Optional
+import requests
+
+
+@dataclass
+class BulkItemResult:
+    index: int
+    item: Any
+    response: Optional[requests.Response] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.response is not None and self.response.ok
+
+
+@dataclass
+class BulkResult:
+    items: List[BulkItemResult]
+    elapsed: float
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __getitem__(self, index: int) -> BulkItemResult:
+        return self.items[index]
+
+    @property
+    def responses(self) -> List[Optional[requests.Response]]:
+        return [result.response for result in self.items]
+
+    @property
+    def failures(self) -> List[BulkItemResult]:
+        return [result for result in self.items if not result.ok]
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+
+@dataclass
+class FileUpload:
+    pet_id: int
+    path: str
+    size: int = 0
+    content_type: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Bytes per second for this file, including any rate-limit wait."""
+        return self.size / self.elapsed if self.elapsed else 0.0
+
+
+@dataclass
+class UploadResult(BulkResult):
+    uploads: List[FileUpload] = field(default_factory=list)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(upload.size for upload in self.uploads)
+
+    @property
+    def throughput(self) -> float:
+        return self.total_bytes / self.elapsed if self.elapsed else 0.0
+
+
+def run_bulk(
+    operation: Callable[[Any], requests.Response],
+    items: Iterable[Any],
+    max_workers: int
+) -> BulkResult:
+    """Run ``operation`` for every item on a thread pool; results keep input order."""
+    items = list(items)
+    results = [BulkItemResult(index=index, item=item) for index, item in enumerate(items)]
+
+    def run_one(result: BulkItemResult) -> None:
+        try:
+            result.response = operation(result.item)
+        except Exception as e:
+            result.error = e
+
+    started = time.perf_counter()
+    if items:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            list(executor.map(run_one, results))
+    return BulkResult(items=results, elapsed=time.perf_counter() - started)
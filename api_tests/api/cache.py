@@ -0,0 +1,109 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+import requests
+
+
+@dataclass
+class CacheEntry:
+    response: requests.Response
+    stored_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of GET responses with a TTL and conditional revalidation.
+
+    Expired entries that carry an ``ETag`` or ``Last-Modified`` validator are
+    kept and revalidated with a conditional request; a 304 refreshes them.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 30.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()), doseq=True)}"
+
+    def get_fresh(self, key: str) -> Optional[requests.Response]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry.stored_at > self.ttl:
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.response
+
+    def validators(self, key: str) -> Dict[str, str]:
+        entry = self._entries.get(key)
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def resolve(self, key: str, response: requests.Response) -> requests.Response:
+        """Store or revalidate from a network response; returns the response callers should see."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if response.status_code == 304 and entry is not None:
+                entry.stored_at = time.monotonic()
+                self._entries.move_to_end(key)
+                self.revalidations += 1
+                return entry.response
+            self.misses += 1
+            if response.status_code != 200:
+                self._entries.pop(key, None)
+                return response
+            self._entries[key] = CacheEntry(
+                response=response,
+                stored_at=time.monotonic(),
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified")
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return response
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "invalidations": self.invalidations,
+        }
@@ -0,0 +1,84 @@
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional, Tuple
+
+from api_tests.api.hooks import RequestHook, RequestTiming
+
+if TYPE_CHECKING:
+    import requests
+
+Exchange = Tuple[RequestTiming, Optional["requests.Response"]]
+
+
+class ExchangeCapture(RequestHook):
+    """Keeps the last ``capacity`` request/response exchanges per test.
+
+    Only references are stored on the request path; bodies are decoded when
+    :meth:`render` is called, which normally happens only for failed tests.
+    """
+
+    def __init__(self, capacity: int = 20, body_limit: int = 2000):
+        self.capacity = capacity
+        self.body_limit = body_limit
+        self._buffers: Dict[Optional[str], Deque[Exchange]] = {}
+        self._lock = threading.Lock()
+
+    def on_request(self, timing: RequestTiming, response: Optional["requests.Response"]) -> None:
+        buffer = self._buffers.get(timing.test)
+        if buffer is None:
+            with self._lock:
+                buffer = self._buffers.setdefault(timing.test, deque(maxlen=self.capacity))
+        buffer.append((timing, response))
+
+    def exchanges(self, test: Optional[str]) -> List[Exchange]:
+        return list(self._buffers.get(test, ()))
+
+    def discard(self, test: Optional[str]) -> None:
+        with self._lock:
+            self._buffers.pop(test, None)
+
+    def _body(self, body) -> str:
+        if body is None or body == b"" or body == "":
+            return ""
+        if isinstance(body, str):
+            text = body
+        elif isinstance(body, (bytes, bytearray)):
+            text = bytes(body[:self.body_limit]).decode("utf-8", errors="replace")
+        else:
+            return f"<{type(body).__name__} streamed body>"
+        if len(body) > self.body_limit:
+            text = text[:self.body_limit] + f"... <{len(body)} bytes>"
+        return text
+
+    @staticmethod
+    def _request_body(request):
+        if hasattr(request, "body"):
+            return request.body
+        try:
+            return request.content
+        except Exception:
+            return None
+
+    def render(self, test: Optional[str]) -> str:
+        lines = []
+        for number, (timing, response) in enumerate(self.exchanges(test), start=1):
+            outcome = timing.status if timing.status is not None else f"error: {timing.error}"
+            lines.append(f"#{number} {timing.method} {timing.url} -> {outcome} ({timing.total * 1000:.1f} ms)")
+            if response is None:
+                continue
+            request = response.request
+            for key, value in request.headers.items():
+                lines.append(f"> {key}: {value}")
+            request_body = self._body(self._request_body(request))
+            if request_body:
+                lines.append(f"> {request_body}")
+            for key, value in response.headers.items():
+                lines.append(f"< {key}: {value}")
+            if timing.streamed:
+                lines.append("< <streamed body not captured>")
+            else:
+                response_body = self._body(response.content)
+                if response_body:
+                    lines.append(f"< {response_body}")
+            lines.append("")
+        return "\n".join(lines)
@@ -0,0 +1,276 @@
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+from collections import defaultdict
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+logger = logging.getLogger(__name__)
+
+MODES = ("off", "record", "replay", "new_episodes")
+MAGIC = b"APICAS01"
+TRAILER = struct.Struct("<Q8s")
+LENGTH = struct.Struct("<I")
+
+Entry = Tuple[Dict[str, Any], bytes]
+
+
+class CassetteMiss(requests.RequestException):
+    """Raised in replay mode when no recorded interaction matches the request."""
+
+
+def body_hash(
+    json_data: Optional[Any] = None,
+    data: Optional[Any] = None,
+    files: Optional[Dict[str, Any]] = None
+) -> str:
+    """Order-independent hash of a request body as passed to ``_make_request``."""
+    digest = hashlib.sha256()
+    if json_data is not None:
+        digest.update(b"json:" + json.dumps(json_data, sort_keys=True, separators=(",", ":")).encode())
+    if hasattr(data, "fingerprint"):
+        digest.update(b"stream:" + data.fingerprint().encode())
+    elif data:
+        items = sorted(data.items()) if isinstance(data, dict) else data
+        digest.update(b"data:" + (urlencode(items).encode() if not isinstance(items, bytes) else items))
+    for name, value in sorted((files or {}).items()):
+        digest.update(b"file:" + name.encode())
+        if isinstance(value, tuple):
+            filename, content = value[0], value[1]
+            digest.update(str(filename).encode())
+            if isinstance(content, (bytes, str)):
+                digest.update(content if isinstance(content, bytes) else content.encode())
+    return digest.hexdigest()[:16]
+
+
+class Cassette:
+    """Recorded HTTP interactions in one memory-mapped file.
+
+    The file is ``MAGIC``, then length-prefixed interactions (JSON metadata
+    and raw body), then a JSON index of key -> [offset, ...] and a fixed-size
+    trailer pointing at the index, so opening a cassette reads only the index.
+    Repeated requests replay their recorded responses in order.
+
+    Interactions are stored under the full key (method, normalized URL and
+    body hash); ``match_on`` picks which of ``method``, ``url`` and ``body``
+    must match on lookup and ``ignore_params`` drops volatile query
+    parameters, so the same file can be replayed more or less strictly. With
+    ``allow_repeats`` the last response for a key is served again once its
+    recordings are used up, otherwise that is a miss.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = "replay",
+        match_on: Iterable[str] = ("method", "url", "body"),
+        ignore_params: Iterable[str] = (),
+        allow_repeats: bool = True
+    ):
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.path = Path(path)
+        self.mode = mode
+        self.match_on = frozenset(match_on)
+        self.ignore_params = frozenset(ignore_params)
+        self.allow_repeats = allow_repeats
+        self._lock = threading.Lock()
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._index: Dict[str, List[int]] = {}
+        self._matches: Dict[str, List[int]] = defaultdict(list)
+        self._recorded: Dict[str, List[Entry]] = defaultdict(list)
+        self._played: Dict[str, int] = defaultdict(int)
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+        if mode in ("replay", "new_episodes") and self.path.exists():
+            self._load()
+        elif mode == "replay":
+            raise FileNotFoundError(f"Cassette not found: {self.path}")
+
+    def _load(self) -> None:
+        self._file = open(self.path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{self.path} is not a cassette")
+        index_offset, magic = TRAILER.unpack_from(self._mmap, len(self._mmap) - TRAILER.size)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} has no index; it was not closed properly")
+        self._index = json.loads(self._mmap[index_offset:len(self._mmap) - TRAILER.size])
+        self._matches = defaultdict(list)
+        for key, offsets in self._index.items():
+            self._matches[self.match_key(key)].extend(offsets)
+
+    def __len__(self) -> int:
+        return sum(len(offsets) for offsets in self._index.values()) + self.recorded_pending
+
+    @property
+    def recorded_pending(self) -> int:
+        return sum(len(entries) for entries in self._recorded.values())
+
+    @staticmethod
+    def key(method: str, url: str, base_url: str, body: str) -> str:
+        """Full interaction key: method, path relative to ``base_url`` with sorted query, body hash."""
+        split = urlsplit(url)
+        path = split.path
+        base_path = urlsplit(base_url).path.rstrip("/")
+        if path.startswith(base_path):
+            path = path[len(base_path):]
+        query = sorted(parse_qsl(split.query, keep_blank_values=True))
+        return f"{method.upper()} {path}{'?' + urlencode(query) if query else ''} {body}"
+
+    def match_key(self, key: str) -> str:
+        method, target, body = key.split(" ")
+        parts = []
+        if "method" in self.match_on:
+            parts.append(method)
+        if "url" in self.match_on:
+            path, _, query = target.partition("?")
+            if self.ignore_params and query:
+                query = urlencode([(name, value) for name, value in parse_qsl(query, keep_blank_values=True)
+                                   if name not in self.ignore_params])
+            parts.append(f"{path}?{query}" if query else path)
+        if "body" in self.match_on:
+            parts.append(body)
+        return " ".join(parts)
+
+    def _read(self, offset: int) -> Entry:
+        meta_length, = LENGTH.unpack_from(self._mmap, offset)
+        offset += LENGTH.size
+        meta = json.loads(self._mmap[offset:offset + meta_length])
+        offset += meta_length
+        body_length, = LENGTH.unpack_from(self._mmap, offset)
+        offset += LENGTH.size
+        return meta, self._mmap[offset:offset + body_length]
+
+    def _lookup(self, key: str) -> Optional[Entry]:
+        with self._lock:
+            offsets = self._matches.get(key, [])
+            recorded = self._recorded.get(key, [])
+            total = len(offsets) + len(recorded)
+            if total == 0:
+                return None
+            position = self._played[key]
+            if position >= total:
+                if not self.allow_repeats:
+                    return None
+                position = total - 1
+            self._played[key] += 1
+            if position < len(offsets):
+                return self._read(offsets[position])
+            return recorded[position - len(offsets)]
+
+    def play(self, key: str, send: Callable[[], requests.Response]) -> requests.Response:
+        """Serve ``key`` from the cassette or call ``send``, depending on the mode."""
+        if self.mode == "off":
+            return send()
+        match_key = self.match_key(key)
+        if self.mode in ("replay", "new_episodes"):
+            entry = self._lookup(match_key)
+            if entry is not None:
+                self.hits += 1
+                return _build_response(*entry)
+            self.misses += 1
+            if self.mode == "replay":
+                raise CassetteMiss(f"No recorded interaction for {key} in {self.path}")
+        response = send()
+        self._record(key, match_key, response)
+        return response
+
+    def _record(self, key: str, match_key: str, response: requests.Response) -> None:
+        meta = {
+            "key": key,
+            "url": response.url,
+            "method": response.request.method if response.request is not None else None,
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": dict(response.headers),
+        }
+        with self._lock:
+            self._recorded[match_key].append((meta, response.content))
+            self._played[match_key] += 1
+            self.recorded += 1
+
+    def save(self) -> None:
+        """Write all interactions to disk; a no-op unless something new was recorded."""
+        with self._lock:
+            if not self._recorded:
+                return
+            entries: Dict[str, List[Entry]] = {
+                key: [self._read(offset) for offset in offsets] for key, offsets in self._index.items()
+            }
+            for recorded in self._recorded.values():
+                for meta, body in recorded:
+                    entries.setdefault(meta["key"], []).append((meta, body))
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = self.path.with_suffix(self.path.suffix + ".tmp")
+            index: Dict[str, List[int]] = {}
+            with open(temporary, "wb") as out:
+                out.write(MAGIC)
+                for key, interactions in entries.items():
+                    for meta, body in interactions:
+                        index.setdefault(key, []).append(out.tell())
+                        encoded = json.dumps(meta, separators=(",", ":")).encode()
+                        out.write(LENGTH.pack(len(encoded)) + encoded + LENGTH.pack(len(body)))
+                        out.write(body)
+                index_offset = out.tell()
+                out.write(json.dumps(index, separators=(",", ":")).encode())
+                out.write(TRAILER.pack(index_offset, MAGIC))
+            self._unmap()
+            os.replace(temporary, self.path)
+            self._recorded.clear()
+            self._load()
+        logger.info("Saved cassette %s (%s interactions)", self.path, len(self))
+
+    def _unmap(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._file.close()
+            self._mmap = self._file = None
+            self._index = {}
+            self._matches = defaultdict(list)
+
+    def close(self) -> None:
+        self.save()
+        with self._lock:
+            self._unmap()
+
+    def stats(self) -> Dict[str, int]:
+        return {"interactions": len(self), "hits": self.hits, "misses": self.misses, "recorded": self.recorded}
+
+
+def _build_response(meta: Dict[str, Any], body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = meta["status"]
+    response.reason = meta["reason"]
+    response.headers = CaseInsensitiveDict(meta["headers"])
+    response.url = meta["url"]
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.elapsed = timedelta(0)
+    response._content = bytes(body)
+    response._content_consumed = True
+    response.request = requests.Request(meta["method"], meta["url"]).prepare()
+    return response
+
+
+_open_cassettes: Dict[Tuple[str, str], Cassette] = {}
+_open_lock = threading.Lock()
+
+
+def open_cassette(path: str, mode: str) -> Cassette:
+    """Shared Cassette per (path, mode), so clients in one process write one file."""
+    with _open_lock:
+        cassette = _open_cassettes.get((path, mode))
+        if cassette is None:
+            cassette = _open_cassettes[(path, mode)] = Cassette(path, mode)
+        return cassette
@@ -0,0 +1,94 @@
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, Optional, Tuple
+
+if TYPE_CHECKING:
+    import requests
+
+# The hook registry and per-thread timing state, kept free of requests/urllib3 so
+# pytest plugins can register hooks without loading the HTTP stack. The timed
+# adapters live in api_tests.api.instrumentation, which re-exports these names.
+_active = threading.local()
+_global_hooks: Tuple["RequestHook", ...] = ()
+_current_test: Optional[str] = None
+
+
+@dataclass
+class RequestTiming:
+    """Timing breakdown of one ``_make_request`` call, in seconds.
+
+    ``connect`` and ``tls`` are only non-zero when a new connection was opened;
+    ``ttfb`` is the wait for response headers after the connection was ready
+    and ``download`` the time spent reading the body.
+    """
+    method: str
+    url: str
+    endpoint: str
+    test: Optional[str] = None
+    status: Optional[int] = None
+    error: Optional[str] = None
+    started_at: float = 0.0
+    total: float = 0.0
+    connect: float = 0.0
+    tls: float = 0.0
+    ttfb: float = 0.0
+    download: float = 0.0
+    retries: int = 0
+    streamed: bool = False
+
+
+class RequestHook(ABC):
+    """Receives a RequestTiming (and the response, if any) after every request."""
+
+    @abstractmethod
+    def on_request(self, timing: RequestTiming, response: Optional["requests.Response"]) -> None:
+        ...
+
+
+def add_hook(hook: RequestHook) -> None:
+    global _global_hooks
+    _global_hooks = _global_hooks + (hook,)
+
+
+def remove_hook(hook: RequestHook) -> None:
+    global _global_hooks
+    _global_hooks = tuple(registered for registered in _global_hooks if registered is not hook)
+
+
+def global_hooks() -> Tuple[RequestHook, ...]:
+    return _global_hooks
+
+
+def set_current_test(test: Optional[str]) -> None:
+    global _current_test
+    _current_test = test
+
+
+def current_test() -> Optional[str]:
+    if getattr(_active, "detached", False):
+        return None
+    return _current_test
+
+
+def detach_thread() -> None:
+    """Stop attributing requests made on this (background) thread to the running test."""
+    _active.detached = True
+
+
+def start_timing(timing: RequestTiming) -> None:
+    _active.timing = timing
+
+
+def finish_timing() -> None:
+    _active.timing = None
+
+
+def emit(hooks: Iterable[RequestHook], timing: RequestTiming, response: Optional["requests.Response"]) -> None:
+    for hook in hooks:
+        hook.on_request(timing, response)
+
+
+def active_timing() -> Optional[RequestTiming]:
+    """The RequestTiming of the request this thread is currently sending, if any."""
+    return getattr(_active, "timing", None)
@@ -0,0 +1,253 @@
+import logging
+import threading
+import time
+from collections import Counter
+from datetime import timedelta
+from typing import Any, Dict, Iterator, Optional
+import httpx
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.util.retry import Retry
+
+from api_tests.api.instrumentation import SyncHttpxTrace, active_timing
+from api_tests.api.transport import Transport
+
+logger = logging.getLogger(__name__)
+
+
+class _StreamedBody:
+    """File-like ``response.raw`` over an httpx byte stream, for ``iter_content``."""
+
+    def __init__(self, response: httpx.Response):
+        self._response = response
+        self._chunks: Iterator[bytes] = response.iter_bytes()
+        self._buffer = b""
+
+    def read(self, amt: Optional[int] = None, **_) -> bytes:
+        while amt is None or len(self._buffer) < amt:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if amt is None:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:amt], self._buffer[amt:]
+        return data
+
+    def close(self) -> None:
+        self._response.close()
+
+
+def _translate(error: httpx.HTTPError) -> requests.RequestException:
+    message = str(error) or type(error).__name__
+    if isinstance(error, httpx.ConnectTimeout):
+        return requests.ConnectTimeout(message)
+    if isinstance(error, httpx.TimeoutException):
+        return requests.Timeout(message)
+    if isinstance(error, httpx.TransportError):
+        return requests.ConnectionError(message)
+    return requests.RequestException(message)
+
+
+def _to_prepared(request: httpx.Request) -> requests.PreparedRequest:
+    prepared = requests.PreparedRequest()
+    prepared.method = request.method
+    prepared.url = str(request.url)
+    prepared.headers = CaseInsensitiveDict(
+        (key.decode("latin-1"), value.decode("latin-1")) for key, value in request.headers.raw
+    )
+    try:
+        prepared.body = request.content or None
+    except httpx.RequestNotRead:
+        prepared.body = None
+    return prepared
+
+
+class HttpxTransport(Transport):
+    """Transport on a shared ``httpx.Client`` that multiplexes requests over HTTP/2.
+
+    With ``http2`` the client negotiates HTTP/2 through TLS ALPN, so all
+    concurrent requests to a host share one connection and one handshake.
+    ``prior_knowledge`` speaks HTTP/2 over cleartext (h2c) without
+    negotiation, which is what local stand-ins without TLS need.
+
+    ``retry`` is the urllib3 ``Retry`` the requests transport would mount,
+    applied here with the same methods, statuses, backoff and Retry-After
+    handling. Connection errors and timeouts are raised as their ``requests``
+    equivalents and exhausted status retries as ``requests.RetryError``.
+    """
+
+    name = "httpx"
+
+    def __init__(
+        self,
+        http2: bool = True,
+        prior_knowledge: bool = False,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        verify: bool = True,
+        timeout: float = 30.0,
+        retry: Optional[Retry] = None
+    ):
+        self.http2 = http2 or prior_knowledge
+        self.retry = retry
+        self.client = httpx.Client(
+            http1=not prior_knowledge,
+            http2=self.http2,
+            verify=verify,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections
+            )
+        )
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+        self.http_versions: Counter = Counter()
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        stream = kwargs.pop("stream", False)
+        follow_redirects = kwargs.pop("allow_redirects", True)
+        data = kwargs.pop("data", None)
+        files = kwargs.pop("files", None)
+        headers = dict(kwargs.pop("headers", None) or {})
+        options: Dict[str, Any] = {
+            "params": kwargs.pop("params", None),
+            "json": kwargs.pop("json", None),
+            "timeout": kwargs.pop("timeout", httpx.USE_CLIENT_DEFAULT),
+        }
+        kwargs.pop("verify", None)
+        if kwargs:
+            raise TypeError(f"Unsupported request options for the {self.name} transport: {sorted(kwargs)}")
+        if isinstance(data, (bytes, str)):
+            options["content"] = data
+        elif hasattr(data, "read"):
+            if hasattr(data, "len"):
+                headers["Content-Length"] = str(data.len)
+        elif data:
+            options["data"] = data
+        if files:
+            options["files"] = files
+            headers = {key: value for key, value in headers.items() if key.lower() != "content-type"}
+
+        attempt = 0
+        while True:
+            if hasattr(data, "read"):
+                if attempt:
+                    data.seek(0)
+                options["content"] = iter(data)
+            try:
+                response = self._send(method, url, headers, options, stream, follow_redirects)
+            except (requests.ConnectionError, requests.Timeout) as error:
+                if not self._may_retry(method, attempt):
+                    raise
+                attempt += 1
+                logger.warning("Retrying %s %s (%s/%s) after error: %s", method, url, attempt, self.retry.total, error)
+                time.sleep(self._backoff(attempt))
+                continue
+
+            response.transport_retries = attempt
+            retry_after = response.headers.get("Retry-After")
+            if self.retry is None or not self.retry.is_retry(method, response.status_code, retry_after is not None):
+                return response
+            if not self._may_retry(method, attempt):
+                if self.retry.raise_on_status:
+                    response.close()
+                    raise requests.exceptions.RetryError(
+                        f"Max retries exceeded with url: {url} (too many {response.status_code} error responses)",
+                        response=response
+                    )
+                return response
+            attempt += 1
+            logger.warning("Retrying %s %s (%s/%s) after status %s",
+                           method, url, attempt, self.retry.total, response.status_code)
+            response.close()
+            if retry_after and self.retry.respect_retry_after_header:
+                time.sleep(self.retry.parse_retry_after(retry_after))
+            else:
+                time.sleep(self._backoff(attempt))
+
+    def _may_retry(self, method: str, attempt: int) -> bool:
+        if self.retry is None or not self.retry.total or attempt >= self.retry.total:
+            return False
+        allowed_methods = self.retry.allowed_methods
+        if allowed_methods is not None and method.upper() not in allowed_methods:
+            return False
+        with self._lock:
+            self.retries += 1
+        return True
+
+    def _backoff(self, attempt: int) -> float:
+        """urllib3's backoff: nothing before the first retry, then ``backoff_factor * 2 ** (n - 1)``."""
+        if attempt <= 1:
+            return 0.0
+        return min(self.retry.backoff_max, self.retry.backoff_factor * 2 ** (attempt - 1))
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        options: Dict[str, Any],
+        stream: bool,
+        follow_redirects: bool
+    ) -> requests.Response:
+        timing = active_timing()
+        extensions = {"trace": SyncHttpxTrace(timing)} if timing is not None else None
+        started = time.perf_counter()
+        try:
+            request = self.client.build_request(method, url, headers=headers, extensions=extensions, **options)
+            response = self.client.send(request, stream=True, follow_redirects=follow_redirects)
+            headers_received = time.perf_counter() - started
+            if not stream:
+                try:
+                    response.read()
+                finally:
+                    response.close()
+        except httpx.HTTPError as error:
+            raise _translate(error) from error
+        with self._lock:
+            self.requests += 1
+            self.http_versions[response.http_version] += 1
+        return self._to_requests(response, stream, headers_received)
+
+    @staticmethod
+    def _to_requests(response: httpx.Response, stream: bool, elapsed: float) -> requests.Response:
+        """``requests.Response`` view of ``response``; ``elapsed`` is the time until headers, as in requests."""
+        adapted = requests.Response()
+        adapted.status_code = response.status_code
+        adapted.reason = response.reason_phrase
+        adapted.headers = CaseInsensitiveDict(response.headers)
+        adapted.url = str(response.url)
+        adapted.encoding = get_encoding_from_headers(adapted.headers)
+        adapted.elapsed = timedelta(seconds=elapsed)
+        adapted.request = _to_prepared(response.request)
+        if stream:
+            adapted.raw = _StreamedBody(response)
+        else:
+            adapted._content = response.content
+            adapted._content_consumed = True
+        adapted.http_version = response.http_version
+        return adapted
+
+    def connections(self) -> int:
+        """Open connections in the client's pool."""
+        pool = getattr(self.client._transport, "_pool", None)
+        return len(pool.connections) if pool is not None else 0
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "transport": self.name,
+                "http2": self.http2,
+                "requests": self.requests,
+                "retries": self.retries,
+                "http_versions": dict(self.http_versions),
+                "connections": self.connections(),
+            }
+
+    def close(self) -> None:
+        self.client.close()
@@ -0,0 +1,116 @@
+import time
+from typing import Any, Dict, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from api_tests.api.hooks import (
+    RequestHook,
+    RequestTiming,
+    active_timing,
+    add_hook,
+    current_test,
+    detach_thread,
+    emit,
+    finish_timing,
+    global_hooks,
+    remove_hook,
+    set_current_test,
+    start_timing,
+)
+
+
+class TimedHTTPConnection(HTTPConnection):
+
+    def _new_conn(self):
+        started = time.perf_counter()
+        sock = super()._new_conn()
+        timing = active_timing()
+        if timing is not None:
+            timing.connect += time.perf_counter() - started
+        return sock
+
+
+class TimedHTTPSConnection(HTTPSConnection):
+
+    def _new_conn(self):
+        started = time.perf_counter()
+        sock = super()._new_conn()
+        self._tcp_connect_time = time.perf_counter() - started
+        return sock
+
+    def connect(self) -> None:
+        self._tcp_connect_time = 0.0
+        started = time.perf_counter()
+        super().connect()
+        timing = active_timing()
+        if timing is not None:
+            timing.connect += self._tcp_connect_time
+            timing.tls += time.perf_counter() - started - self._tcp_connect_time
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections report connect and TLS handshake time."""
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
+
+
+def response_retries(response: requests.Response) -> int:
+    retries = getattr(response.raw, "retries", None)
+    if retries is None:
+        return getattr(response, "transport_retries", 0)
+    return len(retries.history)
+
+
+class HttpxTrace:
+    """httpx ``trace`` extension callback that fills in a RequestTiming's phases."""
+
+    def __init__(self, timing: RequestTiming):
+        self.timing = timing
+        self._started: Dict[str, float] = {}
+
+    async def __call__(self, event_name: str, info: Dict[str, Any]) -> None:
+        self.record(event_name)
+
+    def record(self, event_name: str) -> None:
+        now = time.perf_counter()
+        phase, _, state = event_name.rpartition(".")
+        if state == "started":
+            self._started[phase] = now
+            return
+        if state != "complete" or phase not in self._started:
+            return
+        elapsed = now - self._started.pop(phase)
+        if phase == "connection.connect_tcp":
+            self.timing.connect += elapsed
+        elif phase == "connection.start_tls":
+            self.timing.tls += elapsed
+        elif phase.endswith("receive_response_headers"):
+            self.timing.ttfb += elapsed
+        elif phase.endswith("receive_response_body"):
+            self.timing.download += elapsed
+
+
+class SyncHttpxTrace(HttpxTrace):
+    """``trace`` callback for a sync httpx client; records connect and TLS time only.
+
+    BaseAPIClient derives ``ttfb`` and ``download`` from the response itself.
+    """
+
+    def __call__(self, event_name: str, info: Dict[str, Any]) -> None:
+        if event_name.startswith("connection."):
+            self.record(event_name)
@@ -1,10 +1,25 @@
-from typing import List, Optional
+import mmap
+import os
+import time
+from contextlib import closing
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Union
 import requests
 from api_tests.api.base_client import BaseAPIClient
+from api_tests.api.bulk import BulkResult, FileUpload, UploadResult, run_bulk
+from api_tests.config.settings import settings
+from api_tests.models.adapters import iter_validated
 from api_tests.models.pet import Pet
+from api_tests.utils.json_stream import iter_json_array
+from api_tests.utils.consistency import Backoff, ConsistencyTimeout, ConvergenceStats, wait_until
+from api_tests.utils.multipart import SNIFF_BYTES, MultipartEncoder, sniff_content_type
+from api_tests.utils.rate_limit import TokenBucket
 
     
 class PetClient(BaseAPIClient):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.convergence = ConvergenceStats()
     
     def add_pet(self, pet: Pet) -> requests.Response:
         return self.post("pet", json_data=pet.model_dump(exclude_none=True))
@@ -12,16 +27,49 @@ class PetClient(BaseAPIClient):
     def update_pet(self, pet: Pet) -> requests.Response:
         return self.put("pet", json_data=pet.model_dump(exclude_none=True))
     
-    def find_pets_by_status(self, status: List[str]) -> requests.Response:
+    def find_pets_by_status(self, status: List[str], use_cache: bool = True) -> requests.Response:
         params = {"status": status}
-        return self.get("pet/findByStatus", params=params)
+        return self.get("pet/findByStatus", params=params, use_cache=use_cache)
     
-    def find_pets_by_tags(self, tags: List[str]) -> requests.Response:
+    def find_pets_by_tags(self, tags: List[str], use_cache: bool = True) -> requests.Response:
         params = {"tags": tags}
-        return self.get("pet/findByTags", params=params)
+        return self.get("pet/findByTags", params=params, use_cache=use_cache)
     
-    def get_pet_by_id(self, pet_id: int) -> requests.Response:
-        return self.get(f"pet/{pet_id}")
+    def iter_pets_by_status(
+        self,
+        status: List[str],
+        batch_size: Optional[int] = None,
+        skip_invalid: bool = False
+    ) -> Iterator[Pet]:
+        return self._iter_pets("pet/findByStatus", {"status": status}, batch_size, skip_invalid)
+    
+    def iter_pets_by_tags(
+        self,
+        tags: List[str],
+        batch_size: Optional[int] = None,
+        skip_invalid: bool = False
+    ) -> Iterator[Pet]:
+        return self._iter_pets("pet/findByTags", {"tags": tags}, batch_size, skip_invalid)
+    
+    def _iter_pets(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        batch_size: Optional[int],
+        skip_invalid: bool
+    ) -> Iterator[Pet]:
+        """Stream the response body and yield Pets batch by batch.
+
+        The request is sent on first iteration; stopping early closes the response.
+        """
+        response = self.get(endpoint, params=params, stream=True)
+        with closing(response):
+            response.raise_for_status()
+            raw_pets = iter_json_array(response.iter_content(chunk_size=settings.STREAM_CHUNK_SIZE))
+            yield from iter_validated(raw_pets, Pet, batch_size or settings.STREAM_BATCH_SIZE, skip_invalid)
+    
+    def get_pet_by_id(self, pet_id: int, use_cache: bool = True) -> requests.Response:
+        return self.get(f"pet/{pet_id}", use_cache=use_cache)
     
     def update_pet_with_form(
         self,
@@ -40,28 +88,153 @@ class PetClient(BaseAPIClient):
     
     def delete_pet(self, pet_id: int) -> requests.Response:
         return self.delete(f"pet/{pet_id}")
+
+    def wait_for_pet(
+        self,
+        pet_id: int,
+        predicate: Optional[Callable[[Pet], bool]] = None,
+        timeout: Optional[float] = None,
+        backoff: Optional[Backoff] = None
+    ) -> Pet:
+        """Re-GET the pet with backoff until it exists and matches ``predicate``; returns the converged Pet.
+
+        Raises ConsistencyTimeout when it has not converged within ``timeout`` seconds.
+        """
+        def observe() -> Union[Pet, int]:
+            response = self.get_pet_by_id(pet_id, use_cache=False)
+            if response.status_code != 200:
+                return response.status_code
+            return Pet.model_validate(response.json())
+
+        def converged(observed: Union[Pet, int]) -> bool:
+            return isinstance(observed, Pet) and (predicate is None or predicate(observed))
+
+        return self._wait(observe, converged, timeout, backoff, f"pet {pet_id}")
+
+    def wait_for_pet_absent(
+        self,
+        pet_id: int,
+        timeout: Optional[float] = None,
+        backoff: Optional[Backoff] = None
+    ) -> None:
+        """Re-GET the pet with backoff until the API answers 404."""
+        def observe() -> int:
+            return self.get_pet_by_id(pet_id, use_cache=False).status_code
+
+        self._wait(observe, lambda status: status == 404, timeout, backoff, f"deletion of pet {pet_id}")
+
+    def _wait(
+        self,
+        observe: Callable[[], Any],
+        converged: Callable[[Any], bool],
+        timeout: Optional[float],
+        backoff: Optional[Backoff],
+        description: str
+    ) -> Any:
+        try:
+            value, convergence = wait_until(observe, converged, timeout, backoff, description)
+        except ConsistencyTimeout as e:
+            self.convergence.record(e.convergence, converged=False)
+            raise
+        self.convergence.record(convergence)
+        return value
+    
+    def _invalidate_cache(self, endpoint: str, json_data: Optional[Dict[str, Any]] = None) -> None:
+        segments = endpoint.strip("/").split("/")
+        pet_id = None
+        if len(segments) > 1 and segments[1].isdigit():
+            pet_id = segments[1]
+        elif json_data and json_data.get("id") is not None:
+            pet_id = json_data["id"]
+        if pet_id is not None:
+            self.cache.invalidate(self._build_url(f"pet/{pet_id}"))
+        self.cache.invalidate_prefix(self._build_url("pet/findBy"))
+    
+    def add_pets(self, pets: Iterable[Pet], max_workers: Optional[int] = None) -> BulkResult:
+        return run_bulk(self.add_pet, pets, max_workers or settings.BULK_MAX_WORKERS)
+
+    def update_pets(self, pets: Iterable[Pet], max_workers: Optional[int] = None) -> BulkResult:
+        return run_bulk(self.update_pet, pets, max_workers or settings.BULK_MAX_WORKERS)
+
+    def get_pets(self, pet_ids: Iterable[int], max_workers: Optional[int] = None) -> BulkResult:
+        return run_bulk(self.get_pet_by_id, pet_ids, max_workers or settings.BULK_MAX_WORKERS)
+
+    def delete_pets(self, pet_ids: Iterable[int], max_workers: Optional[int] = None) -> BulkResult:
+        return run_bulk(self.delete_pet, pet_ids, max_workers or settings.BULK_MAX_WORKERS)
     
     def upload_image(
         self,
         pet_id: int,
         file_path: str,
-        additional_metadata: Optional[str] = None
+        additional_metadata: Optional[str] = None,
+        content_type: Optional[str] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        use_mmap: bool = False,
+        upload: Optional[FileUpload] = None
     ) -> requests.Response:
-        with open(file_path, "rb") as f:
-            file_data = f.read()
-        
-        filename = file_path.split("/")[-1]
-        files = {"file": (filename, file_data, "image/png")}
+        """Upload ``file_path`` as a streamed multipart body, read chunk by chunk from disk.
+
+        The content type is sniffed from the file unless given; ``upload`` is
+        filled in with the size, content type and elapsed time.
+        """
+        filename = os.path.basename(file_path)
         data = {}
-        
         if additional_metadata:
             data["additionalMetadata"] = additional_metadata
         
-        headers = {"Content-Type": None}
+        with open(file_path, "rb") as f:
+            source = f
+            if use_mmap and os.fstat(f.fileno()).st_size:
+                source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                if content_type is None:
+                    content_type = sniff_content_type(source.read(SNIFF_BYTES), filename)
+                    source.seek(0)
+                body = MultipartEncoder(
+                    fields=data,
+                    files={"file": (filename, source, content_type)},
+                    chunk_size=settings.UPLOAD_CHUNK_SIZE,
+                    on_read=rate_limiter.consume if rate_limiter is not None else None
+                )
+                started = time.perf_counter()
+                response = self.post(
+                    f"pet/{pet_id}/uploadImage",
+                    data=body,
+                    headers={"Content-Type": body.content_type}
+                )
+            finally:
+                if source is not f:
+                    source.close()
+        if upload is not None:
+            upload.size = os.path.getsize(file_path)
+            upload.content_type = content_type
+            upload.elapsed = time.perf_counter() - started
+        return response
+    
+    def upload_images(
+        self,
+        pet_id_to_paths: Mapping[int, Union[str, Iterable[str]]],
+        max_workers: Optional[int] = None,
+        max_bytes_per_second: Optional[float] = None,
+        additional_metadata: Optional[str] = None
+    ) -> UploadResult:
+        """Upload many files concurrently, sharing one byte-rate limit across all of them."""
+        uploads = [
+            FileUpload(pet_id=pet_id, path=path)
+            for pet_id, paths in pet_id_to_paths.items()
+            for path in ([paths] if isinstance(paths, str) else paths)
+        ]
+        rate = max_bytes_per_second if max_bytes_per_second is not None else settings.UPLOAD_MAX_BYTES_PER_SECOND
+        rate_limiter = TokenBucket(rate, capacity=max(rate / 10, settings.UPLOAD_CHUNK_SIZE)) if rate else None
+        
+        def upload_one(upload: FileUpload) -> requests.Response:
+            return self.upload_image(
+                upload.pet_id,
+                upload.path,
+                additional_metadata=additional_metadata,
+                rate_limiter=rate_limiter,
+                upload=upload
+            )
         
-        return self.post(
-            f"pet/{pet_id}/uploadImage",
-            files=files,
-            data=data if data else None,
-            headers=headers
-        )
\ No newline at end of file
+        result = run_bulk(upload_one, uploads, max_workers or settings.BULK_MAX_WORKERS)
+        return UploadResult(items=result.items, elapsed=result.elapsed, uploads=uploads)
\ No newline at end of file
@@ -0,0 +1,349 @@
+import logging
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Callable, Deque, Dict, Optional, Tuple
+import requests
+
+from api_tests.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS", "TRACE"})
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_AFTER_STATUSES = frozenset({413, 429, 503})
+
+Send = Callable[[], requests.Response]
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised without sending a request while the endpoint's circuit is open."""
+
+
+def retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """Seconds the ``Retry-After`` header asks for; None when absent or for statuses that do not carry it."""
+    if response.status_code not in RETRY_AFTER_STATUSES:
+        return None
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryBudget:
+    """Caps retries at ``ratio`` of original requests, plus a small reserve.
+
+    Every request deposits ``ratio`` tokens (up to ``max_tokens``) and every
+    retry withdraws one, so retries cannot multiply load on a struggling server.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        reserve: float = 10.0,
+        max_tokens: float = 100.0,
+        max_attempts: int = 3,
+        backoff_base: float = 0.05,
+        backoff_max: float = 5.0
+    ):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._tokens = reserve
+        self._lock = threading.Lock()
+        self._random = random.Random()
+        self.requests = 0
+        self.retries = 0
+        self.exhausted = 0
+
+    def deposit(self) -> None:
+        with self._lock:
+            self.requests += 1
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                self.exhausted += 1
+                return False
+            self._tokens -= 1
+            self.retries += 1
+            return True
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff before retry number ``attempt``."""
+        return self._random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "exhausted": self.exhausted,
+            "tokens": round(self._tokens, 2),
+        }
+
+
+class CircuitBreaker:
+    """Per-endpoint-template breaker: closed, open after consecutive failures, half-open probe."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._circuits: Dict[str, "_Circuit"] = defaultdict(_Circuit)
+        self._lock = threading.Lock()
+
+    def allow(self, key: str) -> bool:
+        with self._lock:
+            circuit = self._circuits[key]
+            if circuit.state == self.CLOSED:
+                return True
+            if circuit.state == self.OPEN and time.monotonic() - circuit.opened_at >= self.reset_timeout:
+                circuit.state = self.HALF_OPEN
+                circuit.probing = False
+            if circuit.state == self.HALF_OPEN and not circuit.probing:
+                circuit.probing = True
+                return True
+            circuit.rejected += 1
+            return False
+
+    def record(self, key: str, success: bool) -> None:
+        with self._lock:
+            circuit = self._circuits[key]
+            circuit.probing = False
+            if success:
+                circuit.failures = 0
+                circuit.state = self.CLOSED
+                return
+            circuit.failures += 1
+            if circuit.state == self.HALF_OPEN or circuit.failures >= self.failure_threshold:
+                if circuit.state != self.OPEN:
+                    circuit.opens += 1
+                    logger.warning("Circuit for %s opened after %s failures", key, circuit.failures)
+                circuit.state = self.OPEN
+                circuit.opened_at = time.monotonic()
+
+    def state(self, key: str) -> str:
+        return self._circuits[key].state
+
+    def stats(self) -> Dict[str, Dict[str, object]]:
+        with self._lock:
+            return {
+                key: {"state": circuit.state, "opens": circuit.opens, "rejected": circuit.rejected}
+                for key, circuit in self._circuits.items()
+            }
+
+
+@dataclass
+class _Circuit:
+    state: str = CircuitBreaker.CLOSED
+    failures: int = 0
+    opened_at: float = 0.0
+    probing: bool = False
+    opens: int = 0
+    rejected: int = 0
+
+
+class HedgePolicy:
+    """Sends a second GET when the first is slower than a latency percentile.
+
+    The threshold is the ``percentile`` of the last ``window`` successful
+    latencies of the endpoint template; no hedges are sent until
+    ``min_samples`` latencies are known, and hedges are capped at
+    ``max_ratio`` of requests.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        window: int = 200,
+        min_samples: int = 20,
+        min_delay: float = 0.005,
+        max_ratio: float = 0.1,
+        max_workers: int = 16
+    ):
+        self.percentile = percentile
+        self.window = window
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_ratio = max_ratio
+        self._latencies: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=self.window))
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedge")
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def threshold(self, key: str) -> Optional[float]:
+        with self._lock:
+            latencies = self._latencies.get(key)
+            if latencies is None or len(latencies) < self.min_samples:
+                return None
+            ordered = sorted(latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+        return max(self.min_delay, ordered[index])
+
+    def observe(self, key: str, latency: float) -> None:
+        with self._lock:
+            self._latencies[key].append(latency)
+
+    def _may_hedge(self) -> bool:
+        with self._lock:
+            if self.hedged >= self.max_ratio * self.requests:
+                return False
+            self.hedged += 1
+            return True
+
+    def send(self, key: str, send: Send) -> requests.Response:
+        with self._lock:
+            self.requests += 1
+        delay = self.threshold(key)
+        if delay is None:
+            return self._timed(key, send)
+
+        primary = self._executor.submit(self._timed, key, send)
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._may_hedge():
+            return primary.result()
+
+        logger.debug("Hedging %s after %.3fs", key, delay)
+        hedge = self._executor.submit(self._timed, key, send)
+        done, _ = wait([primary, hedge], return_when=FIRST_COMPLETED)
+        winner = hedge if hedge in done and primary not in done else primary
+        if winner.exception() is not None:
+            winner = hedge if winner is primary else primary
+        loser = hedge if winner is primary else primary
+        loser.add_done_callback(_close_response)
+        if winner is hedge:
+            with self._lock:
+                self.hedge_wins += 1
+        return winner.result()
+
+    def _timed(self, key: str, send: Send) -> requests.Response:
+        started = time.perf_counter()
+        response = send()
+        if response.status_code < 500:
+            self.observe(key, time.perf_counter() - started)
+        return response
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "thresholds_ms": {
+                key: round(threshold * 1000, 2)
+                for key in list(self._latencies)
+                if (threshold := self.threshold(key)) is not None
+            },
+        }
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+
+def _close_response(future: Future) -> None:
+    if future.exception() is None:
+        future.result().close()
+
+
+class Resilience:
+    """Opt-in replacement for the urllib3 ``Retry`` on BaseAPIClient.
+
+    Any of the three parts can be disabled by passing ``None``. Only
+    idempotent methods are retried, and only GETs are hedged.
+    """
+
+    def __init__(
+        self,
+        hedge: Optional[HedgePolicy] = None,
+        budget: Optional[RetryBudget] = None,
+        breaker: Optional[CircuitBreaker] = None
+    ):
+        self.hedge = hedge
+        self.budget = budget
+        self.breaker = breaker
+
+    @classmethod
+    def from_settings(cls) -> "Resilience":
+        return cls(
+            hedge=HedgePolicy(percentile=settings.HEDGE_PERCENTILE) if settings.HEDGE_ENABLED else None,
+            budget=RetryBudget(ratio=settings.RETRY_BUDGET_RATIO, max_attempts=settings.MAX_RETRIES),
+            breaker=CircuitBreaker(
+                failure_threshold=settings.CIRCUIT_FAILURE_THRESHOLD,
+                reset_timeout=settings.CIRCUIT_RESET_TIMEOUT
+            )
+        )
+
+    def execute(self, method: str, key: str, send: Send) -> Tuple[requests.Response, int]:
+        """Send through breaker, hedging and retry budget; returns the response and retry count."""
+        if self.breaker is not None and not self.breaker.allow(key):
+            raise CircuitOpenError(f"Circuit open for {method} {key}")
+        if self.budget is not None:
+            self.budget.deposit()
+        retryable = self.budget is not None and method in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            try:
+                if self.hedge is not None and method == "GET":
+                    response = self.hedge.send(key, send)
+                else:
+                    response = send()
+            except (requests.ConnectionError, requests.Timeout):
+                self._record(key, False)
+                if not self._may_retry(retryable, key, attempt):
+                    raise
+                attempt += 1
+                time.sleep(self.budget.backoff(attempt))
+                continue
+
+            failed = response.status_code >= 500
+            self._record(key, not failed)
+            if response.status_code not in RETRY_STATUSES or not self._may_retry(retryable, key, attempt):
+                return response, attempt
+            attempt += 1
+            delay = retry_after_seconds(response)
+            logger.warning("Retrying %s %s (%s/%s) after status %s",
+                           method, key, attempt, self.budget.max_attempts, response.status_code)
+            response.close()
+            time.sleep(self.budget.backoff(attempt) if delay is None else delay)
+
+    def _may_retry(self, retryable: bool, key: str, attempt: int) -> bool:
+        if not retryable or attempt >= self.budget.max_attempts:
+            return False
+        if self.breaker is not None and self.breaker.state(key) == CircuitBreaker.OPEN:
+            return False
+        return self.budget.withdraw()
+
+    def _record(self, key: str, success: bool) -> None:
+        if self.breaker is not None:
+            self.breaker.record(key, success)
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "hedge": self.hedge.stats() if self.hedge is not None else None,
+            "retry_budget": self.budget.stats() if self.budget is not None else None,
+            "circuit_breaker": self.breaker.stats() if self.breaker is not None else None,
+        }
+
+    def close(self) -> None:
+        if self.hedge is not None:
+            self.hedge.close()
@@ -0,0 +1,208 @@
+import logging
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Mapping, Optional
+import requests
+
+from api_tests.api.instrumentation import TimedHTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+MODES = ("thread_local", "checkout")
+
+
+class ConnectionStats:
+    """Counters shared by all urllib3 connection pools of one adapter."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.opened = 0
+        self.discarded = 0
+        self.waits = 0
+        self.wait_time = 0.0
+
+    def add(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + value)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            reused = max(0, self.requests - self.opened)
+            return {
+                "requests": self.requests,
+                "connections_opened": self.opened,
+                "connections_reused": reused,
+                "reuse_ratio": reused / self.requests if self.requests else 0.0,
+                "connections_discarded": self.discarded,
+                "connection_waits": self.waits,
+                "connection_wait_ms": round(self.wait_time * 1000, 3),
+            }
+
+
+class _CountingPool:
+    """Mixin for urllib3 connection pools that reports into ``connection_stats``."""
+
+    connection_stats: ConnectionStats
+
+    def _new_conn(self):
+        self.connection_stats.add("opened")
+        return super()._new_conn()
+
+    def _get_conn(self, timeout=None):
+        if not self.block or self.pool is None or not self.pool.empty():
+            return super()._get_conn(timeout)
+        started = time.perf_counter()
+        try:
+            return super()._get_conn(timeout)
+        finally:
+            self.connection_stats.add("waits")
+            self.connection_stats.add("wait_time", time.perf_counter() - started)
+
+    def _put_conn(self, conn) -> None:
+        if conn is not None and self.pool is not None and self.pool.full():
+            self.connection_stats.add("discarded")
+        super()._put_conn(conn)
+
+    def _make_request(self, *args, **kwargs):
+        self.connection_stats.add("requests")
+        return super()._make_request(*args, **kwargs)
+
+
+class PooledHTTPAdapter(TimedHTTPAdapter):
+    """TimedHTTPAdapter that counts requests, new, discarded and waited-for connections.
+
+    ``pool_maxsize`` is the number of keep-alive connections kept per host;
+    with ``pool_block`` it is also a hard cap and callers wait for a free
+    connection instead of opening (and later discarding) an extra one.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.connection_stats = ConnectionStats()
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: type(pool_class.__name__, (_CountingPool, pool_class), {"connection_stats": self.connection_stats})
+            for scheme, pool_class in self.poolmanager.pool_classes_by_scheme.items()
+        }
+
+
+class SessionPool:
+    """``requests.Session`` objects for concurrent use, all mounted on one adapter.
+
+    Sessions keep per-caller state (headers, cookies) and are not safe to
+    share between threads, while the adapter's urllib3 connection pools are,
+    so connections are reused across threads either way. In ``thread_local``
+    mode every thread gets its own session. In ``checkout`` mode at most
+    ``size`` sessions exist and ``checkout()`` waits up to ``timeout`` seconds
+    for one to be checked back in.
+    """
+
+    def __init__(
+        self,
+        adapter: PooledHTTPAdapter,
+        headers: Optional[Mapping[str, str]] = None,
+        mode: str = "thread_local",
+        size: int = 8,
+        timeout: float = 30.0
+    ):
+        if mode not in MODES:
+            raise ValueError(f"Unknown session pool mode: {mode}")
+        self.adapter = adapter
+        self.headers = dict(headers or {})
+        self.mode = mode
+        self.size = size
+        self.timeout = timeout
+        self._local = threading.local()
+        self._sessions: "weakref.WeakSet[requests.Session]" = weakref.WeakSet()
+        self._idle: List[requests.Session] = []
+        self._available = threading.Condition()
+        self._template = self._new_session()
+        if mode == "checkout":
+            self._idle.append(self._template)
+        else:
+            self._local.session = self._template
+        self.created = 1
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        session.mount("http://", self.adapter)
+        session.mount("https://", self.adapter)
+        session.headers.update(self.headers)
+        self._sessions.add(session)
+        return session
+
+    def current(self) -> requests.Session:
+        """This thread's session; in ``checkout`` mode outside a checkout, a template for reading defaults."""
+        session = getattr(self._local, "session", None)
+        if session is not None:
+            return session
+        if self.mode == "checkout":
+            return self._template
+        session = self._local.session = self._new_session()
+        with self._available:
+            self.created += 1
+        return session
+
+    def _acquire(self) -> requests.Session:
+        with self._available:
+            if not self._idle and self.created >= self.size:
+                self.waits += 1
+                started = time.perf_counter()
+                ready = self._available.wait_for(lambda: self._idle, timeout=self.timeout)
+                waited = time.perf_counter() - started
+                self.wait_time += waited
+                self.max_wait = max(self.max_wait, waited)
+                if not ready:
+                    raise TimeoutError(f"No session checked in within {self.timeout}s (pool size {self.size})")
+            self.checkouts += 1
+            if self._idle:
+                return self._idle.pop()
+            self.created += 1
+        return self._new_session()
+
+    def _release(self, session: requests.Session) -> None:
+        with self._available:
+            self._idle.append(session)
+            self._available.notify()
+
+    @contextmanager
+    def checkout(self) -> Iterator[requests.Session]:
+        """Session to send one request with; returned to the pool afterwards in ``checkout`` mode."""
+        if self.mode == "thread_local" or getattr(self._local, "session", None) is not None:
+            yield self.current()
+            return
+        session = self._acquire()
+        self._local.session = session
+        try:
+            yield session
+        finally:
+            self._local.session = None
+            self._release(session)
+
+    def stats(self) -> Dict[str, object]:
+        with self._available:
+            stats: Dict[str, object] = {
+                "mode": self.mode,
+                "size": self.size,
+                "sessions_created": self.created,
+                "checkouts": self.checkouts,
+                "session_waits": self.waits,
+                "session_wait_ms": round(self.wait_time * 1000, 3),
+                "max_session_wait_ms": round(self.max_wait * 1000, 3),
+            }
+        stats.update(self.adapter.connection_stats.snapshot())
+        return stats
+
+    def close(self) -> None:
+        for session in list(self._sessions):
+            session.close()
+        self.adapter.close()
@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from typing import Dict
+import requests
+
+from api_tests.api.session_pool import SessionPool
+
+
+class Transport(ABC):
+    """Sends one HTTP request for BaseAPIClient and returns a ``requests.Response``.
+
+    ``request`` takes the keyword arguments of ``requests.Session.request``
+    that the client uses, so everything above the transport (cache,
+    cassettes, resilience, instrumentation, assertions) is unchanged.
+    """
+
+    name = "transport"
+
+    @abstractmethod
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        ...
+
+    def stats(self) -> Dict[str, object]:
+        return {"transport": self.name}
+
+    def close(self) -> None:
+        pass
+
+
+class RequestsTransport(Transport):
+    """The default HTTP/1.1 transport: requests sessions from a SessionPool."""
+
+    name = "requests"
+
+    def __init__(self, sessions: SessionPool):
+        self.sessions = sessions
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        with self.sessions.checkout() as session:
+            return session.request(method=method, url=url, **kwargs)
+
+    def stats(self) -> Dict[str, object]:
+        return {"transport": self.name, **self.sessions.stats()}
+
+    def close(self) -> None:
+        self.sessions.close()
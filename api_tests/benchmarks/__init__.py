@@ -0,0 +1,18 @@
+from typing import TYPE_CHECKING
+
+from api_tests.utils.lazy import lazy_exports
+
+_EXPORTS = {
+    "BenchmarkResult": ".harness",
+    "compare": ".harness",
+    "measure": ".harness",
+    "BENCHMARKS": ".suite",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .harness import BenchmarkResult, compare, measure
+    from .suite import BENCHMARKS
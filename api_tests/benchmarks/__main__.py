@@ -0,0 +1,82 @@
+import argparse
+import fnmatch
+import json
+import logging
+import sys
+from pathlib import Path
+
+from api_tests.benchmarks.harness import compare, measure
+from api_tests.benchmarks.suite import BENCHMARKS, BenchmarkContext
+from api_tests.config.settings import settings
+
+BASELINE_PATH = Path(__file__).parent / "baselines.json"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure client overhead and compare with stored baselines")
+    parser.add_argument("--filter", default="*", help="Glob selecting benchmark names")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds per timed repeat")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repeats; the best is kept")
+    parser.add_argument("--threshold", type=float, default=settings.BENCHMARK_THRESHOLD,
+                        help="Allowed ops/sec drop against the baseline, as a fraction")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH), help="Baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--output", default="reports/benchmarks.json", help="JSON results path")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    baseline_path = Path(args.baseline)
+    baselines = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+
+    names = [name for name in BENCHMARKS if fnmatch.fnmatch(name, args.filter)]
+    context = BenchmarkContext()
+    try:
+        results = [measure(name, BENCHMARKS[name](context), args.min_time, args.repeat) for name in names]
+        if not args.update_baseline:
+            # Re-measure apparent regressions once so a noisy neighbour does not fail the gate.
+            for comparison in compare(results, baselines, args.threshold):
+                if comparison.regressed:
+                    position = names.index(comparison.name)
+                    retry = measure(comparison.name, BENCHMARKS[comparison.name](context), args.min_time, args.repeat)
+                    if compare([retry], baselines, args.threshold)[0].change > comparison.change:
+                        results[position] = retry
+    finally:
+        context.close()
+
+    print(f"{'benchmark':<24}{'ops/sec':>14}{'us/op':>12}{'peak B/op':>12}{'retained B/op':>15}")
+    for result in results:
+        print(f"{result.name:<24}{result.ops_per_sec:>14,.0f}{result.us_per_op:>12.2f}"
+              f"{result.peak_bytes_per_op:>12,.0f}{result.retained_bytes_per_op:>15,.1f}")
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps([result.to_dict() for result in results], indent=2))
+
+    if args.update_baseline:
+        for result in results:
+            entry = baselines.get(result.name, {})
+            entry.update(
+                ops_per_sec=round(result.ops_per_sec, 1),
+                relative=round(result.relative, 6),
+                peak_bytes_per_op=round(result.peak_bytes_per_op)
+            )
+            baselines[result.name] = entry
+        baseline_path.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline written to {baseline_path}")
+        return 0
+
+    comparisons = compare(results, baselines, args.threshold)
+    for comparison in comparisons:
+        marker = "REGRESSED" if comparison.regressed else "ok"
+        basis = "normalized" if comparison.normalized else "raw"
+        print(f"{comparison.name:<24}{comparison.change:>+10.1%} vs baseline ({basis})  {marker}")
+    regressions = [comparison.name for comparison in comparisons if comparison.regressed]
+    if regressions:
+        print(f"Regressed beyond their thresholds: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
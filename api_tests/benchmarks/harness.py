@@ -0,0 +1,151 @@
+import gc
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+_CALIBRATION_KEYS = [f"key-{index}" for index in range(64)]
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    ops_per_sec: float
+    us_per_op: float
+    peak_bytes_per_op: float
+    retained_bytes_per_op: float
+    iterations: int
+    relative: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class Comparison:
+    name: str
+    baseline_ops_per_sec: float
+    ops_per_sec: float
+    change: float
+    regressed: bool
+    normalized: bool = False
+
+
+def _calibration_workload() -> List[str]:
+    """Fixed pure-Python work (dict build, string formatting, sort) that tracks interpreter speed."""
+    counts = {key: len(key) * index for index, key in enumerate(_CALIBRATION_KEYS)}
+    return sorted(f"{key}={value}" for key, value in counts.items())
+
+
+def _calibrate(func: Callable[[], Any], min_time: float) -> int:
+    iterations = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time / 10 or iterations >= 1 << 24:
+            return max(1, int(iterations * min_time / max(elapsed, 1e-9)))
+        iterations *= 10
+
+
+def _allocations(func: Callable[[], Any], iterations: int) -> Dict[str, float]:
+    """Peak traced memory of a single call and bytes still held after a run, per call."""
+    iterations = max(1, min(iterations, 1000))
+    func()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        peaks = []
+        for _ in range(min(iterations, 21)):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            func()
+            peaks.append(tracemalloc.get_traced_memory()[1] - current)
+        before = tracemalloc.take_snapshot()
+        for _ in range(iterations):
+            func()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    retained = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return {"peak": sorted(peaks)[len(peaks) // 2], "retained": max(0, retained) / iterations}
+
+
+def _time_per_call(func: Callable[[], Any], iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations
+
+
+def measure(name: str, func: Callable[[], Any], min_time: float = 0.2, repeat: int = 5,
+            normalize: bool = True) -> BenchmarkResult:
+    """Best-of-``repeat`` throughput of ``func`` plus tracemalloc allocation figures.
+
+    With ``normalize``, every repeat also times a fixed calibration workload right
+    before ``func``; ``relative`` is the median ratio of the two throughputs, which
+    cancels most of the machine's speed and load drift between runs. Throughput
+    runs without tracemalloc, which would otherwise dominate the cost.
+    """
+    iterations = _calibrate(func, min_time)
+    reference_iterations = _calibrate(_calibration_workload, min_time / 2) if normalize else 0
+    best = float("inf")
+    ratios = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            reference = _time_per_call(_calibration_workload, reference_iterations) if normalize else 0.0
+            elapsed = _time_per_call(func, iterations)
+            best = min(best, elapsed)
+            if normalize:
+                ratios.append(reference / elapsed)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    allocations = _allocations(func, iterations)
+    return BenchmarkResult(
+        name=name,
+        ops_per_sec=1 / best,
+        us_per_op=best * 1e6,
+        peak_bytes_per_op=allocations["peak"],
+        retained_bytes_per_op=allocations["retained"],
+        iterations=iterations,
+        relative=statistics.median(ratios) if ratios else None
+    )
+
+
+def compare(
+    results: List[BenchmarkResult],
+    baselines: Dict[str, Dict[str, Any]],
+    threshold: float
+) -> List[Comparison]:
+    """Compare against stored baselines; a benchmark regresses when it is slower by more than ``threshold``.
+
+    When both the result and the baseline entry carry a ``relative`` figure, that
+    is compared instead of raw ops/sec, so a slower or busier machine does not
+    read as a regression. A per-benchmark ``threshold`` in the baseline entry
+    overrides the default.
+    """
+    comparisons = []
+    for result in results:
+        baseline = baselines.get(result.name)
+        if baseline is None:
+            continue
+        allowed = baseline.get("threshold", threshold)
+        normalized = result.relative is not None and "relative" in baseline
+        if normalized:
+            change = result.relative / baseline["relative"] - 1
+        else:
+            change = result.ops_per_sec / baseline["ops_per_sec"] - 1
+        comparisons.append(Comparison(
+            name=result.name,
+            baseline_ops_per_sec=baseline["ops_per_sec"],
+            ops_per_sec=result.ops_per_sec,
+            change=change,
+            regressed=change < -allowed,
+            normalized=normalized
+        ))
+    return comparisons
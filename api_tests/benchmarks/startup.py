@@ -0,0 +1,162 @@
+import argparse
+import json
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from api_tests.config.settings import settings
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+API_TESTS = REPO_ROOT / "api_tests"
+BASELINE_PATH = Path(__file__).parent / "startup_baseline.json"
+
+# Modules that only specific fixtures need; a narrowly selected run should not pay for them.
+HEAVY_MODULES = ("httpx", "h2", "hypercorn", "requests", "xdist.scheduler", "trio", "selenium", "allure")
+
+_LOADED_MARKER = "startup-probe-loaded:"
+_REPORT_LOADED = (
+    "import json, sys\n"
+    f"print({_LOADED_MARKER!r} + json.dumps(sorted(name for name in {HEAVY_MODULES!r} if name in sys.modules)))\n"
+)
+
+
+@dataclass
+class Probe:
+    """Python code run in a fresh interpreter; ``forbidden`` modules must not be loaded by it."""
+
+    name: str
+    code: str
+    cwd: Path
+    forbidden: Sequence[str] = ()
+
+
+@dataclass
+class StartupResult:
+    name: str
+    seconds: float
+    runs: List[float]
+    loaded: List[str]
+    forbidden_loaded: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, object]:
+        return asdict(self)
+
+
+PROBES = {
+    "collect_smoke": Probe(
+        "collect_smoke",
+        "import pytest\n"
+        "pytest.main(['--collect-only', '-q', '-m', 'smoke', '-p', 'no:cacheprovider', 'tests/test_pet_api.py'])\n",
+        API_TESTS,
+        forbidden=("httpx", "h2", "hypercorn", "xdist.scheduler", "trio"),
+    ),
+    "import_api_conftest": Probe(
+        "import_api_conftest",
+        # pytest imports the conftest's plugins too, so the probe does as well.
+        "import importlib, api_tests.conftest, api_tests.api, api_tests.models, api_tests.utils\n"
+        "for plugin in api_tests.conftest.pytest_plugins:\n"
+        "    importlib.import_module(plugin)\n",
+        REPO_ROOT,
+        forbidden=("httpx", "h2", "hypercorn", "requests"),
+    ),
+    "import_ui_conftest": Probe(
+        "import_ui_conftest",
+        "import ui_tests.conftest\n",
+        REPO_ROOT,
+        forbidden=("selenium", "allure"),
+    ),
+}
+
+
+def run_probe(probe: Probe, repeat: int = 5) -> StartupResult:
+    """Wall time of ``repeat`` fresh interpreters running the probe; the best run is kept."""
+    runs, loaded = [], []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, "-c", probe.code + _REPORT_LOADED],
+            cwd=probe.cwd,
+            capture_output=True,
+            text=True
+        )
+        runs.append(time.perf_counter() - started)
+        lines = [line for line in completed.stdout.splitlines() if line.startswith(_LOADED_MARKER)]
+        if completed.returncode != 0 or not lines:
+            raise RuntimeError(f"{probe.name} failed:\n{completed.stdout}{completed.stderr}")
+        loaded = json.loads(lines[-1][len(_LOADED_MARKER):])
+    return StartupResult(
+        name=probe.name,
+        seconds=min(runs),
+        runs=runs,
+        loaded=loaded,
+        forbidden_loaded=[name for name in loaded if name in probe.forbidden],
+    )
+
+
+def regressions(results: List[StartupResult], baselines: Dict[str, Dict[str, float]], threshold: float,
+                floor: float = 0.0) -> List[str]:
+    """Why each result fails the gate: a forbidden import, or slower than its baseline by more than ``threshold``.
+
+    A slowdown also has to exceed ``floor`` seconds, so a probe of a few hundred
+    milliseconds doesn't fail on scheduler noise.
+    """
+    problems = []
+    for result in results:
+        if result.forbidden_loaded:
+            problems.append(f"{result.name} imports {', '.join(result.forbidden_loaded)}")
+        baseline = baselines.get(result.name)
+        if baseline is None:
+            continue
+        allowed = baseline.get("threshold", threshold)
+        change = result.seconds / baseline["seconds"] - 1
+        if change > allowed and result.seconds - baseline["seconds"] > baseline.get("floor", floor):
+            problems.append(f"{result.name} is {change:+.0%} slower than its {baseline['seconds']:.3f}s baseline")
+    return problems
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure test-suite startup time and check which modules it loads")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per probe; the best is kept")
+    parser.add_argument("--threshold", type=float, default=settings.STARTUP_THRESHOLD,
+                        help="Allowed slowdown against the baseline, as a fraction")
+    parser.add_argument("--floor", type=float, default=settings.STARTUP_FLOOR,
+                        help="Slowdowns of at most this many seconds never fail the gate")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH), help="Baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--output", default="reports/startup_benchmark.json", help="JSON results path")
+    args = parser.parse_args(argv)
+
+    baseline_path = Path(args.baseline)
+    baselines = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+    results = [run_probe(probe, args.repeat) for probe in PROBES.values()]
+
+    print(f"{'probe':<22}{'best s':>9}{'baseline s':>12}  heavy modules loaded")
+    for result in results:
+        baseline = baselines.get(result.name, {}).get("seconds")
+        baseline_text = f"{baseline:>12.3f}" if baseline else f"{'-':>12}"
+        print(f"{result.name:<22}{result.seconds:>9.3f}{baseline_text}  {', '.join(result.loaded) or '-'}")
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps([result.to_dict() for result in results], indent=2))
+
+    if args.update_baseline:
+        for result in results:
+            entry = baselines.get(result.name, {})
+            entry["seconds"] = round(result.seconds, 3)
+            baselines[result.name] = entry
+        baseline_path.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline written to {baseline_path}")
+        return 0
+
+    problems = regressions(results, baselines, args.threshold, args.floor)
+    for problem in problems:
+        print(f"REGRESSION: {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
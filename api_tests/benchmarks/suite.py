@@ -0,0 +1,88 @@
+import json
+from typing import Any, Callable, Dict
+import requests
+
+from api_tests.api.pet_client import PetClient
+from api_tests.models.pet import Category, Pet, Tag
+from api_tests.server.http_server import PetStoreServer
+from api_tests.utils.assertions import assert_response_schema
+from api_tests.utils.endpoints import endpoint_template
+
+BENCHMARK_PET_ID = 4242
+
+
+class BenchmarkContext:
+    """A local stand-in server, a client pointed at it and a stored pet."""
+
+    def __init__(self):
+        self.server = PetStoreServer().start()
+        self.client = PetClient(base_url=self.server.base_url)
+        self.pet = Pet(
+            id=BENCHMARK_PET_ID,
+            category=Category(id=1, name="Dogs"),
+            name="Benchmark Dog",
+            photoUrls=["https://example.com/photo.jpg"],
+            tags=[Tag(id=1, name="benchmark")],
+            status="available"
+        )
+        self.client.add_pet(self.pet)
+        for index in range(100):
+            self.server.store.upsert({"name": f"filler-{index}", "photoUrls": [], "status": "pending"})
+
+    def close(self) -> None:
+        self.client.close()
+        self.server.stop()
+
+
+def _pet_response(context: BenchmarkContext) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
+    response.encoding = "utf-8"
+    response._content = json.dumps(context.pet.model_dump(exclude_none=True)).encode()
+    return response
+
+
+def build_url(context: BenchmarkContext) -> Callable[[], Any]:
+    return lambda: context.client._build_url(f"pet/{BENCHMARK_PET_ID}")
+
+
+def headers_copy(context: BenchmarkContext) -> Callable[[], Any]:
+    return context.client.session.headers.copy
+
+
+def endpoint_template_lookup(context: BenchmarkContext) -> Callable[[], Any]:
+    return lambda: endpoint_template(f"pet/{BENCHMARK_PET_ID}/uploadImage")
+
+
+def pet_model_dump(context: BenchmarkContext) -> Callable[[], Any]:
+    return lambda: context.pet.model_dump(exclude_none=True)
+
+
+def response_schema(context: BenchmarkContext) -> Callable[[], Any]:
+    response = _pet_response(context)
+    return lambda: assert_response_schema(response, Pet)
+
+
+def get_pet_e2e(context: BenchmarkContext) -> Callable[[], Any]:
+    return lambda: context.client.get_pet_by_id(BENCHMARK_PET_ID)
+
+
+def add_pet_e2e(context: BenchmarkContext) -> Callable[[], Any]:
+    return lambda: context.client.add_pet(context.pet)
+
+
+def find_by_status_e2e(context: BenchmarkContext) -> Callable[[], Any]:
+    return lambda: context.client.find_pets_by_status(["pending"]).json()
+
+
+BENCHMARKS: Dict[str, Callable[[BenchmarkContext], Callable[[], Any]]] = {
+    "build_url": build_url,
+    "headers_copy": headers_copy,
+    "endpoint_template": endpoint_template_lookup,
+    "pet_model_dump": pet_model_dump,
+    "assert_response_schema": response_schema,
+    "get_pet_e2e": get_pet_e2e,
+    "add_pet_e2e": add_pet_e2e,
+    "find_by_status_e2e": find_by_status_e2e,
+}
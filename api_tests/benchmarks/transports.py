@@ -0,0 +1,149 @@
+import argparse
+import json
+import logging
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from api_tests.api.pet_client import PetClient
+from api_tests.api.httpx_transport import HttpxTransport
+from api_tests.config.settings import settings
+from api_tests.load.histogram import LatencyHistogram
+from api_tests.models.pet import Pet
+from api_tests.server.asgi import H2PetStoreServer
+
+BENCHMARK_PET_ID = 4242
+
+
+@dataclass
+class TransportResult:
+    name: str
+    requests: int
+    concurrency: int
+    seconds: float
+    requests_per_sec: float
+    p50_ms: float
+    p99_ms: float
+    connections: int
+    http_versions: Dict[str, int]
+
+    def to_dict(self) -> Dict[str, object]:
+        return asdict(self)
+
+
+def make_certificate(directory: str) -> Optional[Tuple[str, str]]:
+    """Self-signed certificate for 127.0.0.1 made with the openssl CLI; None if it is not installed."""
+    if shutil.which("openssl") is None:
+        return None
+    certfile, keyfile = str(Path(directory) / "cert.pem"), str(Path(directory) / "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1", "-subj", "/CN=127.0.0.1",
+         "-addext", "subjectAltName=IP:127.0.0.1", "-keyout", keyfile, "-out", certfile],
+        check=True,
+        capture_output=True
+    )
+    return certfile, keyfile
+
+
+def transports(tls: bool) -> Dict[str, Callable[[str], PetClient]]:
+    """Client factories per transport; each run gets a new client so handshakes are counted."""
+    return {
+        "requests_http1": lambda base_url: PetClient(base_url=base_url),
+        "httpx_http1": lambda base_url: PetClient(
+            base_url=base_url,
+            transport=HttpxTransport(http2=False, verify=settings.VERIFY_SSL)
+        ),
+        "httpx_http2": lambda base_url: PetClient(
+            base_url=base_url,
+            transport=HttpxTransport(prior_knowledge=not tls, verify=settings.VERIFY_SSL)
+        ),
+    }
+
+
+def run_transport(name: str, client: PetClient, requests: int, concurrency: int) -> TransportResult:
+    """Send ``requests`` get_pet_by_id calls from ``concurrency`` threads through ``client``."""
+    histogram = LatencyHistogram()
+
+    def call(_: int) -> int:
+        started = time.perf_counter()
+        status = client.get_pet_by_id(BENCHMARK_PET_ID).status_code
+        histogram.record_seconds(time.perf_counter() - started)
+        return status
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        statuses = set(executor.map(call, range(requests)))
+    seconds = time.perf_counter() - started
+    if statuses != {200}:
+        raise RuntimeError(f"{name}: unexpected statuses {sorted(statuses)}")
+
+    stats = client.pool_stats()
+    summary = histogram.summary()
+    return TransportResult(
+        name=name,
+        requests=requests,
+        concurrency=concurrency,
+        seconds=seconds,
+        requests_per_sec=requests / seconds,
+        p50_ms=summary["p50_ms"],
+        p99_ms=summary["p99_ms"],
+        connections=stats.get("connections_opened", stats.get("connections", 0)),
+        http_versions=stats.get("http_versions", {"HTTP/1.1": stats.get("requests", 0)}),
+    )
+
+
+def run(requests: int, concurrency: int, tls: bool, names: Optional[List[str]] = None) -> List[TransportResult]:
+    """Benchmark every transport against one HTTP/1.1 + HTTP/2 stand-in, with TLS when possible."""
+    with tempfile.TemporaryDirectory() as directory:
+        certificate = make_certificate(directory) if tls else None
+        if tls and certificate is None:
+            logging.getLogger(__name__).warning("openssl not found, benchmarking without TLS")
+        certfile, keyfile = certificate or (None, None)
+        factories = transports(certificate is not None)
+        results = []
+        with H2PetStoreServer(certfile=certfile, keyfile=keyfile) as server:
+            server.store.upsert(Pet(id=BENCHMARK_PET_ID, name="Benchmark Dog", photoUrls=[]).model_dump())
+            for name in names or list(factories):
+                client = factories[name](server.base_url)
+                try:
+                    results.append(run_transport(name, client, requests, concurrency))
+                finally:
+                    client.close()
+        return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare HTTP/1.1 and HTTP/2 transports against a local stand-in")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per transport")
+    parser.add_argument("--concurrency", type=int, default=32, help="Threads sending requests")
+    parser.add_argument("--no-tls", action="store_true", help="Use cleartext (h2c) instead of HTTPS")
+    parser.add_argument("--output", default="reports/transport_benchmark.json", help="JSON results path")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    # The stand-in's certificate is self-signed.
+    settings.VERIFY_SSL = False
+    warnings.filterwarnings("ignore", message="Unverified HTTPS request")
+
+    results = run(args.requests, args.concurrency, tls=not args.no_tls)
+
+    print(f"{'transport':<18}{'req/sec':>10}{'p50 ms':>10}{'p99 ms':>10}{'connections':>13}  versions")
+    for result in results:
+        print(f"{result.name:<18}{result.requests_per_sec:>10,.0f}{result.p50_ms:>10.2f}{result.p99_ms:>10.2f}"
+              f"{result.connections:>13}  {result.http_versions}")
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps([result.to_dict() for result in results], indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,7 @@
 import os
 from pathlib import Path
+from typing import Dict
+from urllib.parse import urlsplit
 from dotenv import load_dotenv
 
 env_path = Path(__file__).parent.parent / ".env"
@@ -9,11 +11,90 @@ load_dotenv(dotenv_path=env_path)
 class Settings:
 
     BASE_URL: str = os.getenv("BASE_URL", "https://petstore.swagger.io/v2")
+    BASE_URLS: str = os.getenv("BASE_URLS", "")
     TIMEOUT: int = int(os.getenv("TIMEOUT", "30"))
     VERIFY_SSL: bool = os.getenv("VERIFY_SSL", "true").lower() == "true"
+    LOCAL_PETSTORE: bool = os.getenv("LOCAL_PETSTORE", "false").lower() == "true"
+    LOCAL_PETSTORE_PORT: int = int(os.getenv("LOCAL_PETSTORE_PORT", "0"))
+    MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
+    RETRY_BACKOFF_FACTOR: float = float(os.getenv("RETRY_BACKOFF_FACTOR", "1"))
+    RATE_LIMIT: float = float(os.getenv("RATE_LIMIT", "0"))
+    RATE_LIMITS: str = os.getenv("RATE_LIMITS", "")
+    RATE_LIMIT_BURST: float = float(os.getenv("RATE_LIMIT_BURST", "1"))
+    RATE_LIMIT_PATH: str = os.getenv("RATE_LIMIT_PATH", "")
+    CACHE_ENABLED: bool = os.getenv("CACHE_ENABLED", "false").lower() == "true"
+    CACHE_MAX_ENTRIES: int = int(os.getenv("CACHE_MAX_ENTRIES", "1024"))
+    CACHE_TTL: float = float(os.getenv("CACHE_TTL", "30"))
+    STREAM_CHUNK_SIZE: int = int(os.getenv("STREAM_CHUNK_SIZE", "65536"))
+    STREAM_BATCH_SIZE: int = int(os.getenv("STREAM_BATCH_SIZE", "100"))
+    RESILIENCE_ENABLED: bool = os.getenv("RESILIENCE_ENABLED", "false").lower() == "true"
+    HEDGE_ENABLED: bool = os.getenv("HEDGE_ENABLED", "true").lower() == "true"
+    HEDGE_PERCENTILE: float = float(os.getenv("HEDGE_PERCENTILE", "95"))
+    RETRY_BUDGET_RATIO: float = float(os.getenv("RETRY_BUDGET_RATIO", "0.1"))
+    CIRCUIT_FAILURE_THRESHOLD: int = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+    CIRCUIT_RESET_TIMEOUT: float = float(os.getenv("CIRCUIT_RESET_TIMEOUT", "30"))
+    PET_POOL_SIZE: int = int(os.getenv("PET_POOL_SIZE", "20"))
+    PET_POOL_REFILL: int = int(os.getenv("PET_POOL_REFILL", "10"))
+    CASSETTE_MODE: str = os.getenv("CASSETTE_MODE", "off").lower()
+    CASSETTE_PATH: str = os.getenv("CASSETTE_PATH", "cassettes/api.cassette")
+    UPLOAD_CHUNK_SIZE: int = int(os.getenv("UPLOAD_CHUNK_SIZE", "65536"))
+    UPLOAD_MAX_BYTES_PER_SECOND: float = float(os.getenv("UPLOAD_MAX_BYTES_PER_SECOND", "0"))
+    BENCHMARK_THRESHOLD: float = float(os.getenv("BENCHMARK_THRESHOLD", "0.3"))
+    STARTUP_THRESHOLD: float = float(os.getenv("STARTUP_THRESHOLD", "0.3"))
+    STARTUP_FLOOR: float = float(os.getenv("STARTUP_FLOOR", "0.1"))
+    DURATION_SCHEDULING: bool = os.getenv("DURATION_SCHEDULING", "false").lower() == "true"
+    DURATION_HISTORY_PATH: str = os.getenv("DURATION_HISTORY_PATH", ".test_durations.json")
+    DURATION_DEFAULT: float = float(os.getenv("DURATION_DEFAULT", "0.1"))
+    TRANSPORT: str = os.getenv("TRANSPORT", "requests").lower()
+    HTTP2_ENABLED: bool = os.getenv("HTTP2_ENABLED", "true").lower() == "true"
+    HTTP2_PRIOR_KNOWLEDGE: bool = os.getenv("HTTP2_PRIOR_KNOWLEDGE", "false").lower() == "true"
+    SESSION_POOL_MODE: str = os.getenv("SESSION_POOL_MODE", "thread_local").lower()
+    SESSION_POOL_SIZE: int = int(os.getenv("SESSION_POOL_SIZE", "8"))
+    SESSION_POOL_TIMEOUT: float = float(os.getenv("SESSION_POOL_TIMEOUT", "30"))
+    POOL_CONNECTIONS: int = int(os.getenv("POOL_CONNECTIONS", "10"))
+    POOL_MAXSIZE_PER_HOST: int = int(os.getenv("POOL_MAXSIZE_PER_HOST", "32"))
+    POOL_BLOCK: bool = os.getenv("POOL_BLOCK", "false").lower() == "true"
+    BULK_MAX_WORKERS: int = int(os.getenv("BULK_MAX_WORKERS", "32"))
+    CONSISTENCY_TIMEOUT: float = float(os.getenv("CONSISTENCY_TIMEOUT", "10"))
+    CONSISTENCY_INITIAL_DELAY: float = float(os.getenv("CONSISTENCY_INITIAL_DELAY", "0.05"))
+    CONSISTENCY_MAX_DELAY: float = float(os.getenv("CONSISTENCY_MAX_DELAY", "1"))
+    CONSISTENCY_BACKOFF: float = float(os.getenv("CONSISTENCY_BACKOFF", "2"))
+    CONSISTENCY_JITTER: float = float(os.getenv("CONSISTENCY_JITTER", "0.5"))
+    SCENARIO_MAX_WORKERS: int = int(os.getenv("SCENARIO_MAX_WORKERS", "16"))
+    FUZZ_CASES: int = int(os.getenv("FUZZ_CASES", "2000"))
+    FUZZ_BATCH_SIZE: int = int(os.getenv("FUZZ_BATCH_SIZE", "200"))
+    FUZZ_CONCURRENCY: int = int(os.getenv("FUZZ_CONCURRENCY", "4"))
+    FUZZ_INVALID_RATIO: float = float(os.getenv("FUZZ_INVALID_RATIO", "0.5"))
+    ASYNC_MAX_CONCURRENCY: int = int(os.getenv("ASYNC_MAX_CONCURRENCY", "50"))
+    ASYNC_MAX_CONNECTIONS: int = int(os.getenv("ASYNC_MAX_CONNECTIONS", "100"))
+    ASYNC_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("ASYNC_MAX_KEEPALIVE_CONNECTIONS", "50"))
         
     @classmethod
     def get_base_url(cls) -> str:
         return cls.BASE_URL
-    
+
+    @classmethod
+    def get_targets(cls) -> Dict[str, str]:
+        """Target names mapped to base URLs; just ``{"default": BASE_URL}`` unless BASE_URLS is set."""
+        return parse_targets(cls.BASE_URLS) or {"default": cls.BASE_URL}
+
+
+def parse_targets(text: str) -> Dict[str, str]:
+    """Parse ``"eu=https://eu.example.com/v2, https://us.example.com/v2, staging"``.
+
+    Unnamed URLs are named after their host. A bare name has no URL and is
+    only usable with LOCAL_PETSTORE, which starts a stand-in per target.
+    """
+    targets: Dict[str, str] = {}
+    for item in filter(None, (part.strip() for part in text.split(","))):
+        name, separator, url = item.partition("=")
+        if not separator:
+            name, url = (urlsplit(item).netloc, item) if "://" in item else (item, "")
+        name, url = name.strip(), url.strip()
+        if not name or name in targets:
+            raise ValueError(f"Invalid or duplicate target {item!r} in BASE_URLS")
+        targets[name] = url
+    return targets
+
+
 settings = Settings()
@@ -1,13 +1,32 @@
+from __future__ import annotations
+
 import pytest
 import logging
 import random
-import threading
-from typing import Generator
+from typing import TYPE_CHECKING, AsyncGenerator, Dict, Generator
+
+from api_tests.config.settings import settings
+from api_tests.utils.log_queue import start_queue_logging
+
+# Clients, models and the stand-in server are imported by the fixtures that
+# need them, so narrowly selected runs and --collect-only skip their import cost.
+if TYPE_CHECKING:
+    from api_tests.api.async_pet_client import AsyncPetClient
+    from api_tests.api.pet_client import PetClient
+    from api_tests.models.pet import Pet
+    from api_tests.server.http_server import PetStoreServer
+    from api_tests.utils.pet_pool import PetIdAllocator, PetPool
+
+pytest_plugins = [
+    "api_tests.plugins.request_timings",
+    "api_tests.plugins.exchange_capture",
+    "api_tests.plugins.duration_scheduling",
+    "api_tests.plugins.targets",
+]
 
-from api_tests.api.pet_client import PetClient
-from api_tests.models.pet import Pet, Category, Tag
+TARGETS = settings.get_targets()
 
-logging.basicConfig(
+_log_listener = start_queue_logging(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
@@ -15,17 +34,130 @@ logger = logging.getLogger(__name__)
 
 
 @pytest.fixture(scope="session")
-def api_client() -> Generator[PetClient, None, None]:
-    client = PetClient()
+def petstore_server() -> Generator[PetStoreServer, None, None]:
+    from api_tests.server.http_server import PetStoreServer
+
+    server = PetStoreServer(port=settings.LOCAL_PETSTORE_PORT).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def petstore(petstore_server: PetStoreServer) -> Generator[PetStoreServer, None, None]:
+    yield petstore_server
+    petstore_server.faults.reset()
+
+
+@pytest.fixture(scope="session")
+def target_servers(petstore_server: PetStoreServer) -> Generator[Dict[str, PetStoreServer], None, None]:
+    """A stand-in per target; the first target uses the shared ``petstore_server``."""
+    from api_tests.server.http_server import PetStoreServer
+
+    servers = {name: petstore_server if index == 0 else PetStoreServer().start()
+               for index, name in enumerate(TARGETS)}
+    yield servers
+    for server in servers.values():
+        if server is not petstore_server:
+            server.stop()
+
+
+def pytest_generate_tests(metafunc):
+    # With several targets, everything built on ``target`` (base_url, api_client,
+    # pet_pool, ...) is instantiated once per target and the tests run against each.
+    if "target" in metafunc.fixturenames and len(TARGETS) > 1:
+        metafunc.parametrize("target", list(TARGETS), indirect=True, scope="session")
+
+
+@pytest.fixture(scope="session")
+def target(request) -> str:
+    return getattr(request, "param", next(iter(TARGETS)))
+
+
+@pytest.fixture(scope="session")
+def base_url(request, target: str) -> str:
+    from api_tests.plugins.targets import register_target
+
+    if settings.LOCAL_PETSTORE:
+        url = request.getfixturevalue("target_servers")[target].base_url
+    elif TARGETS[target]:
+        url = TARGETS[target]
+    else:
+        raise pytest.UsageError(f"Target {target!r} has no URL; name it as {target}=<url> in BASE_URLS")
+    register_target(request.config, target, url)
+    return url
+
+
+@pytest.fixture(scope="session")
+def api_client(base_url: str) -> Generator[PetClient, None, None]:
+    from api_tests.api.pet_client import PetClient
+
+    client = PetClient(base_url=base_url)
     yield client
     client.close()
 
 
+@pytest.fixture(scope="session")
+def local_api_client(petstore_server: PetStoreServer) -> Generator[PetClient, None, None]:
+    from api_tests.api.pet_client import PetClient
+
+    client = PetClient(base_url=petstore_server.base_url)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+async def async_api_client(base_url: str) -> AsyncGenerator[AsyncPetClient, None]:
+    from api_tests.api.async_pet_client import AsyncPetClient
+
+    client = AsyncPetClient(base_url=base_url)
+    yield client
+    await client.close()
+
+
+@pytest.fixture(scope="session")
+def pet_id_allocator() -> PetIdAllocator:
+    from api_tests.utils.pet_pool import PetIdAllocator
+
+    return PetIdAllocator.for_worker()
+
+
+@pytest.fixture(scope="session")
+def pet_pool(api_client: PetClient, pet_id_allocator: PetIdAllocator) -> Generator[PetPool, None, None]:
+    from api_tests.utils.pet_pool import PetPool
+
+    pool = PetPool(
+        api_client,
+        pet_id_allocator,
+        size=settings.PET_POOL_SIZE,
+        refill_size=settings.PET_POOL_REFILL
+    ).start()
+    yield pool
+    pool.stop()
+    logger.info("Pet pool stats: %s", pool.stats())
+
+
+@pytest.fixture
+def existing_pet(request, pet_pool: PetPool) -> Generator[Pet, None, None]:
+    """A pooled pet that already exists on the server; tests must not modify it."""
+    failed_before = request.session.testsfailed
+    pet = pet_pool.acquire()
+    yield pet
+    pet_pool.release(pet, dirty=request.session.testsfailed > failed_before)
+
+
 @pytest.fixture
-def sample_pet():
-    thread_id = threading.get_ident()
-    random_id = random.randint(100000, 999999)
-    unique_id = int(f"{thread_id % 10000}{random_id % 10000}")
+def fresh_pet(pet_pool: PetPool) -> Generator[Pet, None, None]:
+    """An existing pet owned by the test, which may update or delete it."""
+    pet = pet_pool.take_fresh()
+    yield pet
+    pet_pool.discard(pet)
+
+
+@pytest.fixture
+def sample_pet(pet_id_allocator: PetIdAllocator) -> Pet:
+    from api_tests.models.pet import Category, Pet, Tag
+
+    unique_id = pet_id_allocator.next_id()
     
     return Pet(
         id=unique_id,
@@ -39,7 +171,7 @@ def sample_pet():
 
 @pytest.fixture(autouse=True)
 def log_test_start(request):
-    logger.info(f"Starting test: {request.node.name}")
+    logger.info("Starting test: %s", request.node.name)
 
 
 def pytest_configure(config):
@@ -49,3 +181,7 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "regression: Regression tests"
     )
+
+
+def pytest_unconfigure(config):
+    _log_listener.stop()
@@ -0,0 +1,21 @@
+from typing import TYPE_CHECKING
+
+from api_tests.utils.lazy import lazy_exports
+
+_EXPORTS = {
+    "Case": ".schema",
+    "SchemaFuzzer": ".schema",
+    "compile_schema": ".schema",
+    "FuzzFailure": ".runner",
+    "FuzzReport": ".runner",
+    "FuzzRunner": ".runner",
+    "pet_fuzzer": ".runner",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .schema import Case, SchemaFuzzer, compile_schema
+    from .runner import FuzzFailure, FuzzReport, FuzzRunner, pet_fuzzer
@@ -0,0 +1,60 @@
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from pathlib import Path
+
+from api_tests.api.async_pet_client import AsyncPetClient
+from api_tests.config.settings import settings
+from api_tests.fuzz.runner import FuzzReport, FuzzRunner, pet_fuzzer
+from api_tests.server.http_server import PetStoreServer
+
+
+async def fuzz(base_url: str, args: argparse.Namespace) -> FuzzReport:
+    client = AsyncPetClient(base_url=base_url)
+    try:
+        runner = FuzzRunner(
+            client,
+            pet_fuzzer(args.seed),
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+            invalid_ratio=args.invalid_ratio
+        )
+        return await runner.run(args.cases)
+    finally:
+        await client.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Fuzz the pet endpoints with payloads derived from the Pet schema")
+    parser.add_argument("--cases", type=int, default=settings.FUZZ_CASES, help="Payloads to submit")
+    parser.add_argument("--batch-size", type=int, default=settings.FUZZ_BATCH_SIZE, help="Payloads per concurrent batch")
+    parser.add_argument("--concurrency", type=int, default=settings.FUZZ_CONCURRENCY, help="Requests in flight")
+    parser.add_argument("--invalid-ratio", type=float, default=settings.FUZZ_INVALID_RATIO,
+                        help="Fraction of payloads that violate the schema")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed, for reproducible runs")
+    parser.add_argument("--base-url", default=None, help="Target base URL (defaults to settings.BASE_URL)")
+    parser.add_argument("--local", action="store_true", help="Run against an in-process Petstore stand-in")
+    parser.add_argument("--output", default="reports/fuzz_report.json", help="JSON report path")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    server = PetStoreServer().start() if args.local else None
+    try:
+        report = asyncio.run(fuzz(server.base_url if server else args.base_url or settings.BASE_URL, args))
+    finally:
+        if server:
+            server.stop()
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report.to_dict(), indent=2, default=str))
+    print(report.format_table())
+    print(f"JSON report written to {output}")
+    return 0 if report.failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+import asyncio
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import httpx
+from pydantic import ValidationError
+
+from api_tests.api.async_pet_client import AsyncPetClient
+from api_tests.config.settings import settings
+from api_tests.fuzz.schema import Case, SchemaFuzzer
+from api_tests.fuzz.shrink import shrink
+from api_tests.models.api_response import ApiResponse
+from api_tests.models.pet import Pet
+from api_tests.utils.pet_pool import PetIdAllocator
+
+logger = logging.getLogger(__name__)
+
+REJECTED_STATUSES = frozenset({400, 405})
+
+
+def pet_fuzzer(seed: Optional[int] = None, ids: Optional[PetIdAllocator] = None) -> SchemaFuzzer:
+    """SchemaFuzzer for Pet whose top-level ids come from ``ids``, so valid cases never overwrite other pets."""
+    ids = ids or PetIdAllocator.for_worker()
+    return SchemaFuzzer(Pet, seed=seed, overrides={"id": lambda _: ids.next_id()})
+
+
+@dataclass
+class FuzzFailure:
+    case: Case
+    status: Optional[int]
+    reason: str
+    shrunk: Any = None
+    shrunk_reason: Optional[str] = None
+    shrink_steps: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "valid": self.case.valid,
+            "mutation": self.case.mutation,
+            "path": self.case.path,
+            "status": self.status,
+            "reason": self.reason,
+            "payload": self.case.payload,
+            "shrunk": self.shrunk,
+            "shrunk_reason": self.shrunk_reason,
+            "shrink_steps": self.shrink_steps,
+        }
+
+
+@dataclass
+class FuzzReport:
+    cases: int = 0
+    valid: int = 0
+    invalid: int = 0
+    failed: int = 0
+    statuses: Counter = field(default_factory=Counter)
+    mutations: Counter = field(default_factory=Counter)
+    failures: List[FuzzFailure] = field(default_factory=list)
+    elapsed: float = 0.0
+    generation_seconds: float = 0.0
+    shrink_seconds: float = 0.0
+
+    @property
+    def cases_per_sec(self) -> float:
+        return self.cases / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def generated_per_sec(self) -> float:
+        return self.cases / self.generation_seconds if self.generation_seconds else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "cases": self.cases,
+            "valid": self.valid,
+            "invalid": self.invalid,
+            "failed": self.failed,
+            "elapsed_s": self.elapsed,
+            "cases_per_sec": self.cases_per_sec,
+            "generation_s": self.generation_seconds,
+            "generated_per_sec": self.generated_per_sec,
+            "shrink_s": self.shrink_seconds,
+            "statuses": {str(status): count for status, count in sorted(self.statuses.items(), key=str)},
+            "mutations": dict(self.mutations),
+            "failures": [failure.to_dict() for failure in self.failures],
+        }
+
+    def format_table(self) -> str:
+        lines = [
+            f"cases: {self.cases} ({self.valid} valid, {self.invalid} invalid), failed: {self.failed}",
+            f"throughput: {self.cases_per_sec:,.0f} cases/s over {self.elapsed:.1f}s "
+            f"(generator alone: {self.generated_per_sec:,.0f} cases/s)",
+            f"statuses: {dict(self.statuses)}",
+        ]
+        for failure in self.failures:
+            lines.append(f"- {failure.reason} [{failure.case.mutation or 'valid'} {failure.case.path}]")
+            lines.append(f"  minimal reproducer: {failure.shrunk!r} ({failure.shrunk_reason})")
+        return "\n".join(lines)
+
+
+class FuzzRunner:
+    """Posts generated Pet payloads in concurrent batches and checks each response.
+
+    Valid payloads must be stored (200 with a Pet echoing the payload);
+    invalid ones must be rejected with 400 or 405 and an ApiResponse body.
+    At most ``concurrency`` requests of a batch are in flight at once.
+    Up to ``max_failures`` failing cases are shrunk to minimal reproducers;
+    shrinking time is kept out of ``cases_per_sec``.
+    """
+
+    def __init__(
+        self,
+        client: AsyncPetClient,
+        fuzzer: SchemaFuzzer,
+        batch_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        invalid_ratio: Optional[float] = None,
+        max_failures: int = 20,
+        max_shrink_attempts: int = 200
+    ):
+        self.client = client
+        self.fuzzer = fuzzer
+        self.batch_size = batch_size or settings.FUZZ_BATCH_SIZE
+        self.concurrency = concurrency or settings.FUZZ_CONCURRENCY
+        self.invalid_ratio = settings.FUZZ_INVALID_RATIO if invalid_ratio is None else invalid_ratio
+        self.max_failures = max_failures
+        self.max_shrink_attempts = max_shrink_attempts
+
+    async def submit(self, payload: Any, semaphore: Optional[asyncio.Semaphore] = None) -> httpx.Response:
+        if semaphore is None:
+            return await self.client.post("pet", json_data=payload)
+        async with semaphore:
+            return await self.client.post("pet", json_data=payload)
+
+    def verdict(self, payload: Any, response: httpx.Response) -> Optional[str]:
+        """Why ``response`` is wrong for ``payload``; None when it is right."""
+        if self.fuzzer.is_valid(payload):
+            if response.status_code != 200:
+                return f"valid payload rejected with {response.status_code}"
+            try:
+                pet = Pet.model_validate(response.json())
+            except (ValueError, ValidationError):
+                return "valid payload answered with a body that is not a Pet"
+            if pet.name != payload["name"] or pet.photoUrls != payload["photoUrls"]:
+                return "stored pet does not match the payload"
+            return None
+        if response.status_code not in REJECTED_STATUSES:
+            return f"invalid payload answered with {response.status_code}"
+        try:
+            ApiResponse.model_validate(response.json())
+        except (ValueError, ValidationError):
+            return "rejection body is not an ApiResponse"
+        return None
+
+    async def check(self, payload: Any) -> Optional[str]:
+        try:
+            return self.verdict(payload, await self.submit(payload))
+        except httpx.HTTPError as e:
+            return f"{type(e).__name__}: {e}"
+
+    async def run(self, count: Optional[int] = None) -> FuzzReport:
+        count = settings.FUZZ_CASES if count is None else count
+        report = FuzzReport()
+        failing: List[FuzzFailure] = []
+        # httpx's pool rescans every queued request on each completion, so
+        # keep the queue short rather than handing it a whole batch at once.
+        semaphore = asyncio.Semaphore(self.concurrency)
+        started = time.perf_counter()
+        while report.cases < count:
+            generation_started = time.perf_counter()
+            cases = list(self.fuzzer.cases(min(self.batch_size, count - report.cases), self.invalid_ratio))
+            report.generation_seconds += time.perf_counter() - generation_started
+
+            outcomes = await asyncio.gather(
+                *(self.submit(case.payload, semaphore) for case in cases),
+                return_exceptions=True
+            )
+            for case, outcome in zip(cases, outcomes):
+                report.cases += 1
+                if case.valid:
+                    report.valid += 1
+                else:
+                    report.invalid += 1
+                    report.mutations[case.mutation] += 1
+                if isinstance(outcome, BaseException):
+                    if not isinstance(outcome, httpx.HTTPError):
+                        raise outcome
+                    report.statuses[type(outcome).__name__] += 1
+                    reason, status = f"{type(outcome).__name__}: {outcome}", None
+                else:
+                    report.statuses[outcome.status_code] += 1
+                    reason, status = self.verdict(case.payload, outcome), outcome.status_code
+                if reason is not None:
+                    report.failed += 1
+                    if len(failing) < self.max_failures:
+                        failing.append(FuzzFailure(case=case, status=status, reason=reason))
+        report.elapsed = time.perf_counter() - started
+
+        shrink_started = time.perf_counter()
+        for failure in failing:
+            failure.shrunk, failure.shrink_steps = await shrink(
+                failure.case.payload, self._still_fails, self.max_shrink_attempts
+            )
+            failure.shrunk_reason = await self.check(failure.shrunk)
+        report.failures = failing
+        report.shrink_seconds = time.perf_counter() - shrink_started
+
+        logger.info(
+            "Fuzzed %d cases in %.2fs (%.0f cases/s), %d failed",
+            report.cases, report.elapsed, report.cases_per_sec, report.failed
+        )
+        return report
+
+    async def _still_fails(self, payload: Any) -> bool:
+        return await self.check(payload) is not None
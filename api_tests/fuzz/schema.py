@@ -0,0 +1,224 @@
+import copy
+import random
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from api_tests.models.adapters import json_schema
+
+Path = Tuple[Any, ...]
+Override = Callable[[random.Random], Any]
+
+INT64_MAX = 2 ** 63 - 1
+INTEGERS = (0, 1, -1, 7, 255, 2 ** 31 - 1, -2 ** 31, INT64_MAX, -INT64_MAX - 1)
+STRINGS = (
+    "", " ", "a", "doggie", "Ünïcödé", "ペット", "🐶🐱", "a" * 256, "' OR '1'='1", "<script>", "%s%n",
+    "line\nbreak", "tab\tand\\backslash", "\"quoted\"", "\u0000nul", "https://example.com/photo.jpg",
+)
+ALPHABET = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_ ."
+WRONG_TYPE_VALUES = {
+    "integer": 7,
+    "number": 1.5,
+    "string": "not-the-right-type",
+    "boolean": True,
+    "array": [],
+    "object": {},
+    "null": None,
+}
+
+
+@dataclass
+class Case:
+    """One generated payload; invalid cases name the mutation and where it was applied."""
+
+    payload: Any
+    valid: bool
+    mutation: Optional[str] = None
+    path: str = ""
+
+
+@dataclass
+class Node:
+    """A JSON schema compiled into something cheap to generate from and validate against."""
+
+    types: FrozenSet[str]
+    properties: Dict[str, "Node"] = field(default_factory=dict)
+    required: FrozenSet[str] = frozenset()
+    items: Optional["Node"] = None
+    kinds: Tuple[str, ...] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.kinds = tuple(sorted(kind for kind in self.types if kind != "null"))
+
+    def is_valid(self, value: Any) -> bool:
+        if value is None:
+            return "null" in self.types
+        if isinstance(value, bool):
+            return "boolean" in self.types
+        if isinstance(value, int):
+            return "integer" in self.types or "number" in self.types
+        if isinstance(value, float):
+            return "number" in self.types
+        if isinstance(value, str):
+            return "string" in self.types
+        if isinstance(value, list):
+            return "array" in self.types and all(self.items.is_valid(item) for item in value)
+        if isinstance(value, dict):
+            return (
+                "object" in self.types
+                and self.required.issubset(value)
+                and all(key not in value or node.is_valid(value[key]) for key, node in self.properties.items())
+            )
+        return False
+
+
+def compile_schema(schema: Dict[str, Any], definitions: Optional[Dict[str, Any]] = None) -> Node:
+    """Compile the subset of JSON schema that pydantic emits for these models."""
+    definitions = schema.get("$defs", definitions or {})
+    if "$ref" in schema:
+        return compile_schema(definitions[schema["$ref"].rsplit("/", 1)[-1]], definitions)
+    if "anyOf" in schema:
+        branches = [compile_schema(branch, definitions) for branch in schema["anyOf"]]
+        merged = Node(types=frozenset().union(*(branch.types for branch in branches)))
+        for branch in branches:
+            merged.properties = merged.properties or branch.properties
+            merged.required = merged.required or branch.required
+            merged.items = merged.items or branch.items
+        return merged
+
+    node = Node(types=frozenset([schema["type"]]) if "type" in schema else frozenset(WRONG_TYPE_VALUES))
+    if "properties" in schema:
+        node.properties = {name: compile_schema(value, definitions) for name, value in schema["properties"].items()}
+        node.required = frozenset(schema.get("required", ()))
+    if "items" in schema:
+        node.items = compile_schema(schema["items"], definitions)
+    return node
+
+
+def format_path(path: Path) -> str:
+    text = "".join(f"[{part}]" if isinstance(part, int) else f".{part}" for part in path).lstrip(".")
+    return text or "<body>"
+
+
+class SchemaFuzzer:
+    """Valid and invalid payloads derived from a pydantic model's JSON schema.
+
+    The schema is compiled once; generation is plain recursion over the
+    compiled nodes with one ``random.Random``, so it stays far ahead of the
+    HTTP side. ``overrides`` maps dotted paths (``"id"``, ``"tags[].id"``) to
+    generators for values that must come from somewhere specific, such as pet
+    ids from a reserved range. Invalid cases are valid payloads with exactly
+    one schema violation: a missing or null required property, a value of
+    the wrong type, or a body that is not an object.
+    """
+
+    def __init__(
+        self,
+        model: Type[BaseModel],
+        seed: Optional[int] = None,
+        overrides: Optional[Dict[str, Override]] = None,
+        optional_ratio: float = 0.7,
+        max_items: int = 4
+    ):
+        self.model = model
+        self.root = compile_schema(json_schema(model))
+        self.random = random.Random(seed)
+        self.overrides = overrides or {}
+        self.optional_ratio = optional_ratio
+        self.max_items = max_items
+
+    def is_valid(self, payload: Any) -> bool:
+        return self.root.is_valid(payload)
+
+    def valid(self) -> Any:
+        return self._generate(self.root, "")
+
+    def invalid(self) -> Case:
+        payload = self.valid()
+        sites = list(self._sites(self.root, payload, ()))
+        node, value, path, mutation = sites[self.random.randrange(len(sites))]
+        mutated = self._mutate(node, value, mutation)
+        if not path:
+            return Case(payload=mutated, valid=False, mutation=mutation, path=format_path(path))
+        parent = payload
+        for part in path[:-1]:
+            parent = parent[part]
+        if mutated is _MISSING:
+            del parent[path[-1]]
+        else:
+            parent[path[-1]] = mutated
+        return Case(payload=payload, valid=False, mutation=mutation, path=format_path(path))
+
+    def case(self, invalid_ratio: float = 0.5) -> Case:
+        if self.random.random() < invalid_ratio:
+            return self.invalid()
+        return Case(payload=self.valid(), valid=True)
+
+    def cases(self, count: int, invalid_ratio: float = 0.5) -> Iterator[Case]:
+        for _ in range(count):
+            yield self.case(invalid_ratio)
+
+    def _generate(self, node: Node, path: str) -> Any:
+        override = self.overrides.get(path)
+        if override is not None:
+            return override(self.random)
+        rng = self.random
+        if not node.kinds:
+            return None
+        kind = node.kinds[0] if len(node.kinds) == 1 else rng.choice(node.kinds)
+        if kind == "object":
+            payload = {}
+            for name, child in node.properties.items():
+                if name in node.required:
+                    payload[name] = self._generate(child, f"{path}.{name}" if path else name)
+                elif rng.random() < self.optional_ratio:
+                    nullable = "null" in child.types and rng.random() < 0.1
+                    payload[name] = None if nullable else self._generate(child, f"{path}.{name}" if path else name)
+            return payload
+        if kind == "array":
+            return [self._generate(node.items, f"{path}[]") for _ in range(rng.randint(0, self.max_items))]
+        if kind == "string":
+            if rng.random() < 0.5:
+                return rng.choice(STRINGS)
+            return "".join(rng.choices(ALPHABET, k=rng.randint(1, 24)))
+        if kind == "integer":
+            if rng.random() < 0.3:
+                return rng.choice(INTEGERS)
+            return rng.randint(-10 ** 6, 10 ** 12)
+        if kind == "number":
+            return rng.uniform(-1e6, 1e6)
+        if kind == "boolean":
+            return rng.random() < 0.5
+        return None
+
+    def _sites(self, node: Node, value: Any, path: Path) -> Iterator[Tuple[Node, Any, Path, str]]:
+        """Every place in ``value`` where one mutation makes it invalid."""
+        if _wrong_types(node):
+            yield node, value, path, "wrong_type"
+        if isinstance(value, dict):
+            for name, child in node.properties.items():
+                if name in node.required:
+                    yield child, value.get(name), path + (name,), "missing_required"
+                    if "null" not in child.types:
+                        yield child, value.get(name), path + (name,), "null_required"
+                if name in value and value[name] is not None:
+                    yield from self._sites(child, value[name], path + (name,))
+        elif isinstance(value, list) and node.items is not None:
+            for index, item in enumerate(value):
+                yield from self._sites(node.items, item, path + (index,))
+
+    def _mutate(self, node: Node, value: Any, mutation: str) -> Any:
+        if mutation == "missing_required":
+            return _MISSING
+        if mutation == "null_required":
+            return None
+        return copy.copy(WRONG_TYPE_VALUES[self.random.choice(_wrong_types(node))])
+
+
+_MISSING = object()
+
+
+def _wrong_types(node: Node) -> List[str]:
+    return [kind for kind in WRONG_TYPE_VALUES
+            if kind not in node.types and not (kind == "integer" and "number" in node.types)]
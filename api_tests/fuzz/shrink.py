@@ -0,0 +1,54 @@
+from typing import Any, Awaitable, Callable, Iterator, Tuple
+
+
+def candidates(value: Any) -> Iterator[Any]:
+    """Strictly smaller variants of a JSON value, most aggressive first."""
+    if isinstance(value, dict):
+        for key in value:
+            yield {name: item for name, item in value.items() if name != key}
+        for key, item in value.items():
+            for smaller in candidates(item):
+                yield {**value, key: smaller}
+    elif isinstance(value, list):
+        if value:
+            yield []
+        for index in range(len(value)):
+            yield value[:index] + value[index + 1:]
+        for index, item in enumerate(value):
+            for smaller in candidates(item):
+                yield value[:index] + [smaller] + value[index + 1:]
+    elif isinstance(value, bool):
+        return
+    elif isinstance(value, int):
+        if value != 0:
+            yield 0
+        if abs(value) > 1:
+            yield value // 2
+    elif isinstance(value, float):
+        if value != 0:
+            yield 0.0
+    elif isinstance(value, str):
+        if value:
+            yield ""
+        if len(value) > 1:
+            yield value[:len(value) // 2]
+
+
+async def shrink(value: Any, fails: Callable[[Any], Awaitable[bool]], max_attempts: int = 200) -> Tuple[Any, int]:
+    """Greedily replace ``value`` by smaller candidates that still fail.
+
+    Returns the smallest failing value found and the number of accepted
+    shrink steps. ``max_attempts`` bounds the requests spent on one case.
+    """
+    attempts = steps = 0
+    improved = True
+    while improved and attempts < max_attempts:
+        improved = False
+        for candidate in candidates(value):
+            attempts += 1
+            if await fails(candidate):
+                value, steps, improved = candidate, steps + 1, True
+                break
+            if attempts >= max_attempts:
+                break
+    return value, steps
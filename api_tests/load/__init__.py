@@ -0,0 +1,27 @@
+from typing import TYPE_CHECKING
+
+from api_tests.utils.lazy import lazy_exports
+
+_EXPORTS = {
+    "LatencyHistogram": ".histogram",
+    "LoadConfig": ".runner",
+    "LoadReport": ".runner",
+    "LoadRunner": ".runner",
+    "MetricsRecorder": ".runner",
+    "LogRecord": ".replay",
+    "Replayer": ".replay",
+    "ReplayReport": ".replay",
+    "read_log": ".replay",
+    "SCENARIOS": ".scenarios",
+    "resolve_scenario": ".scenarios",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .histogram import LatencyHistogram
+    from .runner import LoadConfig, LoadReport, LoadRunner, MetricsRecorder
+    from .replay import LogRecord, Replayer, ReplayReport, read_log
+    from .scenarios import SCENARIOS, resolve_scenario
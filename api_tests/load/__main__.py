@@ -0,0 +1,51 @@
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+from api_tests.load.runner import CLOSED_LOOP, OPEN_LOOP, LoadConfig, LoadRunner
+from api_tests.server.http_server import PetStoreServer
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run a PetClient load or soak test")
+    parser.add_argument("--scenario", default="pet_lifecycle", help="Built-in scenario name or module:function")
+    parser.add_argument("--mode", choices=[CLOSED_LOOP, OPEN_LOOP], default=CLOSED_LOOP)
+    parser.add_argument("--users", type=int, default=10, help="Virtual users (closed loop) or worker threads (open loop)")
+    parser.add_argument("--rate", type=float, default=10.0, help="Scenario starts per second (open loop)")
+    parser.add_argument("--duration", type=float, default=30.0, help="Test duration in seconds")
+    parser.add_argument("--processes", type=int, default=1, help="Worker processes sharing the load")
+    parser.add_argument("--base-url", default=None, help="Target base URL (defaults to settings.BASE_URL)")
+    parser.add_argument("--local", action="store_true", help="Run against an in-process Petstore stand-in")
+    parser.add_argument("--output", default="reports/load_report.json", help="JSON report path")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    server = PetStoreServer().start() if args.local else None
+    try:
+        config = LoadConfig(
+            scenario=args.scenario,
+            mode=args.mode,
+            users=args.users,
+            rate=args.rate,
+            duration=args.duration,
+            processes=args.processes,
+            base_url=server.base_url if server else args.base_url
+        )
+        report = LoadRunner(config).run()
+    finally:
+        if server:
+            server.stop()
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report.to_dict(), indent=2))
+    print(report.format_table())
+    print(f"JSON report written to {output}")
+    return 0 if report.metrics.failed_iterations == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
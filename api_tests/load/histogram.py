@@ -0,0 +1,112 @@
+import math
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+class LatencyHistogram:
+    """HDR-style log-linear histogram of latencies recorded in microseconds.
+
+    Values are bucketed so that every recorded value is reproduced to within
+    ``significant_digits`` decimal digits, independent of magnitude, which
+    keeps memory bounded however long a soak test runs.
+    """
+
+    def __init__(self, significant_digits: int = 2):
+        if not 1 <= significant_digits <= 5:
+            raise ValueError("significant_digits must be between 1 and 5")
+        self.significant_digits = significant_digits
+        self._sub_bucket_bits = math.ceil(math.log2(2 * 10 ** significant_digits))
+        self._sub_bucket_half = 1 << (self._sub_bucket_bits - 1)
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def _index(self, value: int) -> int:
+        shift = max(0, value.bit_length() - self._sub_bucket_bits)
+        return shift * self._sub_bucket_half + (value >> shift)
+
+    def _bounds(self, index: int) -> Tuple[int, int]:
+        if index < 2 * self._sub_bucket_half:
+            return index, index
+        shift = index // self._sub_bucket_half - 1
+        sub_index = index - shift * self._sub_bucket_half
+        low = sub_index << shift
+        return low, low + (1 << shift) - 1
+
+    def record(self, value_us: int, count: int = 1) -> None:
+        value_us = max(0, int(value_us))
+        index = self._index(value_us)
+        self._counts[index] = self._counts.get(index, 0) + count
+        self.count += count
+        self.total += value_us * count
+        if self.min is None or value_us < self.min:
+            self.min = value_us
+        if self.max is None or value_us > self.max:
+            self.max = value_us
+
+    def record_seconds(self, seconds: float) -> None:
+        self.record(round(seconds * 1_000_000))
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        if other.significant_digits != self.significant_digits:
+            raise ValueError("Cannot merge histograms with different precision")
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+
+    def percentile(self, percent: float) -> int:
+        if not self.count:
+            return 0
+        rank = max(1, math.ceil(percent / 100 * self.count))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                return min(self._bounds(index)[1], self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def buckets(self) -> Iterator[Tuple[int, int, int]]:
+        for index in sorted(self._counts):
+            low, high = self._bounds(index)
+            yield low, high, self._counts[index]
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "min_ms": (self.min or 0) / 1000,
+            "mean_ms": self.mean / 1000,
+            "p50_ms": self.percentile(50) / 1000,
+            "p95_ms": self.percentile(95) / 1000,
+            "p99_ms": self.percentile(99) / 1000,
+            "max_ms": (self.max or 0) / 1000,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "significant_digits": self.significant_digits,
+            "counts": {str(index): count for index, count in self._counts.items()},
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        histogram = cls(data["significant_digits"])
+        histogram._counts = {int(index): count for index, count in data["counts"].items()}
+        histogram.count = data["count"]
+        histogram.total = data["total"]
+        histogram.min = data["min"]
+        histogram.max = data["max"]
+        return histogram
@@ -0,0 +1,364 @@
+import argparse
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+import requests
+
+from api_tests.api.base_client import BaseAPIClient
+from api_tests.config.settings import settings
+from api_tests.load.histogram import LatencyHistogram
+from api_tests.utils.endpoints import endpoint_template
+
+logger = logging.getLogger(__name__)
+
+FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+SUPPORTED_METHODS = ("GET", "POST", "PUT", "DELETE")
+
+
+class ReplayError(ValueError):
+    """A log line that cannot be replayed."""
+
+
+@dataclass
+class LogRecord:
+    """One request from an access log, with what the original server answered.
+
+    JSONL fields: ``timestamp`` (epoch seconds or ISO-8601), ``method``,
+    ``path`` (optionally with a query string), ``body`` (JSON) or ``form``
+    (form fields), ``status`` and ``latency_ms`` as recorded, and an optional
+    ``key`` for requests that must stay in order. Without ``key``, requests
+    touching the same pet id are kept in order.
+    """
+
+    line: int
+    timestamp: float
+    method: str
+    path: str
+    body: Any = None
+    form: Optional[Dict[str, str]] = None
+    status: Optional[int] = None
+    latency_ms: Optional[float] = None
+    key: Optional[str] = None
+
+    @property
+    def endpoint(self) -> str:
+        return f"{self.method} {endpoint_template(self.path)}"
+
+    @classmethod
+    def parse(cls, line: int, data: Dict[str, Any], strip_prefix: str = "") -> "LogRecord":
+        try:
+            method = data["method"].upper()
+            path = data["path"]
+            timestamp = data["timestamp"]
+        except (KeyError, AttributeError) as e:
+            raise ReplayError(f"Line {line}: missing or invalid field {e}") from None
+        if method not in SUPPORTED_METHODS:
+            raise ReplayError(f"Line {line}: unsupported method {method}")
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
+        path = path.lstrip("/")
+        prefix = strip_prefix.strip("/")
+        if prefix and (path == prefix or path.startswith(prefix + "/")):
+            path = path[len(prefix):].lstrip("/")
+        return cls(
+            line=line,
+            timestamp=float(timestamp),
+            method=method,
+            path=path,
+            body=data.get("body"),
+            form=data.get("form"),
+            status=data.get("status"),
+            latency_ms=data.get("latency_ms"),
+            key=data.get("key") or _default_key(path, data.get("body")),
+        )
+
+
+def _default_key(path: str, body: Any) -> Optional[str]:
+    segments = path.split("?", 1)[0].split("/")
+    if len(segments) > 1 and segments[0] == "pet" and segments[1].isdigit():
+        return f"pet/{segments[1]}"
+    if isinstance(body, dict) and body.get("id") is not None:
+        return f"pet/{body['id']}"
+    return None
+
+
+def read_log(path: str, strip_prefix: str = "") -> List[LogRecord]:
+    """Parse a JSONL access log into records sorted by timestamp (ties keep file order)."""
+    records = []
+    with open(path, encoding="utf-8") as log:
+        for number, line in enumerate(log, start=1):
+            if line.strip():
+                records.append(LogRecord.parse(number, json.loads(line), strip_prefix))
+    records.sort(key=lambda record: record.timestamp)
+    return records
+
+
+def send(client: BaseAPIClient, record: LogRecord) -> requests.Response:
+    """Re-issue ``record`` through the client's public request methods."""
+    if record.method == "GET":
+        return client.get(record.path, use_cache=False)
+    if record.method == "DELETE":
+        return client.delete(record.path)
+    if record.form is not None:
+        call = client.post if record.method == "POST" else client.put
+        return call(record.path, data=record.form, headers=FORM_HEADERS)
+    if record.method == "POST":
+        return client.post(record.path, json_data=record.body)
+    return client.put(record.path, json_data=record.body)
+
+
+@dataclass
+class Divergence:
+    line: int
+    endpoint: str
+    path: str
+    recorded: Optional[int]
+    replayed: Optional[str]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"line": self.line, "endpoint": self.endpoint, "path": self.path,
+                "recorded": self.recorded, "replayed": self.replayed}
+
+
+@dataclass
+class ReplayReport:
+    """Recorded versus replayed statuses and latencies, per endpoint template.
+
+    ``lag`` measures how late requests started against their scaled
+    schedule; a large lag means the replay could not keep the original
+    pace, usually because one key's requests queued behind each other.
+    """
+
+    speed: Optional[float]
+    workers: int
+    latency_tolerance: float = 0.5
+    requests: int = 0
+    elapsed: float = 0.0
+    recorded: Dict[str, LatencyHistogram] = field(default_factory=lambda: defaultdict(LatencyHistogram))
+    replayed: Dict[str, LatencyHistogram] = field(default_factory=lambda: defaultdict(LatencyHistogram))
+    transitions: Counter = field(default_factory=Counter)
+    divergences: List[Divergence] = field(default_factory=list)
+    divergent: int = 0
+    lag: LatencyHistogram = field(default_factory=LatencyHistogram)
+    max_examples: int = 50
+
+    def record(self, record: LogRecord, status: Optional[str], seconds: float, lag: float) -> None:
+        self.requests += 1
+        if record.latency_ms is not None:
+            self.recorded[record.endpoint].record(round(record.latency_ms * 1000))
+        self.replayed[record.endpoint].record_seconds(seconds)
+        self.lag.record_seconds(max(0.0, lag))
+        self.transitions[(record.endpoint, record.status, status)] += 1
+        if record.status is not None and str(record.status) != status:
+            self.divergent += 1
+            if len(self.divergences) < self.max_examples:
+                self.divergences.append(Divergence(record.line, record.endpoint, record.path, record.status, status))
+
+    def latency_divergences(self) -> Dict[str, Dict[str, Any]]:
+        """Per endpoint: recorded and replayed percentiles, their p95 ratio, and a verdict."""
+        result = {}
+        for endpoint in sorted(self.replayed):
+            replayed = self.replayed[endpoint].summary()
+            recorded = self.recorded[endpoint].summary() if endpoint in self.recorded else None
+            entry = {"replayed": replayed, "recorded": recorded, "p95_ratio": None, "verdict": "no recorded latency"}
+            if recorded and recorded["p95_ms"] > 0:
+                ratio = replayed["p95_ms"] / recorded["p95_ms"]
+                entry["p95_ratio"] = ratio
+                if ratio > 1 + self.latency_tolerance:
+                    entry["verdict"] = "slower"
+                elif ratio < 1 / (1 + self.latency_tolerance):
+                    entry["verdict"] = "faster"
+                else:
+                    entry["verdict"] = "ok"
+            result[endpoint] = entry
+        return result
+
+    @property
+    def diverged(self) -> bool:
+        return self.divergent > 0 or any(
+            entry["verdict"] == "slower" for entry in self.latency_divergences().values()
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "speed": self.speed if self.speed is not None else "max",
+            "workers": self.workers,
+            "requests": self.requests,
+            "elapsed_s": self.elapsed,
+            "throughput_rps": self.requests / self.elapsed if self.elapsed else 0.0,
+            "status_divergences": self.divergent,
+            "status_transitions": [
+                {"endpoint": endpoint, "recorded": recorded, "replayed": replayed, "count": count}
+                for (endpoint, recorded, replayed), count in sorted(self.transitions.items(), key=str)
+            ],
+            "examples": [divergence.to_dict() for divergence in self.divergences],
+            "latency": self.latency_divergences(),
+            "schedule_lag": self.lag.summary(),
+        }
+
+    def format_table(self) -> str:
+        header = (f"{'endpoint':<28}{'count':>7}{'status diff':>13}{'rec p50':>9}{'rep p50':>9}"
+                  f"{'rec p95':>9}{'rep p95':>9}  verdict")
+        lines = [header, "-" * len(header)]
+        mismatches = Counter()
+        for (endpoint, recorded, replayed), count in self.transitions.items():
+            if recorded is not None and str(recorded) != replayed:
+                mismatches[endpoint] += count
+        for endpoint, entry in self.latency_divergences().items():
+            recorded = entry["recorded"] or {}
+            replayed = entry["replayed"]
+            lines.append(
+                f"{endpoint:<28}{replayed['count']:>7}{mismatches[endpoint]:>13}"
+                f"{recorded.get('p50_ms', float('nan')):>9.2f}{replayed['p50_ms']:>9.2f}"
+                f"{recorded.get('p95_ms', float('nan')):>9.2f}{replayed['p95_ms']:>9.2f}  {entry['verdict']}"
+            )
+        for divergence in self.divergences[:10]:
+            lines.append(f"line {divergence.line}: {divergence.endpoint} ({divergence.path}) "
+                         f"recorded {divergence.recorded}, replayed {divergence.replayed}")
+        speed = "max speed" if self.speed is None else f"{self.speed:g}x speed"
+        lines.append(f"{self.requests} requests in {self.elapsed:.2f}s at {speed} with {self.workers} workers, "
+                     f"p99 schedule lag {self.lag.percentile(99) / 1000:.1f}ms")
+        return "\n".join(lines)
+
+
+class Replayer:
+    """Re-issues logged requests through one client at original, scaled or maximum speed.
+
+    ``speed`` divides the recorded gaps between requests (1.0 is the
+    original pace, 2.0 twice as fast); None sends as fast as the workers
+    allow. Requests with the same key always go to the same worker, which
+    sends them one at a time in log order, so a pet is never read before
+    the write that preceded it in the log. Unkeyed requests are spread
+    over the workers round-robin.
+    """
+
+    def __init__(
+        self,
+        client: BaseAPIClient,
+        speed: Optional[float] = 1.0,
+        workers: int = 8,
+        latency_tolerance: float = 0.5
+    ):
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive, or None for maximum speed")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.client = client
+        self.speed = speed
+        self.workers = workers
+        self.latency_tolerance = latency_tolerance
+
+    def run(self, records: Iterable[LogRecord]) -> ReplayReport:
+        records = list(records)
+        report = ReplayReport(self.speed, self.workers, self.latency_tolerance)
+        lock = threading.Lock()
+        queues: List["queue.Queue[Optional[Tuple[LogRecord, float]]]"] = [queue.Queue() for _ in range(self.workers)]
+
+        def work(inbox: "queue.Queue[Optional[Tuple[LogRecord, float]]]") -> None:
+            while True:
+                item = inbox.get()
+                if item is None:
+                    return
+                record, scheduled_at = item
+                started = time.perf_counter()
+                try:
+                    status = str(send(self.client, record).status_code)
+                except requests.RequestException as e:
+                    logger.debug("Replay of line %d failed: %s", record.line, e)
+                    status = "exception"
+                finished = time.perf_counter()
+                with lock:
+                    report.record(record, status, finished - started, started - scheduled_at)
+
+        threads = [threading.Thread(target=work, args=(inbox,), daemon=True) for inbox in queues]
+        for thread in threads:
+            thread.start()
+
+        started = time.perf_counter()
+        first = records[0].timestamp if records else 0.0
+        for index, (record, worker) in enumerate(self._assign(records)):
+            scheduled_at = started
+            if self.speed is not None:
+                scheduled_at += (record.timestamp - first) / self.speed
+                delay = scheduled_at - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            queues[worker].put((record, scheduled_at))
+        for inbox in queues:
+            inbox.put(None)
+        for thread in threads:
+            thread.join()
+        report.elapsed = time.perf_counter() - started
+        return report
+
+    def _assign(self, records: List[LogRecord]) -> Iterator[Tuple[LogRecord, int]]:
+        workers: Dict[str, int] = {}
+        unkeyed = 0
+        for record in records:
+            if record.key is None:
+                unkeyed += 1
+                yield record, unkeyed % self.workers
+            else:
+                yield record, workers.setdefault(record.key, len(workers) % self.workers)
+
+
+def parse_speed(value: str) -> Optional[float]:
+    if value == "max":
+        return None
+    if value == "original":
+        return 1.0
+    return float(value.rstrip("x"))
+
+
+def main() -> int:
+    from api_tests.api.pet_client import PetClient
+    from api_tests.server.http_server import PetStoreServer
+
+    parser = argparse.ArgumentParser(description="Replay a JSONL access log and report divergences")
+    parser.add_argument("log", help="JSONL access log")
+    parser.add_argument("--speed", default="original", type=parse_speed,
+                        help="'original', 'max' or a factor such as 2 (twice as fast)")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent senders; a key always uses one")
+    parser.add_argument("--strip-prefix", default=None,
+                        help="Path prefix to drop from logged paths (defaults to the base URL's path, e.g. /v2)")
+    parser.add_argument("--latency-tolerance", type=float, default=0.5,
+                        help="Allowed p95 slowdown against the recorded latency, as a fraction")
+    parser.add_argument("--base-url", default=None, help="Target base URL (defaults to settings.BASE_URL)")
+    parser.add_argument("--local", action="store_true", help="Replay against an in-process Petstore stand-in")
+    parser.add_argument("--output", default="reports/replay_report.json", help="JSON report path")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    strip_prefix = args.strip_prefix
+    if strip_prefix is None:
+        strip_prefix = urlsplit(args.base_url or settings.get_base_url()).path
+
+    records = read_log(args.log, strip_prefix)
+    server = PetStoreServer().start() if args.local else None
+    client = PetClient(base_url=server.base_url if server else args.base_url)
+    try:
+        report = Replayer(client, args.speed, args.workers, args.latency_tolerance).run(records)
+    finally:
+        client.close()
+        if server:
+            server.stop()
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report.to_dict(), indent=2))
+    print(report.format_table())
+    print(f"JSON report written to {output}")
+    return 1 if report.diverged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+import logging
+import multiprocessing
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Dict, List, Optional
+import requests
+
+from api_tests.api.instrumentation import RequestHook, RequestTiming
+from api_tests.api.pet_client import PetClient
+from api_tests.load.histogram import LatencyHistogram
+from api_tests.load.scenarios import resolve_scenario
+
+logger = logging.getLogger(__name__)
+
+CLOSED_LOOP = "closed"
+OPEN_LOOP = "open"
+
+
+@dataclass
+class LoadConfig:
+    scenario: str
+    mode: str = CLOSED_LOOP
+    users: int = 10
+    rate: float = 10.0
+    duration: float = 30.0
+    processes: int = 1
+    base_url: Optional[str] = None
+
+    def __post_init__(self):
+        if self.mode not in (CLOSED_LOOP, OPEN_LOOP):
+            raise ValueError(f"Unsupported mode: {self.mode}. Use '{CLOSED_LOOP}' or '{OPEN_LOOP}'")
+        if self.processes < 1 or self.users < 1:
+            raise ValueError("users and processes must be at least 1")
+
+
+class MetricsRecorder(RequestHook):
+    """Thread-safe per-endpoint latency histograms, status counts and a per-second timeline."""
+
+    def __init__(self, started_at: Optional[float] = None):
+        self.started_at = time.perf_counter() if started_at is None else started_at
+        self.endpoints: Dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self.statuses: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.iterations = LatencyHistogram()
+        self.failed_iterations = 0
+        self.timeline: Dict[int, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._lock = threading.Lock()
+
+    def _second(self, finished_at: float) -> int:
+        return int(finished_at - self.started_at)
+
+    def record_request(self, key: str, seconds: float, status: Optional[int], finished_at: float) -> None:
+        failed = status is None or status >= 500
+        with self._lock:
+            self.endpoints[key].record_seconds(seconds)
+            self.statuses[key][str(status) if status is not None else "exception"] += 1
+            bucket = self.timeline[self._second(finished_at)]
+            bucket["requests"] += 1
+            if failed:
+                self.errors[key] += 1
+                bucket["errors"] += 1
+
+    def on_request(self, timing: RequestTiming, response: Optional[requests.Response]) -> None:
+        self.record_request(f"{timing.method} {timing.endpoint}", timing.total, timing.status, time.perf_counter())
+
+    def record_iteration(self, seconds: float, failed: bool, finished_at: float) -> None:
+        with self._lock:
+            self.iterations.record_seconds(seconds)
+            bucket = self.timeline[self._second(finished_at)]
+            bucket["iterations"] += 1
+            if failed:
+                self.failed_iterations += 1
+                bucket["failed_iterations"] += 1
+
+    def merge(self, other: "MetricsRecorder") -> None:
+        for key, histogram in other.endpoints.items():
+            self.endpoints[key].merge(histogram)
+        for key, statuses in other.statuses.items():
+            for status, count in statuses.items():
+                self.statuses[key][status] += count
+        for key, count in other.errors.items():
+            self.errors[key] += count
+        self.iterations.merge(other.iterations)
+        self.failed_iterations += other.failed_iterations
+        for second, bucket in other.timeline.items():
+            for name, count in bucket.items():
+                self.timeline[second][name] += count
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "endpoints": {key: histogram.to_dict() for key, histogram in self.endpoints.items()},
+            "statuses": {key: dict(statuses) for key, statuses in self.statuses.items()},
+            "errors": dict(self.errors),
+            "iterations": self.iterations.to_dict(),
+            "failed_iterations": self.failed_iterations,
+            "timeline": {str(second): dict(bucket) for second, bucket in self.timeline.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MetricsRecorder":
+        recorder = cls()
+        for key, histogram in data["endpoints"].items():
+            recorder.endpoints[key] = LatencyHistogram.from_dict(histogram)
+        for key, statuses in data["statuses"].items():
+            recorder.statuses[key].update(statuses)
+        recorder.errors.update(data["errors"])
+        recorder.iterations = LatencyHistogram.from_dict(data["iterations"])
+        recorder.failed_iterations = data["failed_iterations"]
+        for second, bucket in data["timeline"].items():
+            recorder.timeline[int(second)].update(bucket)
+        return recorder
+
+
+@dataclass
+class LoadReport:
+    config: LoadConfig
+    elapsed: float
+    metrics: MetricsRecorder
+
+    def to_dict(self) -> Dict[str, Any]:
+        endpoints = {}
+        for key, histogram in sorted(self.metrics.endpoints.items()):
+            summary = histogram.summary()
+            summary["errors"] = self.metrics.errors.get(key, 0)
+            summary["error_rate"] = summary["errors"] / histogram.count if histogram.count else 0.0
+            summary["statuses"] = dict(self.metrics.statuses[key])
+            summary["histogram"] = [
+                {"from_us": low, "to_us": high, "count": count} for low, high, count in histogram.buckets()
+            ]
+            endpoints[key] = summary
+
+        requests_total = sum(histogram.count for histogram in self.metrics.endpoints.values())
+        iterations = self.metrics.iterations.summary()
+        iterations["failed"] = self.metrics.failed_iterations
+        return {
+            "config": asdict(self.config),
+            "elapsed_s": self.elapsed,
+            "requests": requests_total,
+            "throughput_rps": requests_total / self.elapsed if self.elapsed else 0.0,
+            "iterations": iterations,
+            "endpoints": endpoints,
+            "timeline": [
+                {"second": second, **self.metrics.timeline[second]} for second in sorted(self.metrics.timeline)
+            ],
+        }
+
+    def format_table(self) -> str:
+        header = f"{'endpoint':<32}{'count':>8}{'err%':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+        lines = [header, "-" * len(header)]
+        data = self.to_dict()
+        rows = list(data["endpoints"].items()) + [("scenario iteration", data["iterations"])]
+        for key, summary in rows:
+            errors = summary.get("errors", summary.get("failed", 0))
+            error_rate = errors / summary["count"] * 100 if summary["count"] else 0.0
+            lines.append(
+                f"{key:<32}{summary['count']:>8}{error_rate:>8.2f}{summary['p50_ms']:>10.2f}"
+                f"{summary['p95_ms']:>10.2f}{summary['p99_ms']:>10.2f}{summary['max_ms']:>10.2f}"
+            )
+        lines.append(f"throughput: {data['throughput_rps']:.1f} req/s over {data['elapsed_s']:.1f}s")
+        return "\n".join(lines)
+
+
+class LoadRunner:
+    """Drives a scenario closed-loop (fixed virtual users) or open-loop (fixed arrival rate)."""
+
+    def __init__(self, config: LoadConfig):
+        self.config = config
+
+    def run(self) -> LoadReport:
+        started = time.perf_counter()
+        if self.config.processes == 1:
+            metrics = _run_threads(self.config)
+        else:
+            metrics = MetricsRecorder()
+            with multiprocessing.Pool(self.config.processes) as pool:
+                for data in pool.map(_run_in_process, self._split(self.config)):
+                    metrics.merge(MetricsRecorder.from_dict(data))
+        return LoadReport(self.config, time.perf_counter() - started, metrics)
+
+    @staticmethod
+    def _split(config: LoadConfig) -> List[LoadConfig]:
+        parts = []
+        for index in range(config.processes):
+            users = config.users // config.processes + (1 if index < config.users % config.processes else 0)
+            parts.append(replace(config, users=max(1, users), rate=config.rate / config.processes, processes=1))
+        return parts
+
+
+def _run_in_process(config: LoadConfig) -> Dict[str, Any]:
+    return _run_threads(config).to_dict()
+
+
+def _run_iteration(scenario, client: PetClient, recorder: MetricsRecorder, scheduled_at: float) -> None:
+    failed = False
+    try:
+        scenario(client)
+    except Exception as e:
+        failed = True
+        logger.debug("Scenario iteration failed: %s", e)
+    finished = time.perf_counter()
+    recorder.record_iteration(finished - scheduled_at, failed, finished)
+
+
+def _run_threads(config: LoadConfig) -> MetricsRecorder:
+    scenario = resolve_scenario(config.scenario)
+    recorder = MetricsRecorder()
+    client = PetClient(base_url=config.base_url)
+    client.hooks.append(recorder)
+    deadline = recorder.started_at + config.duration
+    try:
+        if config.mode == CLOSED_LOOP:
+            def virtual_user() -> None:
+                while time.perf_counter() < deadline:
+                    _run_iteration(scenario, client, recorder, time.perf_counter())
+
+            users = [threading.Thread(target=virtual_user, daemon=True) for _ in range(config.users)]
+            for user in users:
+                user.start()
+            for user in users:
+                user.join()
+        else:
+            with ThreadPoolExecutor(max_workers=config.users) as executor:
+                for arrival in range(int(config.duration * config.rate)):
+                    scheduled_at = recorder.started_at + arrival / config.rate
+                    delay = scheduled_at - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                    # Latency is measured from the intended start so queueing delay is not hidden.
+                    executor.submit(_run_iteration, scenario, client, recorder, scheduled_at)
+    finally:
+        client.close()
+    return recorder
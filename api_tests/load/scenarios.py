@@ -0,0 +1,59 @@
+import importlib
+import random
+from typing import Callable, Dict
+
+from api_tests.api.pet_client import PetClient
+from api_tests.models.pet import Pet
+from api_tests.utils.assertions import assert_status_code
+
+Scenario = Callable[[PetClient], None]
+
+
+def pet_lifecycle(client: PetClient) -> None:
+    create_response = client.add_pet(Pet(
+        name="Load Test Pet",
+        photoUrls=["https://example.com/photo.jpg"],
+        status="available"
+    ))
+    assert_status_code(create_response, 200)
+    pet_id = create_response.json().get("id")
+
+    assert_status_code(client.get_pet_by_id(pet_id), 200)
+
+    update_response = client.update_pet(Pet(
+        id=pet_id,
+        name="Updated Load Test Pet",
+        photoUrls=["https://example.com/photo.jpg"],
+        status="sold"
+    ))
+    assert_status_code(update_response, 200)
+
+    assert_status_code(client.get_pet_by_id(pet_id), 200)
+    assert_status_code(client.delete_pet(pet_id), 200)
+    assert_status_code(client.get_pet_by_id(pet_id), 404)
+
+
+def find_by_status(client: PetClient) -> None:
+    status = random.choice(["available", "pending", "sold"])
+    assert_status_code(client.find_pets_by_status([status]), 200)
+
+
+def read_missing_pet(client: PetClient) -> None:
+    assert_status_code(client.get_pet_by_id(random.randint(1, 999999)), 404)
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "pet_lifecycle": pet_lifecycle,
+    "find_by_status": find_by_status,
+    "read_missing_pet": read_missing_pet,
+}
+
+
+def resolve_scenario(name: str) -> Scenario:
+    """Look up a built-in scenario, or import one given as ``package.module:function``."""
+    if name in SCENARIOS:
+        return SCENARIOS[name]
+    if ":" not in name:
+        raise ValueError(f"Unknown scenario: {name}. Built-in scenarios: {', '.join(SCENARIOS)}")
+    module_name, function_name = name.split(":", 1)
+    return getattr(importlib.import_module(module_name), function_name)
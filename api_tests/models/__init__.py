@@ -1,4 +1,20 @@
-from .pet import Pet, Category, Tag
-from .api_response import ApiResponse
+from typing import TYPE_CHECKING
 
-__all__ = ["Pet", "Category", "Tag", "ApiResponse"]
+from api_tests.utils.lazy import lazy_exports
+
+_EXPORTS = {
+    "Pet": ".pet",
+    "Category": ".pet",
+    "Tag": ".pet",
+    "ApiResponse": ".api_response",
+    "PetBatch": ".pet_batch",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .pet import Pet, Category, Tag
+    from .api_response import ApiResponse
+    from .pet_batch import PetBatch
@@ -0,0 +1,52 @@
+import logging
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Type, TypeVar
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=None)
+def list_adapter(item_type: Type[T]) -> TypeAdapter:
+    return TypeAdapter(List[item_type])
+
+
+@lru_cache(maxsize=None)
+def json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """``model.model_json_schema()``, generated once per model; callers must not mutate it."""
+    return model.model_json_schema()
+
+
+def validate_json_batch(raw_items: List[bytes], item_type: Type[T], skip_invalid: bool = False) -> List[T]:
+    """Validate raw JSON elements with one ``validate_json`` call on the cached list adapter."""
+    adapter = list_adapter(item_type)
+    try:
+        return adapter.validate_json(b"[" + b",".join(raw_items) + b"]")
+    except ValidationError:
+        if not skip_invalid:
+            raise
+    valid = []
+    for raw in raw_items:
+        try:
+            valid.extend(adapter.validate_json(b"[" + raw + b"]"))
+        except ValidationError as e:
+            logger.debug("Skipping invalid %s: %s", item_type.__name__, e)
+    return valid
+
+
+def iter_validated(
+    raw_items: Iterable[bytes],
+    item_type: Type[T],
+    batch_size: int = 100,
+    skip_invalid: bool = False
+) -> Iterator[T]:
+    batch = []
+    for raw in raw_items:
+        batch.append(raw)
+        if len(batch) >= batch_size:
+            yield from validate_json_batch(batch, item_type, skip_invalid)
+            batch = []
+    if batch:
+        yield from validate_json_batch(batch, item_type, skip_invalid)
@@ -1,8 +1,10 @@
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class ApiResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     code: Optional[int] = None
     type: Optional[str] = None
     message: Optional[str] = None
@@ -0,0 +1,200 @@
+import logging
+from array import array
+from typing import Any, Dict, Iterable, List, Optional
+import requests
+
+from api_tests.models.pet import Category, Pet, Tag
+
+logger = logging.getLogger(__name__)
+
+MISSING_ID = -(2 ** 63)
+MAX_ID = 2 ** 63 - 1
+
+
+class _Dictionary:
+    """Maps values to dense integer codes."""
+
+    def __init__(self):
+        self.values: List[Optional[str]] = []
+        self._codes: Dict[Optional[str], int] = {}
+
+    def encode(self, value: Optional[str]) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def code(self, value: Optional[str]) -> Optional[int]:
+        return self._codes.get(value)
+
+
+def _int_or_missing(value: Any) -> int:
+    return MISSING_ID if value is None else value
+
+
+def _check_id(value: Any) -> bool:
+    """Absent, or an integer that fits the ``array('q')`` columns (``MISSING_ID`` is reserved)."""
+    if value is None:
+        return True
+    return isinstance(value, int) and not isinstance(value, bool) and MISSING_ID < value <= MAX_ID
+
+
+def _check_entity(value: Any) -> Optional[str]:
+    if not isinstance(value, dict):
+        return "is not an object"
+    if not _check_id(value.get("id")):
+        return "id is not an int64"
+    if not isinstance(value.get("name"), (str, type(None))):
+        return "name is not a string"
+    return None
+
+
+def _check_record(record: Any) -> Optional[str]:
+    if not isinstance(record, dict):
+        return "record is not an object"
+    if not _check_id(record.get("id")):
+        return "id is not an int64"
+    if not isinstance(record.get("name"), str):
+        return "name is required"
+    photo_urls = record.get("photoUrls")
+    if not isinstance(photo_urls, list) or not all(isinstance(url, str) for url in photo_urls):
+        return "photoUrls is required"
+    if not isinstance(record.get("status"), (str, type(None))):
+        return "status is not a string"
+    if record.get("category") is not None:
+        error = _check_entity(record["category"])
+        if error is not None:
+            return f"category {error}"
+    tags = record.get("tags")
+    if tags is not None:
+        if not isinstance(tags, list):
+            return "tags is not a list"
+        for position, tag in enumerate(tags):
+            error = _check_entity(tag)
+            if error is not None:
+                return f"tag {position} {error}"
+    return None
+
+
+class PetBatch:
+    """Column-oriented, array-backed view of a list of pets.
+
+    Ids and category ids live in ``array('q')`` (``MISSING_ID`` for absent
+    values), statuses, category names and tag names are dictionary-encoded,
+    and tags and photo URLs are stored as flat columns with per-pet offsets.
+    Queries run over the arrays; ``Pet`` objects are only built by
+    :meth:`pet` and :meth:`to_pets`.
+    """
+
+    def __init__(self):
+        self.ids = array("q")
+        self.names: List[str] = []
+        self.status_codes = array("I")
+        self.statuses = _Dictionary()
+        self.category_ids = array("q")
+        self.category_codes = array("I")
+        self.categories = _Dictionary()
+        self.tag_offsets = array("I", [0])
+        self.tag_ids = array("q")
+        self.tag_codes = array("I")
+        self.tags = _Dictionary()
+        self.photo_offsets = array("I", [0])
+        self.photo_urls: List[str] = []
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]], skip_invalid: bool = False) -> "PetBatch":
+        batch = cls()
+        for index, record in enumerate(records):
+            error = _check_record(record)
+            if error is not None:
+                if not skip_invalid:
+                    raise ValueError(f"Invalid pet at index {index}: {error}")
+                logger.debug("Skipping invalid pet at index %s: %s", index, error)
+                continue
+            batch._append(record)
+        return batch
+
+    @classmethod
+    def from_response(cls, response: requests.Response, skip_invalid: bool = False) -> "PetBatch":
+        return cls.from_records(response.json(), skip_invalid)
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        self.ids.append(_int_or_missing(record.get("id")))
+        self.names.append(record["name"])
+        self.status_codes.append(self.statuses.encode(record.get("status")))
+        category = record.get("category") or {}
+        self.category_ids.append(_int_or_missing(category.get("id")))
+        self.category_codes.append(self.categories.encode(category.get("name")))
+        for tag in record.get("tags") or ():
+            self.tag_ids.append(_int_or_missing(tag.get("id")))
+            self.tag_codes.append(self.tags.encode(tag.get("name")))
+        self.tag_offsets.append(len(self.tag_ids))
+        self.photo_urls.extend(record["photoUrls"])
+        self.photo_offsets.append(len(self.photo_urls))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def all_have_status(self, status: str) -> bool:
+        code = self.statuses.code(status)
+        if code is None:
+            return len(self) == 0
+        return self.status_codes.count(code) == len(self.status_codes)
+
+    def any_has_status(self, status: str) -> bool:
+        code = self.statuses.code(status)
+        return code is not None and code in self.status_codes
+
+    def status_counts(self) -> Dict[Optional[str], int]:
+        return {value: self.status_codes.count(code) for code, value in enumerate(self.statuses.values)}
+
+    def any_has_tag(self, name: str) -> bool:
+        code = self.tags.code(name)
+        return code is not None and code in self.tag_codes
+
+    def any_has_tag_id(self, tag_id: int) -> bool:
+        return tag_id in self.tag_ids
+
+    def any_has_category_id(self, category_id: int) -> bool:
+        return category_id in self.category_ids
+
+    def ids_subset_of(self, ids: Iterable[int]) -> bool:
+        return set(self.ids) <= set(ids)
+
+    def contains_ids(self, ids: Iterable[int]) -> bool:
+        return set(ids) <= set(self.ids)
+
+    def index_of(self, pet_id: int) -> int:
+        return self.ids.index(pet_id)
+
+    def pet(self, index: int) -> Pet:
+        if index < 0:
+            index += len(self)
+        category_id = self.category_ids[index]
+        category_name = self.categories.values[self.category_codes[index]]
+        category = None
+        if category_id != MISSING_ID or category_name is not None:
+            category = Category(id=None if category_id == MISSING_ID else category_id, name=category_name)
+        tags = None
+        tag_start, tag_end = self.tag_offsets[index], self.tag_offsets[index + 1]
+        if tag_end > tag_start:
+            tags = [
+                Tag(
+                    id=None if self.tag_ids[position] == MISSING_ID else self.tag_ids[position],
+                    name=self.tags.values[self.tag_codes[position]]
+                )
+                for position in range(tag_start, tag_end)
+            ]
+        pet_id = self.ids[index]
+        return Pet(
+            id=None if pet_id == MISSING_ID else pet_id,
+            name=self.names[index],
+            photoUrls=self.photo_urls[self.photo_offsets[index]:self.photo_offsets[index + 1]],
+            status=self.statuses.values[self.status_codes[index]],
+            category=category,
+            tags=tags
+        )
+
+    def to_pets(self) -> List[Pet]:
+        return [self.pet(index) for index in range(len(self))]
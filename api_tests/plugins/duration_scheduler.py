@@ -0,0 +1,76 @@
+from typing import Dict
+import pytest
+from xdist.scheduler import LoadScheduling
+
+from api_tests.plugins.duration_scheduling import (
+    DurationStore,
+    default_chunk_size,
+    imbalance,
+    in_order_makespans,
+    lpt_makespans,
+)
+
+
+class DurationScheduling(LoadScheduling):
+    """``--dist load`` variant that hands out the longest tests first.
+
+    Pending tests are ordered by their estimated duration, longest first, and
+    each worker is only given one test beyond the one it is running, so the
+    next longest test always goes to the first worker that becomes idle
+    (longest-processing-time-first list scheduling). Estimates that turn out
+    wrong only affect the order, never which tests run.
+    """
+
+    def __init__(self, config: pytest.Config, store: DurationStore, log=None):
+        super().__init__(config, log)
+        self.store = store
+        self.estimates: Dict[str, float] = {}
+
+    def schedule(self) -> None:
+        assert self.collection_is_completed
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        self.estimates = {nodeid: self.store.estimate(nodeid) for nodeid in self.collection}
+        self.pending[:] = sorted(
+            range(len(self.collection)), key=lambda index: self.estimates[self.collection[index]], reverse=True
+        )
+        if not self.collection:
+            return
+        self.config._duration_plan = self.plan(len(self.nodes))
+        for _ in range(2):
+            for node in self.nodes:
+                self._send_tests(node, 1)
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+    def check_schedule(self, node, duration: float = 0) -> None:
+        if node.shutting_down:
+            return
+        if self.pending:
+            if len(self.node2pending[node]) < 2:
+                self._send_tests(node, 2 - len(self.node2pending[node]))
+        else:
+            node.shutdown()
+
+    def plan(self, workers: int) -> Dict[str, object]:
+        """Predicted makespans of this schedule and of the default one, from the same estimates."""
+        durations = [self.estimates[nodeid] for nodeid in self.collection]
+        default = in_order_makespans(durations, workers, default_chunk_size(len(durations), workers))
+        lpt = lpt_makespans(durations, workers)
+        return {
+            "workers": workers,
+            "tests": len(durations),
+            "unseen": sum(nodeid not in self.store for nodeid in self.collection),
+            "predicted_default_makespan": max(default),
+            "predicted_default_imbalance": imbalance(default),
+            "predicted_makespan": max(lpt),
+            "predicted_imbalance": imbalance(lpt),
+        }
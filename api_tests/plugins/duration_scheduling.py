@@ -0,0 +1,221 @@
+import heapq
+import json
+import logging
+import os
+import statistics
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+import pytest
+
+from api_tests.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _function_id(nodeid: str) -> str:
+    return nodeid.split("[", 1)[0]
+
+
+def _parent_id(nodeid: str) -> str:
+    return _function_id(nodeid).rpartition("::")[0]
+
+
+class DurationStore:
+    """Per-test durations (setup + call + teardown) kept in a local JSON file.
+
+    Each test keeps an exponentially weighted mean of its recent runs, so a
+    one-off slow run does not dominate the schedule. ``estimate`` falls back
+    for unseen tests: other parametrizations of the same function, then the
+    mean of the test's class or module, then the median of all known tests,
+    then ``default``.
+    """
+
+    def __init__(self, path: str, alpha: float = 0.3, default: float = 0.1):
+        self.path = Path(path)
+        self.alpha = alpha
+        self.default = default
+        self.durations: Dict[str, float] = {}
+        self._groups: Optional[Dict[str, Dict[str, List[float]]]] = None
+        self._median: Optional[float] = None
+
+    def load(self) -> "DurationStore":
+        try:
+            self.durations = {key: float(value) for key, value in json.loads(self.path.read_text()).items()}
+        except FileNotFoundError:
+            self.durations = {}
+        except (ValueError, AttributeError) as error:
+            logger.warning("Ignoring unreadable duration history %s: %s", self.path, error)
+            self.durations = {}
+        self._invalidate()
+        return self
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_suffix(self.path.suffix + f".{os.getpid()}.tmp")
+        temporary.write_text(json.dumps(dict(sorted(self.durations.items())), indent=1))
+        os.replace(temporary, self.path)
+
+    def update(self, nodeid: str, duration: float) -> None:
+        previous = self.durations.get(nodeid)
+        self.durations[nodeid] = duration if previous is None else previous + self.alpha * (duration - previous)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._groups = None
+        self._median = None
+
+    def _build(self) -> None:
+        groups: Dict[str, Dict[str, List[float]]] = {"function": defaultdict(list), "parent": defaultdict(list)}
+        for nodeid, duration in self.durations.items():
+            groups["function"][_function_id(nodeid)].append(duration)
+            groups["parent"][_parent_id(nodeid)].append(duration)
+        self._groups = groups
+        self._median = statistics.median(self.durations.values()) if self.durations else self.default
+
+    def estimate(self, nodeid: str) -> float:
+        duration = self.durations.get(nodeid)
+        if duration is not None:
+            return duration
+        if self._groups is None:
+            self._build()
+        for level, key in (("function", _function_id(nodeid)), ("parent", _parent_id(nodeid))):
+            known = self._groups[level].get(key)
+            if known:
+                return statistics.fmean(known)
+        return self._median
+
+    def __contains__(self, nodeid: str) -> bool:
+        return nodeid in self.durations
+
+    def __len__(self) -> int:
+        return len(self.durations)
+
+
+def lpt_makespans(durations: Iterable[float], workers: int) -> List[float]:
+    """Per-worker load when the longest remaining test always goes to the least loaded worker."""
+    loads = [0.0] * workers
+    heapq.heapify(loads)
+    for duration in sorted(durations, reverse=True):
+        heapq.heappush(loads, heapq.heappop(loads) + duration)
+    return sorted(loads, reverse=True)
+
+
+def in_order_makespans(durations: Sequence[float], workers: int, chunk: int = 1) -> List[float]:
+    """Per-worker load when idle workers take the next ``chunk`` tests in collection order.
+
+    With ``chunk`` set to the initial chunk size of ``--dist load`` this is a
+    model of the default scheduler that ignores durations.
+    """
+    loads = [(0.0, worker) for worker in range(workers)]
+    totals = [0.0] * workers
+    for start in range(0, len(durations), max(1, chunk)):
+        load, worker = heapq.heappop(loads)
+        load += sum(durations[start:start + chunk])
+        totals[worker] = load
+        heapq.heappush(loads, (load, worker))
+    return sorted(totals, reverse=True)
+
+
+def imbalance(loads: Sequence[float]) -> float:
+    """How much longer the slowest worker runs than a perfect split, as a fraction."""
+    total = sum(loads)
+    if not loads or total == 0:
+        return 0.0
+    return max(loads) / (total / len(loads)) - 1
+
+
+def default_chunk_size(tests: int, workers: int) -> int:
+    """Initial chunk ``--dist load`` sends to each worker."""
+    if tests < 2 * workers:
+        return 1
+    return max(2, tests // workers // 4)
+
+
+class DurationRecorder:
+    """Controller-side plugin that records test durations and per-worker busy time."""
+
+    def __init__(self, config: pytest.Config, store: DurationStore):
+        self.config = config
+        self.store = store
+        self.runs: Dict[str, float] = defaultdict(float)
+        self.workers: Dict[str, float] = defaultdict(float)
+
+    def pytest_runtest_logreport(self, report) -> None:
+        self.runs[report.nodeid] += report.duration
+        node = getattr(report, "node", None)
+        self.workers[node.gateway.id if node is not None else "main"] += report.duration
+
+    def pytest_sessionfinish(self, session, exitstatus) -> None:
+        for nodeid, duration in self.runs.items():
+            self.store.update(nodeid, duration)
+        if self.runs:
+            self.store.save()
+        plan = getattr(self.config, "_duration_plan", None)
+        if plan is None:
+            return
+        plan["actual_worker_seconds"] = {
+            worker: round(seconds, 4) for worker, seconds in sorted(self.workers.items())
+        }
+        plan["actual_imbalance"] = imbalance(list(self.workers.values()))
+        path = Path(self.config.getoption("duration_report"))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(plan, indent=2))
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("duration-scheduling", "duration-aware xdist scheduling")
+    group.addoption(
+        "--duration-scheduling",
+        action="store_true",
+        default=settings.DURATION_SCHEDULING,
+        help="Schedule tests across xdist workers longest-first using recorded durations"
+    )
+    group.addoption(
+        "--duration-history",
+        default=settings.DURATION_HISTORY_PATH,
+        help="JSON file the per-test durations are read from and recorded to"
+    )
+    group.addoption(
+        "--duration-report",
+        default="reports/duration_scheduling.json",
+        help="Write predicted and actual per-worker load to this JSON file"
+    )
+
+
+def pytest_configure(config):
+    if hasattr(config, "workerinput"):
+        return
+    store = DurationStore(config.getoption("duration_history"), default=settings.DURATION_DEFAULT).load()
+    config._duration_store = store
+    config.pluginmanager.register(DurationRecorder(config, store), "duration-recorder")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if not config.getoption("duration_scheduling") or config.getoption("dist") != "load":
+        return None
+    # xdist's scheduler modules are only needed for --dist runs; keep them out of plain startup.
+    from api_tests.plugins.duration_scheduler import DurationScheduling
+
+    return DurationScheduling(config, config._duration_store, log)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    plan = getattr(config, "_duration_plan", None)
+    if plan is None:
+        return
+    saved = plan["predicted_default_makespan"] - plan["predicted_makespan"]
+    terminalreporter.write_sep("-", "duration scheduling")
+    terminalreporter.write_line(
+        f"{plan['tests']} tests on {plan['workers']} workers, {plan['unseen']} without history"
+    )
+    terminalreporter.write_line(
+        f"predicted makespan: default {plan['predicted_default_makespan']:.2f}s "
+        f"(imbalance {plan['predicted_default_imbalance']:.1%}), "
+        f"longest-first {plan['predicted_makespan']:.2f}s (imbalance {plan['predicted_imbalance']:.1%}), "
+        f"{saved:.2f}s saved"
+    )
+    if "actual_imbalance" in plan:
+        workers = ", ".join(f"{worker} {seconds:.2f}s" for worker, seconds in plan["actual_worker_seconds"].items())
+        terminalreporter.write_line(f"actual worker busy time: {workers} (imbalance {plan['actual_imbalance']:.1%})")
@@ -0,0 +1,49 @@
+import pytest
+
+from api_tests.api import hooks
+from api_tests.api.capture import ExchangeCapture
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("exchange-capture", "HTTP exchange capture for failed tests")
+    group.addoption(
+        "--capture-exchanges",
+        type=int,
+        default=20,
+        help="Number of recent HTTP exchanges kept per test and attached on failure (0 disables)"
+    )
+
+
+def pytest_configure(config):
+    capacity = config.getoption("capture_exchanges")
+    if capacity <= 0:
+        return
+    capture = ExchangeCapture(capacity=capacity)
+    config._exchange_capture = capture
+    hooks.add_hook(capture)
+
+
+def pytest_unconfigure(config):
+    capture = getattr(config, "_exchange_capture", None)
+    if capture is not None:
+        hooks.remove_hook(capture)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    capture = getattr(item.config, "_exchange_capture", None)
+    if capture is None:
+        return
+    report = outcome.get_result()
+    if report.failed:
+        text = capture.render(item.nodeid)
+        if text:
+            report.sections.append(("Captured HTTP exchanges", text))
+            pytest_html = item.config.pluginmanager.getplugin("html")
+            if pytest_html is not None:
+                report.extras = getattr(report, "extras", []) + [
+                    pytest_html.extras.text(text, name="HTTP exchanges")
+                ]
+    if call.when == "teardown":
+        capture.discard(item.nodeid)
@@ -0,0 +1,200 @@
+import html
+import json
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional
+import pytest
+
+from api_tests.api import hooks
+from api_tests.api.hooks import RequestHook, RequestTiming
+from api_tests.load.histogram import LatencyHistogram
+
+if TYPE_CHECKING:
+    import requests
+
+PHASES = ("connect", "tls", "ttfb", "download")
+
+
+class TimingStats:
+
+    def __init__(self):
+        self.histogram = LatencyHistogram()
+        self.errors = 0
+        self.retries = 0
+        self.phases = dict.fromkeys(PHASES, 0.0)
+
+    def add(self, timing: RequestTiming) -> None:
+        self.histogram.record_seconds(timing.total)
+        if timing.error is not None or (timing.status is not None and timing.status >= 500):
+            self.errors += 1
+        self.retries += timing.retries
+        for phase in PHASES:
+            self.phases[phase] += getattr(timing, phase)
+
+    def merge(self, other: "TimingStats") -> None:
+        self.histogram.merge(other.histogram)
+        self.errors += other.errors
+        self.retries += other.retries
+        for phase in PHASES:
+            self.phases[phase] += other.phases[phase]
+
+    def summary(self) -> Dict[str, Any]:
+        count = self.histogram.count
+        summary = self.histogram.summary()
+        summary["errors"] = self.errors
+        summary["retries"] = self.retries
+        for phase in PHASES:
+            summary[f"{phase}_mean_ms"] = self.phases[phase] / count * 1000 if count else 0.0
+        return summary
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "histogram": self.histogram.to_dict(),
+            "errors": self.errors,
+            "retries": self.retries,
+            "phases": dict(self.phases),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TimingStats":
+        stats = cls()
+        stats.histogram = LatencyHistogram.from_dict(data["histogram"])
+        stats.errors = data["errors"]
+        stats.retries = data["retries"]
+        stats.phases.update(data["phases"])
+        return stats
+
+
+class TimingAggregator(RequestHook):
+    """Aggregates request timings per endpoint template and per test."""
+
+    def __init__(self):
+        self.endpoints: Dict[str, TimingStats] = defaultdict(TimingStats)
+        self.tests: Dict[str, Dict[str, TimingStats]] = defaultdict(lambda: defaultdict(TimingStats))
+        self._lock = threading.Lock()
+
+    def on_request(self, timing: RequestTiming, response: Optional["requests.Response"]) -> None:
+        key = f"{timing.method} {timing.endpoint}"
+        with self._lock:
+            self.endpoints[key].add(timing)
+            if timing.test is not None:
+                self.tests[timing.test][key].add(timing)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "endpoints": {key: stats.to_dict() for key, stats in self.endpoints.items()},
+            "tests": {
+                test: {key: stats.to_dict() for key, stats in endpoints.items()}
+                for test, endpoints in self.tests.items()
+            },
+        }
+
+    def merge_dict(self, data: Dict[str, Any]) -> None:
+        for key, stats in data["endpoints"].items():
+            self.endpoints[key].merge(TimingStats.from_dict(stats))
+        for test, endpoints in data["tests"].items():
+            for key, stats in endpoints.items():
+                self.tests[test][key].merge(TimingStats.from_dict(stats))
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "endpoints": {key: stats.summary() for key, stats in sorted(self.endpoints.items())},
+            "tests": {
+                test: {key: stats.summary() for key, stats in sorted(endpoints.items())}
+                for test, endpoints in sorted(self.tests.items())
+            },
+        }
+
+
+def render_html_table(endpoints: Dict[str, TimingStats]) -> str:
+    columns = ["count", "errors", "retries", "p50_ms", "p95_ms", "p99_ms", "max_ms"]
+    columns += [f"{phase}_mean_ms" for phase in PHASES]
+    header = "".join(f"<th>{column}</th>" for column in ["endpoint"] + columns)
+    rows = []
+    for key, stats in sorted(endpoints.items()):
+        summary = stats.summary()
+        cells = "".join(
+            f"<td>{summary[column]:.2f}</td>" if isinstance(summary[column], float) else f"<td>{summary[column]}</td>"
+            for column in columns
+        )
+        rows.append(f"<tr><td>{html.escape(key)}</td>{cells}</tr>")
+    return f"<table><tr>{header}</tr>{''.join(rows)}</table>"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("request-timings", "per-request timing instrumentation")
+    group.addoption(
+        "--request-timings",
+        default="reports/request_timings.json",
+        help="Write per-endpoint and per-test request timing aggregates to this JSON file"
+    )
+    group.addoption(
+        "--no-request-timings",
+        action="store_true",
+        default=False,
+        help="Disable request timing instrumentation"
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("no_request_timings"):
+        return
+    aggregator = TimingAggregator()
+    config._request_timings = aggregator
+    hooks.add_hook(aggregator)
+
+
+def pytest_unconfigure(config):
+    aggregator = getattr(config, "_request_timings", None)
+    if aggregator is not None:
+        hooks.remove_hook(aggregator)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    hooks.set_current_test(item.nodeid)
+    yield
+    hooks.set_current_test(None)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    aggregator = getattr(item.config, "_request_timings", None)
+    pytest_html = item.config.pluginmanager.getplugin("html")
+    if aggregator is None or pytest_html is None or call.when != "call":
+        return
+    endpoints = aggregator.tests.get(item.nodeid)
+    if endpoints:
+        report = outcome.get_result()
+        report.extras = getattr(report, "extras", []) + [
+            pytest_html.extras.html(f"<h4>Request timings</h4>{render_html_table(endpoints)}")
+        ]
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix, session):
+    aggregator = getattr(session.config, "_request_timings", None)
+    if aggregator is not None and aggregator.endpoints:
+        prefix.append(f"<h3>Request timings per endpoint</h3>{render_html_table(aggregator.endpoints)}")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    aggregator = getattr(node.config, "_request_timings", None)
+    data = getattr(node, "workeroutput", {}).get("request_timings")
+    if aggregator is not None and data:
+        aggregator.merge_dict(data)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    aggregator = getattr(session.config, "_request_timings", None)
+    if aggregator is None:
+        return
+    if hasattr(session.config, "workerinput"):
+        session.config.workeroutput["request_timings"] = aggregator.to_dict()
+        return
+    path = Path(session.config.getoption("request_timings"))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(aggregator.report(), indent=2))
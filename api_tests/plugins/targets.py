@@ -0,0 +1,186 @@
+import json
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import pytest
+
+from api_tests.api import hooks
+from api_tests.api.hooks import RequestHook, RequestTiming
+from api_tests.plugins.request_timings import TimingStats
+
+if TYPE_CHECKING:
+    import requests
+
+OUTCOMES = ("passed", "failed", "skipped")
+
+
+class TargetAggregator(RequestHook):
+    """Test outcomes and request timings per target, for a side-by-side comparison.
+
+    Requests are attributed to a target by base URL prefix, so pooled-pet
+    refills and other fixture traffic count toward the target they hit.
+    """
+
+    def __init__(self):
+        self.base_urls: Dict[str, str] = {}
+        self.outcomes: Dict[str, Dict[str, int]] = defaultdict(lambda: dict.fromkeys(OUTCOMES, 0))
+        self.totals: Dict[str, TimingStats] = defaultdict(TimingStats)
+        self.endpoints: Dict[str, Dict[str, TimingStats]] = defaultdict(lambda: defaultdict(TimingStats))
+        self._lock = threading.Lock()
+
+    def register(self, name: str, base_url: str) -> None:
+        with self._lock:
+            self.base_urls[base_url.rstrip("/")] = name
+
+    def target_of(self, url: str) -> Optional[str]:
+        for base_url, name in self.base_urls.items():
+            if url == base_url or url.startswith(base_url + "/"):
+                return name
+        return None
+
+    def on_request(self, timing: RequestTiming, response: Optional["requests.Response"]) -> None:
+        name = self.target_of(timing.url)
+        if name is None:
+            return
+        with self._lock:
+            self.totals[name].add(timing)
+            self.endpoints[name][f"{timing.method} {timing.endpoint}"].add(timing)
+
+    def record_outcome(self, name: str, outcome: str) -> None:
+        with self._lock:
+            self.outcomes[name][outcome] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "totals": {name: stats.to_dict() for name, stats in self.totals.items()},
+            "endpoints": {
+                name: {key: stats.to_dict() for key, stats in endpoints.items()}
+                for name, endpoints in self.endpoints.items()
+            },
+        }
+
+    def merge_dict(self, data: Dict[str, Any]) -> None:
+        for name, stats in data["totals"].items():
+            self.totals[name].merge(TimingStats.from_dict(stats))
+        for name, endpoints in data["endpoints"].items():
+            for key, stats in endpoints.items():
+                self.endpoints[name][key].merge(TimingStats.from_dict(stats))
+
+    @property
+    def targets(self) -> List[str]:
+        return sorted(set(self.outcomes) | set(self.totals))
+
+    def report(self) -> Dict[str, Any]:
+        targets = {}
+        for name in self.targets:
+            summary = self.totals[name].summary()
+            summary.update(self.outcomes[name])
+            summary["endpoints"] = {key: stats.summary() for key, stats in sorted(self.endpoints[name].items())}
+            targets[name] = summary
+        return {"targets": targets}
+
+    def format_table(self) -> List[str]:
+        names = self.targets
+        width = max([12] + [len(name) + 2 for name in names])
+        lines = [
+            f"{'target':<{width}}{'passed':>8}{'failed':>8}{'skipped':>9}{'requests':>10}{'errors':>8}"
+            f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+        ]
+        for name in names:
+            outcomes, summary = self.outcomes[name], self.totals[name].summary()
+            lines.append(
+                f"{name:<{width}}{outcomes['passed']:>8}{outcomes['failed']:>8}{outcomes['skipped']:>9}"
+                f"{summary['count']:>10}{summary['errors']:>8}"
+                f"{summary['p50_ms']:>9.2f}{summary['p95_ms']:>9.2f}{summary['p99_ms']:>9.2f}"
+            )
+        endpoints = sorted({key for name in names for key in self.endpoints[name]})
+        if endpoints:
+            lines.append("")
+            lines.append(f"{'p95 ms by endpoint':<32}" + "".join(f"{name:>{width}}" for name in names))
+            for key in endpoints:
+                cells = []
+                for name in names:
+                    stats = self.endpoints[name].get(key)
+                    cells.append(f"{stats.summary()['p95_ms']:>{width}.2f}" if stats else f"{'-':>{width}}")
+                lines.append(f"{key:<32}" + "".join(cells))
+        return lines
+
+
+class TargetOutcomes:
+    """Controller-side plugin that counts test outcomes per target."""
+
+    def __init__(self, aggregator: TargetAggregator):
+        self.aggregator = aggregator
+
+    def pytest_runtest_logreport(self, report) -> None:
+        name = dict(report.user_properties).get("target")
+        if name is not None and (report.when == "call" or (report.when == "setup" and not report.passed)):
+            self.aggregator.record_outcome(name, report.outcome)
+
+
+def register_target(config: pytest.Config, name: str, base_url: str) -> None:
+    """Attribute requests to ``base_url`` to target ``name`` in the per-target report."""
+    aggregator = getattr(config, "_targets", None)
+    if aggregator is not None:
+        aggregator.register(name, base_url)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("targets", "multi-target runs")
+    group.addoption(
+        "--targets-report",
+        default="reports/targets.json",
+        help="Write per-target outcomes and request timings to this JSON file"
+    )
+
+
+def pytest_configure(config):
+    aggregator = TargetAggregator()
+    config._targets = aggregator
+    hooks.add_hook(aggregator)
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(TargetOutcomes(aggregator), "target-outcomes")
+
+
+def pytest_unconfigure(config):
+    aggregator = getattr(config, "_targets", None)
+    if aggregator is not None:
+        hooks.remove_hook(aggregator)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    callspec = getattr(item, "callspec", None)
+    if callspec is not None and "target" in callspec.params:
+        item.user_properties.append(("target", callspec.params["target"]))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    aggregator = getattr(node.config, "_targets", None)
+    data = getattr(node, "workeroutput", {}).get("targets")
+    if aggregator is not None and data:
+        aggregator.merge_dict(data)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    aggregator = getattr(session.config, "_targets", None)
+    if aggregator is None:
+        return
+    if hasattr(session.config, "workerinput"):
+        session.config.workeroutput["targets"] = aggregator.to_dict()
+        return
+    if len(aggregator.targets) > 1:
+        path = Path(session.config.getoption("targets_report"))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(aggregator.report(), indent=2))
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    aggregator = getattr(config, "_targets", None)
+    if aggregator is None or len(aggregator.targets) < 2:
+        return
+    terminalreporter.write_sep("-", "targets side by side")
+    for line in aggregator.format_table():
+        terminalreporter.write_line(line)
@@ -0,0 +1,23 @@
+from typing import TYPE_CHECKING
+
+from api_tests.utils.lazy import lazy_exports
+
+_EXPORTS = {
+    "PetStore": ".store",
+    "FaultConfig": ".app",
+    "FaultInjector": ".app",
+    "PetStoreApp": ".app",
+    "PetStoreServer": ".http_server",
+    "H2PetStoreServer": ".asgi",
+    "PetStoreASGIApp": ".asgi",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .store import PetStore
+    from .app import FaultConfig, FaultInjector, PetStoreApp
+    from .http_server import PetStoreServer
+    from .asgi import H2PetStoreServer, PetStoreASGIApp
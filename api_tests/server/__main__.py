@@ -0,0 +1,46 @@
+import argparse
+import logging
+import time
+
+from api_tests.server.app import FaultConfig, FaultInjector, PetStoreApp
+from api_tests.server.http_server import PetStoreServer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the in-memory Petstore stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="Fixed latency per request, seconds")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="Extra uniform random latency, seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with an error")
+    parser.add_argument("--error-status", type=int, action="append", help="Injected status codes (repeatable)")
+    parser.add_argument("--retry-after", type=int, default=None, help="Retry-After header on injected errors")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="Requests per second before answering 429")
+    parser.add_argument("--rate-limit-burst", type=float, default=1.0, help="Requests allowed back to back")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    config = FaultConfig(
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        retry_after=args.retry_after,
+        rate_limit=args.rate_limit,
+        rate_limit_burst=args.rate_limit_burst
+    )
+    if args.error_status:
+        config.error_statuses = args.error_status
+
+    server = PetStoreServer(args.host, args.port, app=PetStoreApp(faults=FaultInjector(config)))
+    server.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
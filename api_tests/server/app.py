@@ -0,0 +1,283 @@
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from email.parser import BytesParser
+from email.policy import HTTP
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+from api_tests.server.store import PetStore
+
+Headers = Dict[str, str]
+AppResponse = Tuple[int, Headers, bytes]
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@dataclass
+class FaultConfig:
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    error_rate: float = 0.0
+    error_statuses: List[int] = field(default_factory=lambda: [500, 502, 503])
+    retry_after: Optional[int] = None
+    rate_limit: float = 0.0
+    rate_limit_burst: float = 1.0
+
+
+@dataclass
+class ForcedFault:
+    status: int
+    retry_after: Optional[int] = None
+
+
+class FaultInjector:
+    """Latency and error injection applied to every request before routing.
+
+    With ``rate_limit`` set, requests beyond that many per second (after a
+    burst of ``rate_limit_burst``) are answered with 429 and ``Retry-After``.
+    """
+
+    def __init__(self, config: Optional[FaultConfig] = None):
+        self.config = config or FaultConfig()
+        self._forced: Deque[ForcedFault] = deque()
+        self._delays: Deque[float] = deque()
+        self._lock = threading.Lock()
+        self._random = random.Random()
+        self._allowance = 0.0
+        self._allowance_at = 0.0
+        self.injected_errors = 0
+        self.rate_limited = 0
+
+    def configure(self, **options: Any) -> None:
+        for key, value in options.items():
+            if not hasattr(self.config, key):
+                raise ValueError(f"Unknown fault option: {key}")
+            setattr(self.config, key, value)
+
+    def fail_next(self, count: int = 1, status: int = 503, retry_after: Optional[int] = None) -> None:
+        with self._lock:
+            self._forced.extend(ForcedFault(status, retry_after) for _ in range(count))
+
+    def delay_next(self, count: int = 1, seconds: float = 1.0) -> None:
+        with self._lock:
+            self._delays.extend([seconds] * count)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.config = FaultConfig()
+            self._forced.clear()
+            self._delays.clear()
+            self._allowance_at = 0.0
+            self.injected_errors = 0
+            self.rate_limited = 0
+
+    def apply(self) -> Optional[AppResponse]:
+        config = self.config
+        if self._delays:
+            with self._lock:
+                delay = self._delays.popleft() if self._delays else 0.0
+            time.sleep(delay)
+        if config.latency or config.latency_jitter:
+            time.sleep(config.latency + self._random.uniform(0, config.latency_jitter))
+
+        fault = None
+        with self._lock:
+            if config.rate_limit and not self._admit(config):
+                self.rate_limited += 1
+                fault = ForcedFault(429, config.retry_after or 1)
+            elif self._forced:
+                fault = self._forced.popleft()
+            elif config.error_rate and self._random.random() < config.error_rate:
+                fault = ForcedFault(self._random.choice(config.error_statuses), config.retry_after)
+            if fault is not None:
+                self.injected_errors += 1
+        if fault is None:
+            return None
+
+        headers = dict(JSON_HEADERS)
+        if fault.retry_after is not None:
+            headers["Retry-After"] = str(fault.retry_after)
+        body = {"code": fault.status, "type": "error", "message": "injected fault"}
+        return fault.status, headers, json.dumps(body).encode()
+
+    def _admit(self, config: FaultConfig) -> bool:
+        now = time.monotonic()
+        capacity = max(1.0, config.rate_limit_burst)
+        if not self._allowance_at:
+            self._allowance = capacity
+        self._allowance = min(capacity, self._allowance + (now - self._allowance_at) * config.rate_limit)
+        self._allowance_at = now
+        if self._allowance < 1:
+            return False
+        self._allowance -= 1
+        return True
+
+
+def _json(status: int, payload: Any) -> AppResponse:
+    return status, dict(JSON_HEADERS), json.dumps(payload).encode()
+
+
+def _api_response(status: int, message: str, type_: str = "unknown", code: Optional[int] = None) -> AppResponse:
+    return _json(status, {"code": status if code is None else code, "type": type_, "message": message})
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _valid_named(value: Any) -> bool:
+    return (
+        isinstance(value, dict)
+        and (value.get("id") is None or _is_int(value["id"]))
+        and (value.get("name") is None or isinstance(value["name"], str))
+    )
+
+
+def validate_pet(payload: Any) -> Optional[str]:
+    if not isinstance(payload, dict):
+        return "body must be a JSON object"
+    if payload.get("id") is not None and not _is_int(payload["id"]):
+        return "id must be an integer"
+    if not isinstance(payload.get("name"), str):
+        return "name is required"
+    photo_urls = payload.get("photoUrls")
+    if not isinstance(photo_urls, list) or not all(isinstance(url, str) for url in photo_urls):
+        return "photoUrls is required"
+    if payload.get("status") is not None and not isinstance(payload["status"], str):
+        return "status must be a string"
+    if payload.get("category") is not None and not _valid_named(payload["category"]):
+        return "invalid category"
+    tags = payload.get("tags")
+    if tags is not None and (not isinstance(tags, list) or not all(_valid_named(tag) for tag in tags)):
+        return "invalid tags"
+    return None
+
+
+def _split_multi(values: List[str]) -> List[str]:
+    return [item for value in values for item in value.split(",") if item]
+
+
+def parse_multipart(content_type: str, body: bytes) -> Tuple[Dict[str, str], Dict[str, Tuple[str, bytes]]]:
+    message = BytesParser(policy=HTTP).parsebytes(
+        b"Content-Type: " + content_type.encode("latin-1") + b"\r\n\r\n" + body
+    )
+    fields: Dict[str, str] = {}
+    files: Dict[str, Tuple[str, bytes]] = {}
+    if not message.is_multipart():
+        return fields, files
+    for part in message.iter_parts():
+        name = part.get_param("name", header="content-disposition")
+        if name is None:
+            continue
+        payload = part.get_payload(decode=True) or b""
+        filename = part.get_filename()
+        if filename is not None:
+            files[name] = (filename, payload)
+        else:
+            fields[name] = payload.decode("utf-8", errors="replace")
+    return fields, files
+
+
+class PetStoreApp:
+    """Transport-independent Petstore v2 pet endpoints over a PetStore."""
+
+    def __init__(self, store: Optional[PetStore] = None, faults: Optional[FaultInjector] = None):
+        self.store = store or PetStore()
+        self.faults = faults or FaultInjector()
+        self.request_count = 0
+        self._count_lock = threading.Lock()
+
+    def handle(self, method: str, path: str, query: str, headers: Headers, body: bytes) -> AppResponse:
+        with self._count_lock:
+            self.request_count += 1
+        fault = self.faults.apply()
+        if fault is not None:
+            return fault
+
+        segments = [segment for segment in path.split("/") if segment]
+        if segments and segments[0] == "v2":
+            segments = segments[1:]
+        if not segments or segments[0] != "pet":
+            return _api_response(404, "not found")
+
+        params = parse_qs(query)
+        if len(segments) == 1:
+            if method in ("POST", "PUT"):
+                return self._upsert(body)
+            return _api_response(405, "method not allowed")
+
+        action = segments[1]
+        if len(segments) == 2 and action == "findByStatus" and method == "GET":
+            return _json(200, self.store.find_by_status(_split_multi(params.get("status", []))))
+        if len(segments) == 2 and action == "findByTags" and method == "GET":
+            return _json(200, self.store.find_by_tags(_split_multi(params.get("tags", []))))
+
+        try:
+            pet_id = int(action)
+        except ValueError:
+            return _api_response(404, f'java.lang.NumberFormatException: For input string: "{action}"')
+
+        if len(segments) == 2:
+            if method == "GET":
+                return self._get(pet_id, headers)
+            if method == "POST":
+                return self._update_with_form(pet_id, headers, body)
+            if method == "DELETE":
+                return self._delete(pet_id)
+        elif len(segments) == 3 and segments[2] == "uploadImage" and method == "POST":
+            return self._upload_image(pet_id, headers, body)
+        return _api_response(405, "method not allowed")
+
+    def _upsert(self, body: bytes) -> AppResponse:
+        if not body:
+            return _api_response(405, "no data")
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return _api_response(400, "bad input")
+        error = validate_pet(payload)
+        if error is not None:
+            return _api_response(405, f"Invalid input: {error}")
+        return _json(200, self.store.upsert(payload))
+
+    def _get(self, pet_id: int, headers: Headers) -> AppResponse:
+        pet = self.store.get(pet_id)
+        if pet is None:
+            return _api_response(404, "Pet not found", type_="error", code=1)
+        status, response_headers, body = _json(200, pet)
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        response_headers["ETag"] = etag
+        if headers.get("if-none-match") == etag:
+            return 304, {"ETag": etag}, b""
+        return status, response_headers, body
+
+    def _update_with_form(self, pet_id: int, headers: Headers, body: bytes) -> AppResponse:
+        form = parse_qs(body.decode("utf-8", errors="replace"))
+        fields = {key: values[-1] for key, values in form.items() if key in ("name", "status")}
+        if self.store.update_fields(pet_id, **fields) is None:
+            return _api_response(404, "not found")
+        return _api_response(200, str(pet_id))
+
+    def _delete(self, pet_id: int) -> AppResponse:
+        if not self.store.delete(pet_id):
+            return 404, {}, b""
+        return _api_response(200, str(pet_id))
+
+    def _upload_image(self, pet_id: int, headers: Headers, body: bytes) -> AppResponse:
+        if self.store.get(pet_id) is None:
+            return _api_response(404, "Pet not found", type_="error", code=1)
+        content_type = headers.get("content-type", "")
+        if not content_type.startswith("multipart/form-data"):
+            return _api_response(415, "multipart/form-data required")
+        fields, files = parse_multipart(content_type, body)
+        if "file" not in files:
+            return _api_response(400, "file is required")
+        filename, payload = files["file"]
+        message = f"additionalMetadata: {fields.get('additionalMetadata', 'null')}\n"
+        message += f"File uploaded to ./{filename}, {len(payload)} bytes"
+        return _api_response(200, message)
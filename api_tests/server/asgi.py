@@ -0,0 +1,154 @@
+import asyncio
+import logging
+import os
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from api_tests.server.app import FaultInjector, PetStoreApp
+from api_tests.server.store import PetStore
+
+logger = logging.getLogger(__name__)
+
+
+class PetStoreASGIApp:
+    """ASGI adapter for PetStoreApp.
+
+    ``handle`` runs on a thread pool, so injected delays stall one stream
+    rather than every request multiplexed on a connection.
+    """
+
+    def __init__(self, app: PetStoreApp, max_workers: int = 64):
+        self.app = app
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="petstore-asgi")
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        body = bytearray()
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+        headers = {key.decode("latin-1").lower(): value.decode("latin-1") for key, value in scope["headers"]}
+
+        status, response_headers, payload = await asyncio.get_running_loop().run_in_executor(
+            self.executor,
+            self.app.handle,
+            scope["method"],
+            scope["path"],
+            scope["query_string"].decode("latin-1"),
+            headers,
+            bytes(body)
+        )
+        raw_headers = [(key.lower().encode("latin-1"), str(value).encode("latin-1"))
+                       for key, value in response_headers.items()]
+        raw_headers.append((b"content-length", str(len(payload)).encode()))
+        await send({"type": "http.response.start", "status": status, "headers": raw_headers})
+        await send({"type": "http.response.body", "body": payload})
+
+
+class H2PetStoreServer:
+    """Petstore stand-in served by hypercorn, which speaks HTTP/1.1 and HTTP/2.
+
+    Without a certificate it accepts HTTP/2 over cleartext with prior
+    knowledge (h2c); with ``certfile``/``keyfile`` it serves HTTPS and
+    negotiates HTTP/2 through ALPN. Requires the optional ``hypercorn`` package.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        app: Optional[PetStoreApp] = None,
+        certfile: Optional[str] = None,
+        keyfile: Optional[str] = None
+    ):
+        self.app = app or PetStoreApp()
+        self.certfile = certfile
+        self.keyfile = keyfile
+        self._host = host
+        self._port = port
+        self._socket: Optional[socket.socket] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._shutdown: Optional[asyncio.Event] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def store(self) -> PetStore:
+        return self.app.store
+
+    @property
+    def faults(self) -> FaultInjector:
+        return self.app.faults
+
+    @property
+    def port(self) -> int:
+        if self._socket is None:
+            raise RuntimeError("H2PetStoreServer is not running")
+        return self._socket.getsockname()[1]
+
+    @property
+    def base_url(self) -> str:
+        scheme = "https" if self.certfile else "http"
+        return f"{scheme}://{self._host}:{self.port}/v2"
+
+    def start(self) -> "H2PetStoreServer":
+        from hypercorn.asyncio import serve
+        from hypercorn.config import Config
+
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind((self._host, self._port))
+        self._socket.listen(256)
+        config = Config()
+        # hypercorn takes ownership of (and closes) the descriptor it is given.
+        config.bind = [f"fd://{os.dup(self._socket.fileno())}"]
+        config.certfile = self.certfile
+        config.keyfile = self.keyfile
+        config.accesslog = None
+        config.errorlog = logger
+        config.h2_max_concurrent_streams = 1000
+        ready = threading.Event()
+
+        asgi_app = PetStoreASGIApp(self.app)
+
+        async def run() -> None:
+            self._loop = asyncio.get_running_loop()
+            self._shutdown = asyncio.Event()
+            ready.set()
+            try:
+                await serve(asgi_app, config, shutdown_trigger=self._shutdown.wait)
+            finally:
+                asgi_app.executor.shutdown(wait=False)
+
+        self._thread = threading.Thread(target=asyncio.run, args=(run(),), name="petstore-h2-stand-in", daemon=True)
+        self._thread.start()
+        ready.wait()
+        logger.info("Petstore HTTP/2 stand-in listening on %s", self.base_url)
+        return self
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._shutdown.set)
+        self._thread.join(timeout=10)
+        self._socket.close()
+        self._socket = self._thread = self._loop = self._shutdown = None
+
+    def __enter__(self) -> "H2PetStoreServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,106 @@
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import urlsplit
+
+from api_tests.server.app import FaultInjector, PetStoreApp
+from api_tests.server.store import PetStore
+
+logger = logging.getLogger(__name__)
+
+
+class _PetStoreRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "PetStoreStandIn/1.0"
+    disable_nagle_algorithm = True
+
+    def _dispatch(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        parts = urlsplit(self.path)
+        headers = {key.lower(): value for key, value in self.headers.items()}
+
+        status, response_headers, payload = self.server.app.handle(
+            self.command, parts.path, parts.query, headers, body
+        )
+
+        self.send_response(status)
+        for key, value in response_headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if payload:
+            self.wfile.write(payload)
+
+    do_GET = _dispatch
+    do_POST = _dispatch
+    do_PUT = _dispatch
+    do_DELETE = _dispatch
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(format, *args)
+
+
+class _ThreadingPetStoreHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, address, app: PetStoreApp):
+        super().__init__(address, _PetStoreRequestHandler)
+        self.app = app
+
+
+class PetStoreServer:
+    """In-process Petstore stand-in listening on a local port in a background thread."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, app: Optional[PetStoreApp] = None):
+        self.app = app or PetStoreApp()
+        self._host = host
+        self._port = port
+        self._httpd: Optional[_ThreadingPetStoreHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def store(self) -> PetStore:
+        return self.app.store
+
+    @property
+    def faults(self) -> FaultInjector:
+        return self.app.faults
+
+    @property
+    def port(self) -> int:
+        if self._httpd is None:
+            raise RuntimeError("PetStoreServer is not running")
+        return self._httpd.server_address[1]
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self._host}:{self.port}/v2"
+
+    def start(self) -> "PetStoreServer":
+        self._httpd = _ThreadingPetStoreHTTPServer((self._host, self._port), self.app)
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            name="petstore-stand-in",
+            daemon=True
+        )
+        self._thread.start()
+        logger.info("Petstore stand-in listening on %s", self.base_url)
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is None:
+            return
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread.join()
+        self._httpd = None
+        self._thread = None
+
+    def __enter__(self) -> "PetStoreServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,98 @@
+import copy
+import itertools
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+FIRST_GENERATED_ID = 2 ** 62
+
+
+class PetStore:
+    """Thread-safe in-memory pet storage with status and tag-name indexes.
+
+    Stored records are never mutated in place, so returned dicts are safe to
+    serialize without holding the lock; callers must treat them as read-only.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._pets: Dict[int, Dict[str, Any]] = {}
+        self._by_status: Dict[str, Set[int]] = defaultdict(set)
+        self._by_tag: Dict[str, Set[int]] = defaultdict(set)
+        self._ids = itertools.count(FIRST_GENERATED_ID)
+
+    def __len__(self) -> int:
+        return len(self._pets)
+
+    def _index(self, pet_id: int, pet: Dict[str, Any]) -> None:
+        status = pet.get("status")
+        if status is not None:
+            self._by_status[status].add(pet_id)
+        for tag in pet.get("tags") or []:
+            name = tag.get("name")
+            if name is not None:
+                self._by_tag[name].add(pet_id)
+
+    def _unindex(self, pet_id: int, pet: Dict[str, Any]) -> None:
+        status = pet.get("status")
+        if status is not None:
+            self._by_status[status].discard(pet_id)
+        for tag in pet.get("tags") or []:
+            name = tag.get("name")
+            if name is not None:
+                self._by_tag[name].discard(pet_id)
+
+    def upsert(self, pet: Dict[str, Any]) -> Dict[str, Any]:
+        pet = copy.deepcopy(pet)
+        with self._lock:
+            pet_id = pet.get("id")
+            if not pet_id:
+                pet_id = next(self._ids)
+                pet["id"] = pet_id
+            previous = self._pets.get(pet_id)
+            if previous is not None:
+                self._unindex(pet_id, previous)
+            self._pets[pet_id] = pet
+            self._index(pet_id, pet)
+            return pet
+
+    def get(self, pet_id: int) -> Optional[Dict[str, Any]]:
+        return self._pets.get(pet_id)
+
+    def update_fields(self, pet_id: int, **fields: Any) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            pet = self._pets.get(pet_id)
+            if pet is None:
+                return None
+            self._unindex(pet_id, pet)
+            pet = {**pet, **{key: value for key, value in fields.items() if value is not None}}
+            self._pets[pet_id] = pet
+            self._index(pet_id, pet)
+            return pet
+
+    def delete(self, pet_id: int) -> bool:
+        with self._lock:
+            pet = self._pets.pop(pet_id, None)
+            if pet is None:
+                return False
+            self._unindex(pet_id, pet)
+            return True
+
+    def _collect(self, index: Dict[str, Set[int]], keys: Iterable[str]) -> List[Dict[str, Any]]:
+        with self._lock:
+            ids: Set[int] = set()
+            for key in keys:
+                ids |= index.get(key, set())
+            return [self._pets[pet_id] for pet_id in sorted(ids)]
+
+    def find_by_status(self, statuses: Iterable[str]) -> List[Dict[str, Any]]:
+        return self._collect(self._by_status, statuses)
+
+    def find_by_tags(self, tags: Iterable[str]) -> List[Dict[str, Any]]:
+        return self._collect(self._by_tag, tags)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pets.clear()
+            self._by_status.clear()
+            self._by_tag.clear()
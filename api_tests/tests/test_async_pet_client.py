@@ -0,0 +1,63 @@
+import asyncio
+import pytest
+from pathlib import Path
+
+from api_tests.api.async_pet_client import AsyncPetClient
+from api_tests.models.pet import Pet
+from api_tests.models.api_response import ApiResponse
+from api_tests.utils.assertions import assert_status_code, assert_response_schema
+
+
+@pytest.mark.regression
+class TestAsyncPetClient:
+
+    async def test_add_and_get_pets_concurrently(self, async_api_client: AsyncPetClient, sample_pet: Pet):
+        pets = [
+            sample_pet.model_copy(update={"id": sample_pet.id * 100 + index, "name": f"Async Dog {index}"})
+            for index in range(20)
+        ]
+
+        add_responses = await asyncio.gather(*(async_api_client.add_pet(pet) for pet in pets))
+        for response in add_responses:
+            assert_status_code(response, 200)
+
+        get_responses = await asyncio.gather(*(async_api_client.get_pet_by_id(pet.id) for pet in pets))
+        for pet, response in zip(pets, get_responses):
+            assert_status_code(response, 200)
+            pet_response = assert_response_schema(response, Pet)
+            assert pet_response.id == pet.id
+            assert pet_response.name == pet.name
+
+    async def test_get_pet_by_id_not_found(self, async_api_client: AsyncPetClient):
+        response = await async_api_client.get_pet_by_id(999999)
+        assert_status_code(response, 404)
+
+    async def test_update_pet_with_form(self, async_api_client: AsyncPetClient, sample_pet: Pet):
+        add_response = await async_api_client.add_pet(sample_pet)
+        assert_status_code(add_response, 200)
+
+        response = await async_api_client.update_pet_with_form(
+            pet_id=sample_pet.id,
+            name="Async Form Name",
+            status="pending"
+        )
+        assert_status_code(response, 200)
+
+        get_response = await async_api_client.get_pet_by_id(sample_pet.id)
+        updated_pet = assert_response_schema(get_response, Pet)
+        assert updated_pet.name == "Async Form Name"
+        assert updated_pet.status == "pending"
+
+    async def test_upload_image_with_file(self, async_api_client: AsyncPetClient, sample_pet: Pet):
+        add_response = await async_api_client.add_pet(sample_pet)
+        assert_status_code(add_response, 200)
+
+        image_path = Path(__file__).parent / "test_data" / "test_image.png"
+        response = await async_api_client.upload_image(
+            pet_id=sample_pet.id,
+            file_path=str(image_path),
+            additional_metadata="Async metadata"
+        )
+        assert_status_code(response, 200)
+        api_response = assert_response_schema(response, ApiResponse)
+        assert api_response.code == 200
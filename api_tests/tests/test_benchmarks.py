@@ -0,0 +1,73 @@
+from typing import Optional
+
+import pytest
+
+from api_tests.benchmarks.harness import BenchmarkResult, compare, measure
+from api_tests.benchmarks.suite import BENCHMARKS, BenchmarkContext
+
+
+def result(name: str, ops_per_sec: float, relative: Optional[float] = None) -> BenchmarkResult:
+    return BenchmarkResult(name, ops_per_sec, 1e6 / ops_per_sec, 0.0, 0.0, 1, relative)
+
+
+@pytest.mark.regression
+class TestBenchmarks:
+
+    def test_measure_reports_throughput_and_allocations(self):
+        measured = measure("list_build", lambda: [0] * 1000, min_time=0.01, repeat=2)
+
+        assert measured.ops_per_sec > 0
+        assert measured.us_per_op == pytest.approx(1e6 / measured.ops_per_sec)
+        assert measured.peak_bytes_per_op >= 8000
+        assert measured.retained_bytes_per_op < 1000
+        assert measured.relative > 0
+        assert measure("list_build", lambda: [0] * 1000, min_time=0.01, repeat=2, normalize=False).relative is None
+
+    def test_compare_flags_regressions_beyond_threshold(self):
+        baselines = {
+            "fast": {"ops_per_sec": 1000.0},
+            "slow": {"ops_per_sec": 1000.0},
+            "lenient": {"ops_per_sec": 1000.0, "threshold": 0.5},
+        }
+        comparisons = compare(
+            [result("fast", 1200.0), result("slow", 700.0), result("lenient", 700.0), result("new", 5.0)],
+            baselines,
+            threshold=0.2
+        )
+
+        assert {comparison.name: comparison.regressed for comparison in comparisons} == {
+            "fast": False, "slow": True, "lenient": False
+        }
+        assert comparisons[1].change == pytest.approx(-0.3)
+
+    def test_compare_normalizes_against_calibration(self):
+        baselines = {"steady": {"ops_per_sec": 1000.0, "relative": 2.0}, "raw": {"ops_per_sec": 1000.0}}
+
+        # The whole machine is 40% slower: raw ops/sec drop, the ratio to the calibration workload does not.
+        comparisons = compare([result("steady", 600.0, relative=2.0), result("raw", 600.0, relative=2.0)],
+                              baselines, threshold=0.2)
+
+        assert [(comparison.normalized, comparison.regressed) for comparison in comparisons] == [
+            (True, False), (False, True)
+        ]
+        slower = compare([result("steady", 1000.0, relative=1.4)], baselines, threshold=0.2)[0]
+        assert slower.regressed and slower.change == pytest.approx(-0.3)
+
+    def test_every_benchmark_runs(self):
+        context = BenchmarkContext()
+        try:
+            for name, factory in BENCHMARKS.items():
+                factory(context)()
+        finally:
+            context.close()
+
+    def test_transport_benchmark_compares_http1_and_http2(self):
+        pytest.importorskip("hypercorn")
+        from api_tests.benchmarks.transports import run
+
+        results = {result.name: result for result in run(requests=20, concurrency=4, tls=False)}
+
+        assert set(results) == {"requests_http1", "httpx_http1", "httpx_http2"}
+        assert results["httpx_http2"].connections == 1
+        assert results["httpx_http2"].http_versions == {"HTTP/2": 20}
+        assert all(result.requests_per_sec > 0 for result in results.values())
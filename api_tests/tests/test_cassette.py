@@ -0,0 +1,74 @@
+import pytest
+
+from api_tests.api.cassette import Cassette, CassetteMiss
+from api_tests.api.pet_client import PetClient
+from api_tests.models.pet import Pet
+from api_tests.server.http_server import PetStoreServer
+from api_tests.utils.assertions import assert_status_code
+
+
+def record_lifecycle(client: PetClient, pet: Pet) -> None:
+    assert_status_code(client.add_pet(pet), 200)
+    assert_status_code(client.get_pet_by_id(pet.id), 200)
+    assert_status_code(client.delete_pet(pet.id), 200)
+    assert_status_code(client.get_pet_by_id(pet.id), 404)
+    assert_status_code(client.find_pets_by_status(["available", "sold"]), 200)
+
+
+@pytest.mark.regression
+class TestCassette:
+
+    def test_record_then_replay_without_network(self, petstore: PetStoreServer, sample_pet: Pet, tmp_path):
+        path = tmp_path / "pets.cassette"
+        recorder = PetClient(base_url=petstore.base_url, cassette=Cassette(str(path), mode="record"))
+        record_lifecycle(recorder, sample_pet)
+        recorder.close()
+
+        replay = Cassette(str(path), mode="replay")
+        client = PetClient(base_url="http://127.0.0.1:9/v2", cassette=replay)
+        record_lifecycle(client, sample_pet)
+        assert replay.stats() == {"interactions": 5, "hits": 5, "misses": 0, "recorded": 0}
+        assert_status_code(client.get_pet_by_id(sample_pet.id), 404)
+        client.close()
+
+    def test_replay_miss_is_strict(self, petstore: PetStoreServer, sample_pet: Pet, tmp_path):
+        path = tmp_path / "pets.cassette"
+        recorder = PetClient(base_url=petstore.base_url, cassette=Cassette(str(path), mode="record"))
+        assert_status_code(recorder.add_pet(sample_pet), 200)
+        recorder.close()
+
+        client = PetClient(base_url=petstore.base_url, cassette=Cassette(str(path), mode="replay"))
+        changed = sample_pet.model_copy(update={"name": "different body"})
+        with pytest.raises(CassetteMiss):
+            client.add_pet(changed)
+        lenient = Cassette(str(path), mode="replay", match_on=("method", "url"))
+        client.cassette = lenient
+        assert_status_code(client.add_pet(changed), 200)
+        client.close()
+
+    def test_query_order_and_ignored_params(self, tmp_path):
+        cassette = Cassette(str(tmp_path / "unused.cassette"), mode="record", ignore_params=("ts",))
+        first = cassette.key("GET", "http://a/v2/pet/findByStatus?status=sold&status=available&ts=1",
+                             "http://a/v2", "body")
+        second = cassette.key("get", "http://b:8080/v2/pet/findByStatus?ts=2&status=available&status=sold",
+                              "http://b:8080/v2", "body")
+        assert first != second
+        assert cassette.match_key(first) == cassette.match_key(second)
+        assert cassette.match_key(first) == "GET /pet/findByStatus?status=available&status=sold body"
+
+    def test_new_episodes_records_only_misses(self, petstore: PetStoreServer, sample_pet: Pet, tmp_path):
+        path = tmp_path / "pets.cassette"
+        recorder = PetClient(base_url=petstore.base_url, cassette=Cassette(str(path), mode="record"))
+        assert_status_code(recorder.add_pet(sample_pet), 200)
+        recorder.close()
+
+        episodes = Cassette(str(path), mode="new_episodes")
+        client = PetClient(base_url=petstore.base_url, cassette=episodes)
+        requests_before = petstore.app.request_count
+        assert_status_code(client.add_pet(sample_pet), 200)
+        assert petstore.app.request_count == requests_before
+        assert_status_code(client.get_pet_by_id(sample_pet.id), 200)
+        assert petstore.app.request_count == requests_before + 1
+        client.close()
+
+        assert len(Cassette(str(path), mode="replay")) == 2
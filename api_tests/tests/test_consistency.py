@@ -0,0 +1,89 @@
+import random
+import threading
+import time
+from typing import Generator
+
+import pytest
+
+from api_tests.api.pet_client import PetClient
+from api_tests.server.http_server import PetStoreServer
+from api_tests.utils.consistency import Backoff, ConsistencyTimeout
+from api_tests.utils.pet_pool import PetIdAllocator, build_pet
+
+FAST = Backoff(initial=0.01, maximum=0.05, jitter=0.5)
+
+
+@pytest.fixture
+def client(petstore: PetStoreServer) -> Generator[PetClient, None, None]:
+    """A client of its own, so convergence stats start from zero."""
+    client = PetClient(base_url=petstore.base_url)
+    yield client
+    client.close()
+
+
+def later(seconds: float, action) -> threading.Timer:
+    """Apply a write behind the client's back, the way a lagging replica catches up."""
+    timer = threading.Timer(seconds, action)
+    timer.start()
+    return timer
+
+
+@pytest.mark.regression
+class TestConsistencyWait:
+
+    def test_backoff_grows_to_the_cap_with_jitter(self):
+        steady = Backoff(initial=0.05, maximum=0.3, multiplier=2, jitter=0)
+        jittered = Backoff(initial=0.05, maximum=0.3, multiplier=2, jitter=0.5, rng=random.Random(1))
+
+        assert [steady.delay(attempt) for attempt in range(5)] == pytest.approx([0.05, 0.1, 0.2, 0.3, 0.3])
+        delays = [jittered.delay(3) for _ in range(50)]
+        assert all(0.15 <= delay <= 0.3 for delay in delays)
+        assert len(set(delays)) > 1
+
+    def test_returns_as_soon_as_the_pet_converges(self, client: PetClient, petstore: PetStoreServer,
+                                                   pet_id_allocator: PetIdAllocator):
+        pet = build_pet(pet_id_allocator.next_id())
+        petstore.store.upsert(pet.model_dump())
+        later(0.2, lambda: petstore.store.update_fields(pet.id, status="sold"))
+
+        started = time.perf_counter()
+        converged = client.wait_for_pet(pet.id, lambda fetched: fetched.status == "sold", backoff=FAST)
+        elapsed = time.perf_counter() - started
+
+        assert converged.status == "sold"
+        assert 0.2 <= elapsed < 0.3
+        stats = client.convergence.summary()
+        assert stats["waits"] == 1 and stats["attempts"] > 2
+        assert stats["max_elapsed"] == pytest.approx(elapsed, abs=0.02)
+
+    def test_waits_for_a_missing_pet_to_appear(self, client: PetClient, petstore: PetStoreServer,
+                                                pet_id_allocator: PetIdAllocator):
+        pet = build_pet(pet_id_allocator.next_id())
+        later(0.1, lambda: petstore.store.upsert(pet.model_dump()))
+
+        assert client.wait_for_pet(pet.id, backoff=FAST).name == pet.name
+
+    def test_waits_for_deletion(self, client: PetClient, petstore: PetStoreServer,
+                                pet_id_allocator: PetIdAllocator):
+        pet = build_pet(pet_id_allocator.next_id())
+        petstore.store.upsert(pet.model_dump())
+        later(0.1, lambda: petstore.store.delete(pet.id))
+
+        client.wait_for_pet_absent(pet.id, backoff=FAST)
+
+        assert client.get_pet_by_id(pet.id, use_cache=False).status_code == 404
+
+    def test_deadline_raises_with_the_last_observation(self, client: PetClient, petstore: PetStoreServer,
+                                                        pet_id_allocator: PetIdAllocator):
+        pet = build_pet(pet_id_allocator.next_id())
+        petstore.store.upsert(pet.model_dump())
+
+        started = time.perf_counter()
+        with pytest.raises(ConsistencyTimeout) as timeout:
+            client.wait_for_pet(pet.id, lambda fetched: fetched.status == "sold", timeout=0.3, backoff=FAST)
+        elapsed = time.perf_counter() - started
+
+        assert 0.3 <= elapsed < 0.4
+        assert timeout.value.last.status == "available"
+        assert timeout.value.convergence.attempts > 2
+        assert client.convergence.summary()["timeouts"] == 1
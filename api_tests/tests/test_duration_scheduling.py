@@ -0,0 +1,130 @@
+import json
+
+import pytest
+
+from api_tests.plugins.duration_scheduler import DurationScheduling
+from api_tests.plugins.duration_scheduling import (
+    DurationStore,
+    imbalance,
+    in_order_makespans,
+    lpt_makespans,
+)
+
+
+class FakeConfig:
+
+    def __init__(self, workers: int):
+        self.options = {"tx": [f"{workers}*popen"], "maxschedchunk": None}
+
+    def getvalue(self, name):
+        return self.options[name]
+
+    getoption = getvalue
+
+
+class FakeGateway:
+
+    def __init__(self, worker_id: str):
+        self.id = worker_id
+
+
+class FakeNode:
+
+    def __init__(self, worker_id: str):
+        self.gateway = FakeGateway(worker_id)
+        self.shutting_down = False
+        self.sent = []
+
+    def send_runtest_some(self, indices):
+        self.sent.extend(indices)
+
+    def shutdown(self):
+        self.shutting_down = True
+
+
+def run_schedule(collection, store, workers=2):
+    """Drive the scheduler like DSession does, completing tests in simulated time order."""
+    scheduler = DurationScheduling(FakeConfig(workers), store)
+    nodes = [FakeNode(f"gw{index}") for index in range(workers)]
+    for node in nodes:
+        scheduler.add_node(node)
+        scheduler.add_node_collection(node, collection)
+    scheduler.schedule()
+    clock = {node: 0.0 for node in nodes}
+    while scheduler.has_pending:
+        busy = [node for node in nodes if scheduler.node2pending[node]]
+        finishes = {node: clock[node] + store.estimate(collection[scheduler.node2pending[node][0]]) for node in busy}
+        node = min(busy, key=finishes.get)
+        index = scheduler.node2pending[node][0]
+        clock[node] = finishes[node]
+        scheduler.mark_test_complete(node, index)
+    return scheduler, nodes, clock
+
+
+@pytest.fixture
+def store(tmp_path):
+    return DurationStore(str(tmp_path / "durations.json"), alpha=0.5, default=0.2)
+
+
+@pytest.mark.regression
+class TestDurationScheduling:
+
+    def test_store_round_trips_and_smooths_durations(self, store):
+        store.update("tests/test_a.py::test_one", 1.0)
+        store.update("tests/test_a.py::test_one", 3.0)
+        store.save()
+
+        loaded = DurationStore(str(store.path)).load()
+
+        assert loaded.estimate("tests/test_a.py::test_one") == pytest.approx(2.0)
+        assert json.loads(store.path.read_text()) == {"tests/test_a.py::test_one": 2.0}
+
+    def test_unseen_tests_fall_back_to_related_history(self, store):
+        assert store.estimate("tests/test_a.py::test_new") == 0.2
+
+        store.update("tests/test_a.py::TestX::test_p[1]", 4.0)
+        store.update("tests/test_a.py::TestX::test_other", 2.0)
+        store.update("tests/test_b.py::test_fast", 0.5)
+
+        assert store.estimate("tests/test_a.py::TestX::test_p[2]") == 4.0
+        assert store.estimate("tests/test_a.py::TestX::test_new") == pytest.approx(3.0)
+        assert store.estimate("tests/test_c.py::test_new") == 2.0
+        assert "tests/test_a.py::TestX::test_p[2]" not in store
+
+    def test_corrupt_history_is_ignored(self, store):
+        store.path.write_text("{not json")
+
+        assert len(store.load()) == 0
+
+    def test_lpt_beats_collection_order(self):
+        durations = [1.0] * 6 + [4.0]
+
+        assert max(in_order_makespans(durations, 2)) == 7.0
+        assert max(lpt_makespans(durations, 2)) == 5.0
+        assert imbalance(lpt_makespans(durations, 2)) == 0.0
+        assert imbalance([3.0, 1.0]) == pytest.approx(0.5)
+
+    def test_scheduler_hands_out_longest_tests_first(self, store):
+        collection = [f"tests/test_a.py::test_{index}" for index in range(7)]
+        for index, nodeid in enumerate(collection):
+            store.update(nodeid, 4.0 if index == 6 else 1.0)
+
+        scheduler, nodes, clock = run_schedule(collection, store)
+
+        assert sorted(nodes[0].sent + nodes[1].sent) == list(range(7))
+        assert nodes[0].sent[0] == 6
+        assert max(clock.values()) == 5.0
+        assert all(node.shutting_down for node in nodes)
+        plan = scheduler.plan(2)
+        assert plan["predicted_makespan"] == 5.0
+        assert plan["predicted_default_makespan"] > plan["predicted_makespan"]
+        assert plan["unseen"] == 0
+
+    def test_scheduler_runs_unseen_tests(self, store):
+        collection = ["tests/test_a.py::test_known", "tests/test_b.py::test_new", "tests/test_b.py::test_new2"]
+        store.update(collection[0], 1.0)
+
+        scheduler, nodes, _ = run_schedule(collection, store)
+
+        assert sorted(nodes[0].sent + nodes[1].sent) == [0, 1, 2]
+        assert scheduler.plan(2)["unseen"] == 2
@@ -0,0 +1,43 @@
+import pytest
+
+from api_tests.api.capture import ExchangeCapture
+from api_tests.api.pet_client import PetClient
+from api_tests.models.pet import Pet
+from api_tests.server.http_server import PetStoreServer
+
+
+@pytest.fixture
+def capturing_client(petstore_server: PetStoreServer):
+    client = PetClient(base_url=petstore_server.base_url)
+    capture = ExchangeCapture(capacity=3)
+    client.hooks.append(capture)
+    yield client, capture
+    client.close()
+
+
+@pytest.mark.regression
+class TestExchangeCapture:
+
+    def test_keeps_last_exchanges_per_test(self, capturing_client, request):
+        client, capture = capturing_client
+
+        for pet_id in range(999990, 999995):
+            client.get_pet_by_id(pet_id)
+
+        exchanges = capture.exchanges(request.node.nodeid)
+        assert len(exchanges) == 3
+        assert [timing.url.rsplit("/", 1)[-1] for timing, _ in exchanges] == ["999992", "999993", "999994"]
+
+        capture.discard(request.node.nodeid)
+        assert capture.exchanges(request.node.nodeid) == []
+
+    def test_render_includes_request_and_response(self, capturing_client, sample_pet: Pet, request):
+        client, capture = capturing_client
+
+        client.add_pet(sample_pet)
+        text = capture.render(request.node.nodeid)
+
+        assert f"POST {client.base_url}/pet -> 200" in text
+        assert "> Content-Type: application/json" in text
+        assert f'"name": "{sample_pet.name}"' in text
+        assert f'< {{"id": {sample_pet.id}' in text
@@ -0,0 +1,106 @@
+from typing import Generator
+
+import pytest
+from pydantic import ValidationError
+
+from api_tests.api.async_pet_client import AsyncPetClient
+from api_tests.fuzz.runner import FuzzRunner, pet_fuzzer
+from api_tests.fuzz.schema import SchemaFuzzer
+from api_tests.fuzz.shrink import shrink
+from api_tests.models.pet import Pet
+from api_tests.server import app as petstore_app
+from api_tests.server.http_server import PetStoreServer
+
+
+@pytest.fixture(scope="module")
+def fuzz_server() -> Generator[PetStoreServer, None, None]:
+    """A stand-in of its own, so fuzzed pets never show up in other tests' queries."""
+    server = PetStoreServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.mark.regression
+class TestSchemaFuzzer:
+
+    def test_generated_cases_agree_with_the_schema(self):
+        fuzzer = SchemaFuzzer(Pet, seed=7)
+        cases = list(fuzzer.cases(2000))
+
+        for case in cases:
+            assert fuzzer.is_valid(case.payload) == case.valid
+            if case.valid:
+                Pet.model_validate(case.payload)
+        invalid = [case for case in cases if not case.valid]
+        assert {case.mutation for case in invalid} == {"missing_required", "null_required", "wrong_type"}
+        assert {"name", "photoUrls", "<body>"} <= {case.path for case in invalid}
+        assert any(case.path.startswith("tags[") for case in invalid)
+
+    def test_invalid_required_fields_fail_model_validation(self):
+        fuzzer = SchemaFuzzer(Pet, seed=3)
+
+        for _ in range(200):
+            case = fuzzer.invalid()
+            if case.mutation in ("missing_required", "null_required") and "." not in case.path:
+                with pytest.raises(ValidationError):
+                    Pet.model_validate(case.payload)
+
+    def test_seed_and_overrides(self):
+        first = SchemaFuzzer(Pet, seed=11, overrides={"id": lambda _: 42})
+        second = SchemaFuzzer(Pet, seed=11, overrides={"id": lambda _: 42})
+
+        cases = [first.valid() for _ in range(50)]
+        assert cases == [second.valid() for _ in range(50)]
+        assert {pet["id"] for pet in cases if pet.get("id") is not None} == {42}
+
+    async def test_shrink_finds_a_minimal_reproducer(self):
+        payload = {"name": "abc", "photoUrls": ["u"], "tags": [{"id": 5, "name": "xyz"}, {"name": "b"}]}
+
+        async def fails(value) -> bool:
+            return isinstance(value, dict) and any("x" in (tag.get("name") or "") for tag in value.get("tags", []))
+
+        shrunk, steps = await shrink(payload, fails)
+
+        assert shrunk == {"tags": [{"name": "x"}]}
+        assert steps > 0
+
+
+@pytest.mark.regression
+class TestFuzzRunner:
+
+    async def test_stand_in_handles_fuzzed_pets(self, fuzz_server: PetStoreServer):
+        client = AsyncPetClient(base_url=fuzz_server.base_url)
+        runner = FuzzRunner(client, pet_fuzzer(seed=1), batch_size=100)
+
+        report = await runner.run(600)
+        await client.close()
+
+        assert report.failed == 0, report.format_table()
+        assert report.cases == report.valid + report.invalid == 600
+        assert set(report.statuses) == {200, 405}
+        assert report.statuses[405] == report.invalid
+        assert report.cases_per_sec > 0
+        assert report.generated_per_sec > report.cases_per_sec
+
+    async def test_failures_are_shrunk(self, fuzz_server: PetStoreServer, monkeypatch):
+        validate_pet = petstore_app.validate_pet
+
+        def accepts_nameless_pets(payload):
+            error = validate_pet(payload)
+            return None if error == "name is required" else error
+
+        monkeypatch.setattr(petstore_app, "validate_pet", accepts_nameless_pets)
+        client = AsyncPetClient(base_url=fuzz_server.base_url)
+        runner = FuzzRunner(client, pet_fuzzer(seed=2), invalid_ratio=1.0, max_failures=3)
+
+        report = await runner.run(300)
+        await client.close()
+
+        assert report.failed > 0
+        assert len(report.failures) == 3
+        for failure in report.failures:
+            assert failure.case.path == "name"
+            assert failure.reason == "invalid payload answered with 200"
+            assert failure.shrunk == {}
+            assert failure.shrunk_reason == failure.reason
+        assert report.to_dict()["failures"][0]["shrunk"] == {}
@@ -0,0 +1,57 @@
+import pytest
+
+from api_tests.load.histogram import LatencyHistogram
+from api_tests.load.runner import OPEN_LOOP, LoadConfig, LoadRunner
+from api_tests.server.http_server import PetStoreServer
+
+
+@pytest.mark.regression
+class TestLoadRunner:
+
+    def test_histogram_percentiles_within_precision(self):
+        histogram = LatencyHistogram(significant_digits=2)
+        for value in range(1, 100001):
+            histogram.record(value)
+
+        assert histogram.count == 100000
+        assert histogram.max == 100000
+        for percent, expected in [(50, 50000), (95, 95000), (99, 99000)]:
+            assert abs(histogram.percentile(percent) - expected) / expected < 0.01
+
+    def test_histogram_round_trip_and_merge(self):
+        first, second = LatencyHistogram(), LatencyHistogram()
+        for value in (100, 200, 300):
+            first.record(value)
+        second.record(5000)
+
+        merged = LatencyHistogram.from_dict(first.to_dict())
+        merged.merge(second)
+
+        assert merged.count == 4
+        assert merged.max == 5000
+        assert merged.percentile(50) == 200
+
+    def test_closed_loop_lifecycle(self, petstore_server: PetStoreServer):
+        config = LoadConfig(scenario="pet_lifecycle", users=2, duration=0.5, base_url=petstore_server.base_url)
+
+        report = LoadRunner(config).run().to_dict()
+
+        assert report["iterations"]["count"] > 0
+        assert report["iterations"]["failed"] == 0
+        assert set(report["endpoints"]) == {"POST pet", "GET pet/{id}", "PUT pet", "DELETE pet/{id}"}
+        assert report["endpoints"]["GET pet/{id}"]["count"] == 3 * report["iterations"]["count"]
+
+    def test_open_loop_rate(self, petstore_server: PetStoreServer):
+        config = LoadConfig(
+            scenario="read_missing_pet",
+            mode=OPEN_LOOP,
+            users=4,
+            rate=40,
+            duration=0.5,
+            base_url=petstore_server.base_url
+        )
+
+        report = LoadRunner(config).run().to_dict()
+
+        assert report["iterations"]["count"] == 20
+        assert report["endpoints"]["GET pet/{id}"]["error_rate"] == 0.0
@@ -0,0 +1,106 @@
+import os
+import pytest
+from pathlib import Path
+from typing import List
+
+from api_tests.api.pet_client import PetClient
+from api_tests.config.settings import settings
+from api_tests.models.api_response import ApiResponse
+from api_tests.models.pet import Pet
+from api_tests.server.app import parse_multipart
+from api_tests.server.http_server import PetStoreServer
+from api_tests.utils.assertions import assert_status_code, assert_response_schema
+from api_tests.utils.multipart import MultipartEncoder, sniff_content_type
+from api_tests.utils.pet_pool import PetIdAllocator, build_pet
+
+IMAGE_PATH = Path(__file__).parent / "test_data" / "test_image.png"
+
+
+@pytest.fixture
+def large_file(tmp_path) -> Path:
+    path = tmp_path / "large.bin"
+    path.write_bytes(os.urandom(3 * 1024 * 1024 + 17))
+    return path
+
+
+@pytest.fixture
+def stand_in_pets(petstore: PetStoreServer, pet_id_allocator: PetIdAllocator):
+    """Seed pets straight into the local stand-in, which these tests upload to whatever the target."""
+    def seed(count: int = 1) -> List[Pet]:
+        pets = [build_pet(pet_id_allocator.next_id()) for _ in range(count)]
+        for pet in pets:
+            petstore.store.upsert(pet.model_dump())
+        return pets
+    return seed
+
+
+@pytest.mark.regression
+class TestMultipartUpload:
+
+    def test_sniff_content_type(self):
+        assert sniff_content_type(IMAGE_PATH.read_bytes()[:16], "renamed.bin") == "image/png"
+        assert sniff_content_type(b"\xff\xd8\xff\xe0\x00\x10JFIF", None) == "image/jpeg"
+        assert sniff_content_type(b"RIFF\x00\x00\x00\x00WEBPVP8 ", None) == "image/webp"
+        assert sniff_content_type(b"hello", "notes.txt") == "text/plain"
+        assert sniff_content_type(b"hello", None) == "application/octet-stream"
+
+    def test_encoder_streams_parseable_body(self, large_file: Path):
+        chunks = []
+        with open(large_file, "rb") as f:
+            encoder = MultipartEncoder(
+                fields={"additionalMetadata": "meta \"quoted\""},
+                files={"file": ("large.bin", f, "application/octet-stream")},
+                chunk_size=32 * 1024,
+                on_read=chunks.append
+            )
+            body = b"".join(encoder)
+            assert max(chunks) == 32 * 1024
+            encoder.seek(0)
+            assert encoder.read() == body
+
+        assert len(body) == len(encoder)
+        fields, files = parse_multipart(encoder.content_type, body)
+        assert fields == {"additionalMetadata": "meta \"quoted\""}
+        assert files["file"] == ("large.bin", large_file.read_bytes())
+
+    @pytest.mark.parametrize("use_mmap", [False, True])
+    def test_upload_large_file(self, local_api_client: PetClient, stand_in_pets, large_file: Path,
+                               use_mmap: bool):
+        pet, = stand_in_pets()
+        response = local_api_client.upload_image(pet.id, str(large_file), "big", use_mmap=use_mmap)
+
+        assert_status_code(response, 200)
+        message = assert_response_schema(response, ApiResponse).message
+        assert f"{large_file.stat().st_size} bytes" in message
+        assert "additionalMetadata: big" in message
+
+    def test_retried_upload_rewinds_body(self, petstore: PetStoreServer, stand_in_pets, monkeypatch):
+        pet, = stand_in_pets()
+        monkeypatch.setattr(settings, "RETRY_BACKOFF_FACTOR", 0.01)
+        client = PetClient(base_url=petstore.base_url)
+        petstore.faults.fail_next(1, status=503)
+
+        response = client.upload_image(pet.id, str(IMAGE_PATH))
+        client.close()
+
+        assert_status_code(response, 200)
+        assert f"{IMAGE_PATH.stat().st_size} bytes" in response.json()["message"]
+
+    def test_upload_images_concurrently_with_rate_limit(self, local_api_client: PetClient, stand_in_pets,
+                                                         tmp_path):
+        pets = stand_in_pets(3)
+        paths = {}
+        for pet in pets:
+            path = tmp_path / f"{pet.id}.png"
+            path.write_bytes(IMAGE_PATH.read_bytes() + os.urandom(40 * 1024))
+            paths[pet.id] = [str(path)]
+        result = local_api_client.upload_images(paths, max_bytes_per_second=100 * 1024)
+
+        assert result.ok
+        burst = settings.UPLOAD_CHUNK_SIZE
+        assert result.elapsed >= 0.9 * (result.total_bytes - burst) / (100 * 1024)
+        assert [upload.pet_id for upload in result.uploads] == [pet.id for pet in pets]
+        for upload in result.uploads:
+            assert upload.content_type == "image/png"
+            assert upload.size == os.path.getsize(upload.path)
+            assert upload.throughput > 0
@@ -5,6 +5,8 @@ from api_tests.api.pet_client import PetClient
 from api_tests.models.pet import Pet, Category, Tag
 from api_tests.models.api_response import ApiResponse
 from api_tests.utils.assertions import assert_status_code, assert_response_schema
+from api_tests.utils.pet_pool import PetIdAllocator, build_pet
+from api_tests.utils.scenario import Scenario
 
 @pytest.mark.regression
 class TestPetAPI:
@@ -17,45 +19,34 @@ class TestPetAPI:
         assert pet_response.name == sample_pet.name
         assert pet_response.status == sample_pet.status
     
-    def test_get_pet_by_id(self, api_client: PetClient, sample_pet: Pet):
-        add_response = api_client.add_pet(sample_pet)
-        assert_status_code(add_response, 200)
-        pet_id = add_response.json().get("id")
+    def test_get_pet_by_id(self, api_client: PetClient, existing_pet: Pet):
+        pet_id = existing_pet.id
         
         response = api_client.get_pet_by_id(pet_id)
         assert_status_code(response, 200)
         pet_response = assert_response_schema(response, Pet)
         assert pet_response.id == pet_id
-        assert pet_response.name == sample_pet.name
+        assert pet_response.name == existing_pet.name
     
     def test_get_pet_by_id_not_found(self, api_client: PetClient):
         response = api_client.get_pet_by_id(999999)
         assert_status_code(response, 404)
     
-    def test_update_pet(self, api_client: PetClient, sample_pet: Pet):
-        add_response = api_client.add_pet(sample_pet)
-        assert_status_code(add_response, 200)
-        pet_data = add_response.json()
-        pet_id = pet_data.get("id")
+    def test_update_pet(self, api_client: PetClient, fresh_pet: Pet):
+        pet_id = fresh_pet.id
         
         updated_pet = Pet(
             id=pet_id,
             name="Updated Dog Name",
-            photoUrls=sample_pet.photoUrls,
+            photoUrls=fresh_pet.photoUrls,
             status="sold"
         )
         response = api_client.update_pet(updated_pet)
         assert_status_code(response, 200)
         
-        get_response = api_client.get_pet_by_id(pet_id)
-        updated_pet_response = assert_response_schema(get_response, Pet)
-        assert updated_pet_response.name == "Updated Dog Name"
-        assert updated_pet_response.status == "sold"
+        api_client.wait_for_pet(pet_id, lambda pet: pet.name == "Updated Dog Name" and pet.status == "sold")
     
-    def test_find_pets_by_status(self, api_client: PetClient, sample_pet: Pet):
-        add_response = api_client.add_pet(sample_pet)
-        assert_status_code(add_response, 200)
-        
+    def test_find_pets_by_status(self, api_client: PetClient, existing_pet: Pet):
         response = api_client.find_pets_by_status(["available"])
         assert_status_code(response, 200)
         
@@ -65,20 +56,15 @@ class TestPetAPI:
             assert any(pet.get("status") == "available" for pet in pets)
     
     
-    def test_find_pets_by_tags(self, api_client: PetClient, sample_pet: Pet):
-        add_response = api_client.add_pet(sample_pet)
-        assert_status_code(add_response, 200)
-        
+    def test_find_pets_by_tags(self, api_client: PetClient, existing_pet: Pet):
         response = api_client.find_pets_by_tags(["test-tag"])
         assert_status_code(response, 200)
         
         pets = response.json()
         assert isinstance(pets, list)
     
-    def test_update_pet_with_form(self, api_client: PetClient, sample_pet: Pet):
-        add_response = api_client.add_pet(sample_pet)
-        assert_status_code(add_response, 200)
-        pet_id = add_response.json().get("id")
+    def test_update_pet_with_form(self, api_client: PetClient, fresh_pet: Pet):
+        pet_id = fresh_pet.id
         
         response = api_client.update_pet_with_form(
             pet_id=pet_id,
@@ -87,21 +73,15 @@ class TestPetAPI:
         )
         assert_status_code(response, 200)
         
-        get_response = api_client.get_pet_by_id(pet_id)
-        updated_pet = assert_response_schema(get_response, Pet)
-        assert updated_pet.name == "Form Updated Name"
-        assert updated_pet.status == "pending"
+        api_client.wait_for_pet(pet_id, lambda pet: pet.name == "Form Updated Name" and pet.status == "pending")
     
-    def test_delete_pet(self, api_client: PetClient, sample_pet: Pet):
-        add_response = api_client.add_pet(sample_pet)
-        assert_status_code(add_response, 200)
-        pet_id = add_response.json().get("id")
+    def test_delete_pet(self, api_client: PetClient, fresh_pet: Pet):
+        pet_id = fresh_pet.id
         
         response = api_client.delete_pet(pet_id)
         assert_status_code(response, 200)
         
-        get_response = api_client.get_pet_by_id(pet_id)
-        assert_status_code(get_response, 404)
+        api_client.wait_for_pet_absent(pet_id)
     
     def test_delete_pet_not_found(self, api_client: PetClient):
         response = api_client.delete_pet(999999090903123)
@@ -166,4 +146,21 @@ class TestPetAPI:
         assert_status_code(delete_response, 200)
         
         final_response = api_client.get_pet_by_id(pet_id)
-        assert_status_code(final_response, 404)
\ No newline at end of file
+        assert_status_code(final_response, 404)
+
+    def test_bulk_added_pets_are_verified_concurrently(self, api_client: PetClient,
+                                                       pet_id_allocator: PetIdAllocator):
+        pets = [build_pet(pet_id_allocator.next_id()) for _ in range(4)]
+        verify_steps = [f"verify_{pet.id}" for pet in pets]
+
+        scenario = Scenario("bulk_add_verify")
+        scenario.step("add", PetClient.add_pets, pets=pets, check=lambda result: result.ok)
+        for pet, name in zip(pets, verify_steps):
+            scenario.step(name, PetClient.get_pet_by_id, pet_id=pet.id, use_cache=False, after=["add"],
+                          expect=200, schema=Pet, check=lambda fetched, pet=pet: fetched.name == pet.name)
+        scenario.step("delete", PetClient.delete_pets, pet_ids=[pet.id for pet in pets], after=verify_steps,
+                      check=lambda result: result.ok)
+        result = scenario.run(api_client)
+
+        # Each read depends only on the bulk add, so the longest chain is add -> one read -> delete.
+        assert len(result.critical_path()) == 3
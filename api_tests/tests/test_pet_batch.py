@@ -0,0 +1,79 @@
+import pytest
+
+from api_tests.api.pet_client import PetClient
+from api_tests.models.pet import Pet
+from api_tests.models.pet_batch import PetBatch
+from api_tests.utils.assertions import assert_status_code
+
+RECORDS = [
+    {
+        "id": 1,
+        "name": "doggie",
+        "photoUrls": ["https://example.com/1.jpg"],
+        "category": {"id": 10, "name": "Dogs"},
+        "tags": [{"id": 100, "name": "friendly"}, {"id": 101, "name": "small"}],
+        "status": "available"
+    },
+    {"id": 2, "name": "kitty", "photoUrls": [], "status": "available"},
+    {"id": 3, "name": "parrot", "photoUrls": ["a", "b"], "tags": [{"name": "loud"}], "status": "sold"},
+]
+
+
+@pytest.mark.regression
+class TestPetBatch:
+
+    def test_queries(self):
+        batch = PetBatch.from_records(RECORDS)
+
+        assert len(batch) == 3
+        assert not batch.all_have_status("available")
+        assert batch.any_has_status("sold")
+        assert not batch.any_has_status("pending")
+        assert batch.status_counts() == {"available": 2, "sold": 1}
+        assert batch.any_has_tag("loud")
+        assert not batch.any_has_tag("missing")
+        assert batch.any_has_tag_id(101)
+        assert batch.any_has_category_id(10)
+        assert batch.ids_subset_of([1, 2, 3, 4])
+        assert not batch.ids_subset_of([1, 2])
+        assert batch.contains_ids([3])
+
+    def test_round_trip_to_pets(self):
+        batch = PetBatch.from_records(RECORDS)
+
+        assert batch.to_pets() == [Pet.model_validate(record) for record in RECORDS]
+        assert batch.pet(batch.index_of(3)).tags[0].id is None
+
+    def test_invalid_records(self):
+        records = RECORDS + [{"id": 4, "status": "available"}]
+
+        with pytest.raises(ValueError, match="index 3"):
+            PetBatch.from_records(records)
+        assert len(PetBatch.from_records(records, skip_invalid=True)) == 3
+
+    @pytest.mark.parametrize("bad, error", [
+        ({"id": "7"}, "id is not an int64"),
+        ({"id": 2 ** 63}, "id is not an int64"),
+        ({"tags": [None]}, "tag 0 is not an object"),
+        ({"tags": [{"id": 1.5, "name": "x"}]}, "tag 0 id is not an int64"),
+        ({"category": "Dogs"}, "category is not an object"),
+    ])
+    def test_mistyped_records(self, bad, error):
+        records = RECORDS + [{**RECORDS[1], "id": 4, **bad}]
+
+        with pytest.raises(ValueError, match=f"index 3: {error}"):
+            PetBatch.from_records(records)
+        batch = PetBatch.from_records(records, skip_invalid=True)
+        assert len(batch) == 3
+        assert batch.ids.tolist() == [1, 2, 3]
+
+    def test_from_find_by_status_response(self, local_api_client: PetClient, sample_pet: Pet):
+        assert_status_code(local_api_client.add_pet(sample_pet), 200)
+
+        response = local_api_client.find_pets_by_status(["available"])
+        assert_status_code(response, 200)
+        batch = PetBatch.from_response(response)
+
+        assert batch.all_have_status("available")
+        assert batch.contains_ids([sample_pet.id])
+        assert batch.any_has_tag("test-tag")
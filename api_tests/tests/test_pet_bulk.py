@@ -0,0 +1,52 @@
+import pytest
+
+from api_tests.api.pet_client import PetClient
+from api_tests.models.pet import Pet
+from api_tests.utils.assertions import assert_status_code, assert_response_schema
+
+
+@pytest.fixture
+def bulk_pets(sample_pet: Pet):
+    return [
+        sample_pet.model_copy(update={"id": sample_pet.id * 100 + index, "name": f"Bulk Dog {index}"})
+        for index in range(25)
+    ]
+
+
+@pytest.mark.regression
+class TestPetBulk:
+
+    def test_add_pets_keeps_input_order(self, api_client: PetClient, bulk_pets):
+        result = api_client.add_pets(bulk_pets)
+
+        assert result.ok, f"Failed items: {[item.index for item in result.failures]}"
+        assert len(result) == len(bulk_pets)
+        for pet, item in zip(bulk_pets, result):
+            assert item.item is pet
+            assert_status_code(item.response, 200)
+            assert item.response.json().get("id") == pet.id
+
+    def test_get_pets_collects_per_item_failures(self, api_client: PetClient, bulk_pets):
+        assert api_client.add_pets(bulk_pets).ok
+
+        missing_id = 999999
+        pet_ids = [pet.id for pet in bulk_pets[:5]] + [missing_id]
+        result = api_client.get_pets(pet_ids)
+
+        assert len(result) == len(pet_ids)
+        assert [item.index for item in result.failures] == [5]
+        assert_status_code(result[5].response, 404)
+        for pet, item in zip(bulk_pets[:5], result):
+            pet_response = assert_response_schema(item.response, Pet)
+            assert pet_response.name == pet.name
+
+    def test_delete_pets(self, api_client: PetClient, bulk_pets):
+        assert api_client.add_pets(bulk_pets).ok
+
+        pet_ids = [pet.id for pet in bulk_pets]
+        delete_result = api_client.delete_pets(pet_ids)
+        assert delete_result.ok
+
+        get_result = api_client.get_pets(pet_ids)
+        for item in get_result:
+            assert_status_code(item.response, 404)
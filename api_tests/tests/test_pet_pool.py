@@ -0,0 +1,68 @@
+import pytest
+
+from api_tests.api.pet_client import PetClient
+from api_tests.models.pet import Pet
+from api_tests.utils.assertions import assert_status_code
+from api_tests.utils.pet_pool import ID_RANGE_BASE, ID_RANGE_WIDTH, ID_RUN_SPAN, PetIdAllocator, PetPool, worker_index
+
+
+@pytest.fixture
+def small_pool(local_api_client: PetClient):
+    pool = PetPool(local_api_client, PetIdAllocator(9_000_000, 9_001_000), size=2, refill_size=2).start()
+    yield pool
+    pool.stop()
+
+
+@pytest.mark.regression
+class TestPetPool:
+
+    def test_worker_id_ranges_do_not_overlap(self):
+        assert worker_index("master") == 0
+        assert worker_index("gw11") == 11
+        first, second = PetIdAllocator.for_worker("gw0"), PetIdAllocator.for_worker("gw1")
+        assert ID_RANGE_BASE <= first.start < first.end <= ID_RANGE_BASE + ID_RANGE_WIDTH <= second.start
+        assert first.end - first.start == ID_RUN_SPAN
+        assert second.end <= ID_RANGE_BASE + 2 * ID_RANGE_WIDTH
+
+    def test_concurrent_runs_get_different_slices(self):
+        starts = {PetIdAllocator.for_worker("gw0").start for _ in range(20)}
+        assert len(starts) > 1
+        assert all((start - ID_RANGE_BASE) % ID_RUN_SPAN == 0 for start in starts)
+
+    def test_allocator_range_exhausted(self):
+        allocator = PetIdAllocator(10, 12)
+        assert [allocator.next_id(), allocator.next_id()] == [10, 11]
+        with pytest.raises(RuntimeError):
+            allocator.next_id()
+
+    def test_leased_pets_exist_and_are_returned(self, small_pool: PetPool, local_api_client: PetClient):
+        with small_pool.lease() as first, small_pool.lease() as second:
+            assert first.id != second.id
+            assert_status_code(local_api_client.get_pet_by_id(first.id), 200)
+
+        with small_pool.lease() as again:
+            assert again.id in {first.id, second.id}
+        assert small_pool.stats()["leases"] == 3
+
+    def test_dirty_lease_is_reset(self, small_pool: PetPool, local_api_client: PetClient):
+        with pytest.raises(AssertionError):
+            with small_pool.lease() as pet:
+                local_api_client.update_pet_with_form(pet.id, name="changed")
+                raise AssertionError
+
+        assert local_api_client.get_pet_by_id(pet.id).json()["name"] == pet.name
+        assert small_pool.resets == 1
+
+    def test_fresh_pets_are_refilled_and_deleted(self, small_pool: PetPool, local_api_client: PetClient):
+        taken = [small_pool.take_fresh() for _ in range(4)]
+
+        assert len({pet.id for pet in taken}) == 4
+        for pet in taken:
+            small_pool.discard(pet)
+        small_pool.stop()
+        for pet in taken:
+            assert_status_code(local_api_client.get_pet_by_id(pet.id), 404)
+
+    def test_existing_and_fresh_fixtures(self, api_client: PetClient, existing_pet: Pet, fresh_pet: Pet):
+        assert_status_code(api_client.get_pet_by_id(existing_pet.id), 200)
+        assert_status_code(api_client.delete_pet(fresh_pet.id), 200)
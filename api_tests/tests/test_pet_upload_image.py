@@ -10,10 +10,8 @@ from api_tests.utils.assertions import assert_status_code, assert_response_schem
 @pytest.mark.regression
 class TestPetUploadImage:
     
-    def test_upload_image_with_file(self, api_client: PetClient, sample_pet: Pet):
-        add_response = api_client.add_pet(sample_pet)
-        assert_status_code(add_response, 200)
-        pet_id = add_response.json().get("id")
+    def test_upload_image_with_file(self, api_client: PetClient, fresh_pet: Pet):
+        pet_id = fresh_pet.id
         
         image_path = Path(__file__).parent / "test_data" / "test_image.png"
         response = api_client.upload_image(
@@ -0,0 +1,67 @@
+import pytest
+import requests
+
+from api_tests.api.pet_client import PetClient
+from api_tests.config.settings import settings
+from api_tests.models.pet import Pet, Tag
+from api_tests.server.http_server import PetStoreServer
+from api_tests.utils.assertions import assert_status_code, assert_response_schema
+
+
+@pytest.fixture
+def fast_retry_client(petstore: PetStoreServer, monkeypatch):
+    monkeypatch.setattr(settings, "RETRY_BACKOFF_FACTOR", 0.01)
+    client = PetClient(base_url=petstore.base_url)
+    yield client
+    client.close()
+
+
+@pytest.mark.regression
+class TestPetStoreServer:
+
+    def test_find_by_status_uses_current_status(self, local_api_client: PetClient, sample_pet: Pet):
+        assert_status_code(local_api_client.add_pet(sample_pet), 200)
+        assert_status_code(local_api_client.update_pet_with_form(sample_pet.id, status="sold"), 200)
+
+        available = local_api_client.find_pets_by_status(["available"]).json()
+        sold = local_api_client.find_pets_by_status(["sold"]).json()
+        assert sample_pet.id not in {pet["id"] for pet in available}
+        assert sample_pet.id in {pet["id"] for pet in sold}
+
+    def test_find_by_tags(self, local_api_client: PetClient, sample_pet: Pet):
+        tagged_pet = sample_pet.model_copy(update={"tags": [Tag(id=7, name="stand-in-tag")]})
+        assert_status_code(local_api_client.add_pet(tagged_pet), 200)
+
+        response = local_api_client.find_pets_by_tags(["stand-in-tag", "unknown-tag"])
+        assert_status_code(response, 200)
+        pets = [Pet.model_validate(pet) for pet in response.json()]
+        assert [pet.id for pet in pets] == [sample_pet.id]
+
+    def test_add_pet_invalid_body(self, local_api_client: PetClient):
+        response = local_api_client.post("pet", json_data={"name": 42, "photoUrls": []})
+        assert_status_code(response, 405)
+
+    def test_retries_injected_errors(self, petstore: PetStoreServer, fast_retry_client: PetClient, sample_pet: Pet):
+        assert_status_code(fast_retry_client.add_pet(sample_pet), 200)
+        petstore.faults.fail_next(2, status=503, retry_after=0)
+        requests_before = petstore.app.request_count
+
+        response = fast_retry_client.get_pet_by_id(sample_pet.id)
+
+        assert_status_code(response, 200)
+        assert petstore.app.request_count - requests_before == 3
+        assert_response_schema(response, Pet)
+
+    def test_gives_up_after_max_retries(self, petstore: PetStoreServer, fast_retry_client: PetClient):
+        petstore.faults.fail_next(10, status=500)
+
+        with pytest.raises(requests.exceptions.RetryError):
+            fast_retry_client.get_pet_by_id(1)
+
+    def test_injected_latency(self, petstore: PetStoreServer, local_api_client: PetClient):
+        petstore.faults.configure(latency=0.05)
+
+        response = local_api_client.get_pet_by_id(999999)
+
+        assert_status_code(response, 404)
+        assert response.elapsed.total_seconds() >= 0.05
@@ -0,0 +1,140 @@
+import json
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+import requests
+
+from api_tests.api.pet_client import PetClient
+from api_tests.server.http_server import PetStoreServer
+from api_tests.utils.rate_limit import SharedRateLimiter, parse_limits
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+WORKER = """
+import json, sys, time
+from api_tests.utils.rate_limit import SharedRateLimiter
+
+limiter = SharedRateLimiter(sys.argv[1], rate=50)
+stamps = []
+for _ in range(10):
+    limiter.acquire("pet/{id}")
+    stamps.append(time.time())
+print(json.dumps(stamps))
+"""
+
+
+@pytest.fixture
+def state_path(tmp_path) -> str:
+    return str(tmp_path / "rate_limit.json")
+
+
+@pytest.mark.regression
+class TestSharedRateLimiter:
+
+    def test_parse_limits(self):
+        assert parse_limits(" pet/{id}=5, /pet/findByStatus=2.5,") == {"pet/{id}": 5.0, "pet/findByStatus": 2.5}
+        with pytest.raises(ValueError, match="TEMPLATE=RATE"):
+            parse_limits("pet/{id}")
+
+    def test_per_template_limits(self, state_path: str):
+        limiter = SharedRateLimiter(state_path, limits={"pet/{id}": 20}, burst=2)
+
+        started = time.perf_counter()
+        for _ in range(6):
+            limiter.acquire("pet/{id}")
+            limiter.acquire("pet/findByStatus")
+        elapsed = time.perf_counter() - started
+        limiter.close()
+
+        # Two go out as a burst; the other four are paced at 20/s. findByStatus is unlimited.
+        assert elapsed == pytest.approx(4 / 20, abs=0.06)
+        assert limiter.stats()["acquired"] == 6
+
+    def test_workers_share_one_bucket(self, state_path: str):
+        workers = [
+            subprocess.Popen([sys.executable, "-c", WORKER, state_path], cwd=REPO_ROOT, stdout=subprocess.PIPE, text=True)
+            for _ in range(3)
+        ]
+        stamps = sorted(stamp for worker in workers for stamp in json.loads(worker.communicate()[0]))
+
+        assert all(worker.returncode == 0 for worker in workers)
+        assert len(stamps) == 30
+        # 30 slots at 50/s across all three processes, not 50/s each.
+        assert stamps[-1] - stamps[0] >= 29 / 50 - 0.02
+        assert min(later - earlier for earlier, later in zip(stamps, stamps[1:])) >= 1 / 50 - 0.01
+
+    def test_throttle_pauses_other_workers_and_halves_the_rate(self, state_path: str):
+        first = SharedRateLimiter(state_path, rate=100)
+        second = SharedRateLimiter(state_path, rate=100)
+        first.acquire("pet")
+
+        first.throttle("pet", retry_after=0.3)
+        waited = second.acquire("pet")
+        started = time.perf_counter()
+        second.acquire("pet")
+        interval = time.perf_counter() - started
+        first.close()
+        second.close()
+
+        assert waited == pytest.approx(0.3, abs=0.05)
+        assert interval == pytest.approx(2 / 100, abs=0.01)
+        assert first.stats()["throttled"] == 1
+
+
+@pytest.mark.regression
+class TestRateLimitedClient:
+
+    def test_paced_workers_stay_under_the_server_limit(self, petstore: PetStoreServer, state_path: str):
+        petstore.faults.configure(rate_limit=60, rate_limit_burst=5)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            statuses = list(executor.map(lambda _: requests.get(f"{petstore.base_url}/pet/1").status_code, range(60)))
+        assert 429 in statuses
+        petstore.faults.reset()
+        petstore.faults.configure(rate_limit=60, rate_limit_burst=5)
+
+        clients = [PetClient(base_url=petstore.base_url, rate_limiter=SharedRateLimiter(state_path, rate=50))
+                   for _ in range(4)]
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            statuses = list(executor.map(lambda index: clients[index % 4].get_pet_by_id(1).status_code, range(60)))
+        elapsed = time.perf_counter() - started
+        for client in clients:
+            client.close()
+
+        assert 429 not in statuses
+        assert petstore.faults.rate_limited == 0
+        assert elapsed == pytest.approx(59 / 50, abs=0.3)
+
+    def test_429_is_retried_after_retry_after(self, petstore: PetStoreServer, state_path: str):
+        petstore.faults.fail_next(1, status=429, retry_after=1)
+        client = PetClient(base_url=petstore.base_url, rate_limiter=SharedRateLimiter(state_path, rate=100))
+
+        started = time.perf_counter()
+        response = client.get_pet_by_id(1)
+        elapsed = time.perf_counter() - started
+        stats = client.rate_limiter.stats()
+        client.close()
+
+        assert response.status_code != 429
+        assert stats["throttled"] == 1
+        assert 1.0 <= elapsed < 1.5
+
+    def test_429_on_an_unlimited_template_waits_for_retry_after(self, petstore: PetStoreServer, state_path: str):
+        petstore.faults.fail_next(2, status=429, retry_after=1)
+        limiter = SharedRateLimiter(state_path, limits={"pet/findByStatus": 5})
+        client = PetClient(base_url=petstore.base_url, rate_limiter=limiter)
+
+        started = time.perf_counter()
+        response = client.get_pet_by_id(1)
+        elapsed = time.perf_counter() - started
+        stats = limiter.stats()
+        client.close()
+
+        assert response.status_code != 429
+        assert stats["throttled"] == 2
+        assert stats["waited"] >= 1.9
+        assert 2.0 <= elapsed < 2.5
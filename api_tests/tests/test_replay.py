@@ -0,0 +1,111 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from api_tests.api.pet_client import PetClient
+from api_tests.load.replay import LogRecord, Replayer, ReplayError, parse_speed, read_log
+from api_tests.server.http_server import PetStoreServer
+from api_tests.utils.pet_pool import PetIdAllocator, build_pet
+
+
+def write_log(path: Path, entries: List[Dict[str, Any]]) -> str:
+    path.write_text("".join(json.dumps(entry) + "\n" for entry in entries))
+    return str(path)
+
+
+def lifecycle(pet_id: int, timestamp: float, step: float = 0.001) -> List[Dict[str, Any]]:
+    """What the stand-in answers for one pet created, renamed, read and deleted."""
+    pet = build_pet(pet_id).model_dump(exclude_none=True)
+    renamed = dict(pet, name="Replayed")
+    calls = [
+        ("POST", "/v2/pet", pet, 200),
+        ("PUT", "/v2/pet", renamed, 200),
+        ("GET", f"/v2/pet/{pet_id}", None, 200),
+        ("DELETE", f"/v2/pet/{pet_id}", None, 200),
+        ("GET", f"/v2/pet/{pet_id}", None, 404),
+    ]
+    return [{"timestamp": timestamp + index * step, "method": method, "path": path, "body": body,
+             "status": status, "latency_ms": 2.0}
+            for index, (method, path, body, status) in enumerate(calls)]
+
+
+@pytest.mark.regression
+class TestReplayLog:
+
+    def test_records_are_parsed_and_sorted(self, tmp_path: Path):
+        log = write_log(tmp_path / "access.jsonl", [
+            {"timestamp": "2026-01-01T00:00:01Z", "method": "get", "path": "/v2/pet/7", "status": 200},
+            {"timestamp": "2026-01-01T00:00:00Z", "method": "POST", "path": "/v2/pet", "body": {"id": 7}},
+            {"timestamp": 1767225602, "method": "GET", "path": "/v2/pet/findByStatus?status=sold", "key": "report"},
+        ])
+
+        records = read_log(log, strip_prefix="/v2")
+
+        assert [record.line for record in records] == [2, 1, 3]
+        assert [record.key for record in records] == ["pet/7", "pet/7", "report"]
+        assert records[1].endpoint == "GET pet/{id}"
+        assert records[2].timestamp - records[0].timestamp == 2
+        with pytest.raises(ReplayError, match="unsupported method PATCH"):
+            LogRecord.parse(4, {"timestamp": 0, "method": "PATCH", "path": "pet"})
+        with pytest.raises(ReplayError, match="'path'"):
+            LogRecord.parse(5, {"timestamp": 0, "method": "GET"})
+
+    def test_parse_speed(self):
+        assert parse_speed("original") == 1.0
+        assert parse_speed("2.5x") == 2.5
+        assert parse_speed("max") is None
+
+
+@pytest.mark.regression
+class TestReplayer:
+
+    def test_per_key_order_is_kept_across_workers(self, local_api_client: PetClient, petstore: PetStoreServer,
+                                                  tmp_path: Path, pet_id_allocator: PetIdAllocator):
+        # Jittered latency lets later requests overtake earlier ones unless they share a worker.
+        petstore.faults.configure(latency_jitter=0.005)
+        entries = []
+        for index in range(20):
+            entries += lifecycle(pet_id_allocator.next_id(), timestamp=index * 0.0001)
+        records = read_log(write_log(tmp_path / "access.jsonl", entries), strip_prefix="/v2")
+
+        report = Replayer(local_api_client, speed=None, workers=4).run(records)
+
+        assert report.requests == 100
+        assert report.divergent == 0, report.format_table()
+        assert set(report.replayed) == {"POST pet", "PUT pet", "GET pet/{id}", "DELETE pet/{id}"}
+
+    def test_status_and_latency_divergences_are_reported(self, local_api_client: PetClient, tmp_path: Path,
+                                                         pet_id_allocator: PetIdAllocator):
+        missing = pet_id_allocator.next_id()
+        log = write_log(tmp_path / "access.jsonl", [
+            {"timestamp": 0, "method": "GET", "path": f"/v2/pet/{missing}", "status": 200, "latency_ms": 0.001},
+            {"timestamp": 0, "method": "GET", "path": "/v2/pet/findByStatus?status=sold", "status": 200,
+             "latency_ms": 10_000},
+        ])
+
+        report = Replayer(local_api_client, speed=None, workers=2).run(read_log(log, strip_prefix="/v2"))
+        data = report.to_dict()
+
+        assert report.diverged
+        assert data["status_divergences"] == 1
+        assert data["examples"] == [{"line": 1, "endpoint": "GET pet/{id}", "path": f"pet/{missing}",
+                                     "recorded": 200, "replayed": "404"}]
+        assert data["latency"]["GET pet/{id}"]["verdict"] == "slower"
+        assert data["latency"]["GET pet/findByStatus"]["verdict"] == "faster"
+        assert "recorded 200, replayed 404" in report.format_table()
+
+    @pytest.mark.parametrize("speed, expected", [(1.0, 0.3), (2.0, 0.15)])
+    def test_recorded_gaps_are_scaled(self, local_api_client: PetClient, tmp_path: Path, speed: float,
+                                      expected: float):
+        log = write_log(tmp_path / "access.jsonl", [
+            {"timestamp": 100 + index * 0.03, "method": "GET", "path": "/v2/pet/findByStatus?status=sold",
+             "status": 200}
+            for index in range(11)
+        ])
+
+        report = Replayer(local_api_client, speed=speed, workers=2).run(read_log(log, strip_prefix="/v2"))
+
+        assert report.elapsed == pytest.approx(expected, abs=0.05)
+        assert report.lag.percentile(99) < 50_000
@@ -0,0 +1,74 @@
+import pytest
+
+from api_tests.api.async_pet_client import AsyncPetClient
+from api_tests.api.instrumentation import RequestHook
+from api_tests.api.pet_client import PetClient
+from api_tests.config.settings import settings
+from api_tests.server.http_server import PetStoreServer
+
+
+class CollectingHook(RequestHook):
+
+    def __init__(self):
+        self.timings = []
+
+    def on_request(self, timing, response):
+        self.timings.append(timing)
+
+
+@pytest.fixture
+def timed_client(petstore: PetStoreServer, monkeypatch):
+    monkeypatch.setattr(settings, "RETRY_BACKOFF_FACTOR", 0.01)
+    client = PetClient(base_url=petstore.base_url)
+    hook = CollectingHook()
+    client.hooks.append(hook)
+    yield client, hook
+    client.close()
+
+
+@pytest.mark.regression
+class TestRequestTimings:
+
+    def test_timing_breakdown(self, timed_client, request):
+        client, hook = timed_client
+
+        client.get_pet_by_id(999999)
+        client.get_pet_by_id(999998)
+
+        first, second = hook.timings
+        assert first.endpoint == second.endpoint == "pet/{id}"
+        assert first.method == "GET"
+        assert first.status == 404
+        assert first.test == request.node.nodeid
+        assert first.connect > 0
+        assert second.connect == 0, "keep-alive connection should be reused"
+        assert first.total >= first.connect + first.ttfb
+
+    def test_retries_are_counted(self, petstore: PetStoreServer, timed_client):
+        client, hook = timed_client
+        petstore.faults.fail_next(2, status=503)
+
+        response = client.find_pets_by_status(["available"])
+
+        assert response.status_code == 200
+        assert hook.timings[-1].endpoint == "pet/findByStatus"
+        assert hook.timings[-1].retries == 2
+
+    def test_hook_without_on_request_cannot_be_instantiated(self):
+        class Incomplete(RequestHook):
+            pass
+
+        with pytest.raises(TypeError, match="on_request"):
+            Incomplete()
+
+    async def test_async_client_timing(self, petstore: PetStoreServer):
+        hook = CollectingHook()
+        async with AsyncPetClient(base_url=petstore.base_url) as client:
+            client.hooks.append(hook)
+            await client.get_pet_by_id(999999)
+
+        timing = hook.timings[0]
+        assert timing.endpoint == "pet/{id}"
+        assert timing.status == 404
+        assert timing.connect > 0
+        assert timing.total >= timing.ttfb > 0
@@ -0,0 +1,78 @@
+import time
+import pytest
+
+from api_tests.api.pet_client import PetClient
+from api_tests.api.resilience import CircuitBreaker, CircuitOpenError, HedgePolicy, Resilience, RetryBudget
+from api_tests.models.pet import Pet
+from api_tests.server.http_server import PetStoreServer
+from api_tests.utils.assertions import assert_status_code
+
+
+def resilient_client(server: PetStoreServer, **parts) -> PetClient:
+    return PetClient(base_url=server.base_url, resilience=Resilience(**parts))
+
+
+@pytest.mark.regression
+class TestResilience:
+
+    def test_retry_budget_retries_idempotent_requests(self, petstore: PetStoreServer, sample_pet: Pet):
+        budget = RetryBudget(backoff_base=0.001)
+        client = resilient_client(petstore, budget=budget)
+        assert_status_code(client.add_pet(sample_pet), 200)
+        petstore.faults.fail_next(2, status=503)
+
+        assert_status_code(client.get_pet_by_id(sample_pet.id), 200)
+        assert budget.retries == 2
+        client.close()
+
+    def test_post_is_not_retried(self, petstore: PetStoreServer, sample_pet: Pet):
+        budget = RetryBudget(backoff_base=0.001)
+        client = resilient_client(petstore, budget=budget)
+        petstore.faults.fail_next(1, status=503)
+
+        assert_status_code(client.add_pet(sample_pet), 503)
+        assert budget.retries == 0
+        client.close()
+
+    def test_exhausted_budget_stops_retrying(self, petstore: PetStoreServer):
+        budget = RetryBudget(ratio=0.0, reserve=1.0, backoff_base=0.001)
+        client = resilient_client(petstore, budget=budget)
+        petstore.faults.fail_next(3, status=503)
+
+        assert_status_code(client.get_pet_by_id(1), 503)
+        assert budget.stats() == {"requests": 1, "retries": 1, "exhausted": 1, "tokens": 0.0}
+        client.close()
+
+    def test_circuit_breaker_opens_per_template(self, petstore: PetStoreServer, sample_pet: Pet):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+        client = resilient_client(petstore, breaker=breaker)
+        assert_status_code(client.add_pet(sample_pet), 200)
+        petstore.faults.fail_next(2, status=500)
+
+        client.get_pet_by_id(sample_pet.id)
+        client.get_pet_by_id(sample_pet.id)
+        with pytest.raises(CircuitOpenError):
+            client.get_pet_by_id(sample_pet.id)
+        assert_status_code(client.find_pets_by_status(["available"]), 200)
+
+        time.sleep(0.06)
+        assert_status_code(client.get_pet_by_id(sample_pet.id), 200)
+        assert breaker.state("pet/{id}") == CircuitBreaker.CLOSED
+        assert breaker.stats()["pet/{id}"] == {"state": "closed", "opens": 1, "rejected": 1}
+        client.close()
+
+    def test_slow_get_is_hedged(self, petstore: PetStoreServer, sample_pet: Pet):
+        hedge = HedgePolicy(percentile=50, min_samples=5, max_ratio=1.0)
+        client = resilient_client(petstore, hedge=hedge)
+        assert_status_code(client.add_pet(sample_pet), 200)
+        for _ in range(5):
+            client.get_pet_by_id(sample_pet.id)
+        petstore.faults.delay_next(seconds=1.0)
+
+        started = time.perf_counter()
+        assert_status_code(client.get_pet_by_id(sample_pet.id), 200)
+
+        assert time.perf_counter() - started < 0.5
+        assert hedge.stats()["hedged"] == 1
+        assert hedge.hedge_wins == 1
+        client.close()
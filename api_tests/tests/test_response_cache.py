@@ -0,0 +1,75 @@
+import pytest
+
+from api_tests.api.cache import ResponseCache
+from api_tests.api.pet_client import PetClient
+from api_tests.models.pet import Pet
+from api_tests.server.http_server import PetStoreServer
+from api_tests.utils.assertions import assert_status_code, assert_response_schema
+
+
+@pytest.fixture
+def cached_client(petstore_server: PetStoreServer):
+    client = PetClient(base_url=petstore_server.base_url, cache=ResponseCache(max_entries=2, ttl=60))
+    yield client
+    client.close()
+
+
+@pytest.mark.regression
+class TestResponseCache:
+
+    def test_repeated_get_served_from_cache(self, cached_client: PetClient, petstore_server: PetStoreServer,
+                                            sample_pet: Pet):
+        assert_status_code(cached_client.add_pet(sample_pet), 200)
+        first = cached_client.get_pet_by_id(sample_pet.id)
+        requests_before = petstore_server.app.request_count
+
+        second = cached_client.get_pet_by_id(sample_pet.id)
+
+        assert second is first
+        assert petstore_server.app.request_count == requests_before
+        assert cached_client.cache.hits == 1
+
+    def test_bypass_switch(self, cached_client: PetClient, petstore_server: PetStoreServer, sample_pet: Pet):
+        assert_status_code(cached_client.add_pet(sample_pet), 200)
+        cached_client.get_pet_by_id(sample_pet.id)
+        requests_before = petstore_server.app.request_count
+
+        cached_client.get_pet_by_id(sample_pet.id, use_cache=False)
+
+        assert petstore_server.app.request_count == requests_before + 1
+
+    def test_writes_invalidate_pet_and_finders(self, cached_client: PetClient, sample_pet: Pet):
+        assert_status_code(cached_client.add_pet(sample_pet), 200)
+        cached_client.get_pet_by_id(sample_pet.id)
+        cached_client.find_pets_by_status(["available"])
+
+        assert_status_code(cached_client.update_pet_with_form(sample_pet.id, name="Cached Name", status="sold"), 200)
+
+        pet = assert_response_schema(cached_client.get_pet_by_id(sample_pet.id), Pet)
+        assert pet.name == "Cached Name"
+        available = cached_client.find_pets_by_status(["available"]).json()
+        assert sample_pet.id not in {item["id"] for item in available}
+
+        assert_status_code(cached_client.delete_pet(sample_pet.id), 200)
+        assert_status_code(cached_client.get_pet_by_id(sample_pet.id), 404)
+
+    def test_expired_entry_revalidated_with_etag(self, petstore_server: PetStoreServer, sample_pet: Pet):
+        client = PetClient(base_url=petstore_server.base_url, cache=ResponseCache(ttl=0))
+        assert_status_code(client.add_pet(sample_pet), 200)
+        first = client.get_pet_by_id(sample_pet.id)
+
+        second = client.get_pet_by_id(sample_pet.id)
+
+        assert second is first
+        assert client.cache.revalidations == 1
+        assert client.cache.stats()["hits"] == 0
+        client.close()
+
+    def test_lru_eviction(self, cached_client: PetClient):
+        for pet_id in (999991, 999992, 999993):
+            cached_client.get_pet_by_id(pet_id)
+        for status in ("available", "pending", "sold"):
+            cached_client.find_pets_by_status([status])
+
+        assert len(cached_client.cache) == 2
+        assert cached_client.cache.misses == 6
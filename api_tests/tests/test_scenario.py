@@ -0,0 +1,113 @@
+import time
+from typing import List
+
+import pytest
+
+from api_tests.api.pet_client import PetClient
+from api_tests.models.pet import Pet
+from api_tests.server.http_server import PetStoreServer
+from api_tests.utils.pet_pool import PetIdAllocator
+from api_tests.utils.scenario import From, Scenario, ScenarioError, ScenarioFailed
+
+
+def pause(seconds: float):
+    def action(client: PetClient, **inputs) -> float:
+        time.sleep(seconds)
+        return seconds
+    return action
+
+
+def new_pets(allocator: PetIdAllocator, count: int) -> List[Pet]:
+    return [Pet(id=allocator.next_id(), name=f"Scenario Pet {index}", photoUrls=[], status="pending")
+            for index in range(count)]
+
+
+@pytest.mark.regression
+class TestScenario:
+
+    def test_bulk_write_is_verified_concurrently(self, local_api_client: PetClient, petstore: PetStoreServer,
+                                                 pet_id_allocator: PetIdAllocator):
+        pets = new_pets(pet_id_allocator, 3)
+        scenario = Scenario("bulk_verify")
+        for index, pet in enumerate(pets):
+            scenario.step(f"create_{index}", PetClient.add_pet, pet=pet, expect=200,
+                          output=lambda response: response.json()["id"])
+            scenario.step(f"verify_{index}", PetClient.get_pet_by_id, pet_id=From(f"create_{index}"),
+                          expect=200, schema=Pet, check=lambda fetched, pet=pet: fetched.name == pet.name)
+            scenario.step(f"delete_{index}", PetClient.delete_pet, pet_id=From(f"create_{index}"),
+                          after=[f"verify_{index}"], expect=200)
+        petstore.faults.delay_next(9, seconds=0.1)
+
+        result = scenario.run(local_api_client)
+
+        assert result.passed
+        assert result.value("verify_2").id == pets[2].id
+        assert result.sum_of_steps >= 0.9
+        assert result.elapsed < 0.6
+        assert len(result.critical_path()) == 3
+
+    def test_independent_steps_overlap(self, local_api_client: PetClient):
+        scenario = (Scenario("overlap")
+                    .step("a", pause(0.2))
+                    .step("b", pause(0.2))
+                    .step("c", pause(0.2), after=["a", "b"]))
+
+        result = scenario.run(local_api_client)
+
+        assert result.steps["b"].started < result.steps["a"].finished
+        assert result.steps["c"].started >= max(result.steps["a"].finished, result.steps["b"].finished)
+        assert result.elapsed == pytest.approx(0.4, abs=0.15)
+
+    def test_inputs_are_resolved_from_dependencies(self, local_api_client: PetClient):
+        seen = []
+        scenario = (Scenario("inputs")
+                    .step("one", lambda client: 1)
+                    .step("two", lambda client, value: seen.append(value) or value * 2,
+                          value=From("one", lambda one: one + 1)))
+
+        result = scenario.run(local_api_client)
+
+        assert seen == [2]
+        assert result.value("two") == 4
+        assert result.dependencies["two"] == ["one"]
+
+    def test_failed_step_skips_dependents_only(self, local_api_client: PetClient):
+        scenario = (Scenario("failing")
+                    .step("missing", PetClient.get_pet_by_id, pet_id=999999, expect=200)
+                    .step("dependent", PetClient.get_pet_by_id, pet_id=From("missing"))
+                    .step("transitive", pause(0), after=["dependent"])
+                    .step("independent", PetClient.get_pet_by_id, pet_id=999999, expect=404))
+
+        with pytest.raises(ScenarioFailed) as failure:
+            scenario.run(local_api_client)
+
+        result = failure.value.result
+        assert [step.name for step in result.failures] == ["missing"]
+        assert result.steps["dependent"].status == "skipped"
+        assert result.steps["transitive"].blocked_by == "dependent"
+        assert result.steps["independent"].status == "passed"
+        assert isinstance(failure.value.__cause__, AssertionError)
+        assert "missing" in str(failure.value)
+
+    def test_false_check_fails_the_step(self, local_api_client: PetClient):
+        scenario = Scenario("check").step("value", lambda client: 3, check=lambda value: value > 5)
+
+        result = scenario.run(local_api_client, raise_on_failure=False)
+
+        assert not result.passed
+        assert "Check of step 'value' failed" in str(result.steps["value"].error)
+
+    def test_invalid_graphs_are_rejected_before_running(self, local_api_client: PetClient):
+        calls = []
+        unknown = Scenario("unknown").step("a", lambda client: calls.append("a"), after=["nope"])
+        cycle = (Scenario("cycle")
+                 .step("a", lambda client, value: calls.append("a"), value=From("b"))
+                 .step("b", lambda client: calls.append("b"), after=["a"]))
+
+        with pytest.raises(ScenarioError, match="unknown"):
+            unknown.run(local_api_client)
+        with pytest.raises(ScenarioError, match="cycle"):
+            cycle.run(local_api_client)
+        with pytest.raises(ScenarioError, match="Duplicate"):
+            cycle.step("a", lambda client: None)
+        assert calls == []
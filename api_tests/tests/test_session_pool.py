@@ -0,0 +1,115 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from api_tests.api.pet_client import PetClient
+from api_tests.api.session_pool import PooledHTTPAdapter, SessionPool
+from api_tests.api.transport import RequestsTransport
+from api_tests.server.http_server import PetStoreServer
+
+
+def pooled_client(server: PetStoreServer, mode: str = "thread_local", size: int = 8, **adapter_options) -> PetClient:
+    adapter = PooledHTTPAdapter(max_retries=0, **adapter_options)
+    sessions = SessionPool(adapter, mode=mode, size=size, timeout=5.0)
+    return PetClient(base_url=server.base_url, sessions=sessions, transport=RequestsTransport(sessions))
+
+
+@pytest.mark.regression
+class TestSessionPool:
+
+    def test_sequential_requests_reuse_one_connection(self, petstore: PetStoreServer):
+        client = pooled_client(petstore)
+
+        for _ in range(5):
+            client.get_pet_by_id(999999)
+
+        stats = client.pool_stats()
+        assert stats["requests"] == 5
+        assert stats["connections_opened"] == 1
+        assert stats["connections_reused"] == 4
+        assert stats["reuse_ratio"] == pytest.approx(0.8)
+        client.close()
+
+    def test_thread_local_sessions_share_connections(self, petstore: PetStoreServer):
+        client = pooled_client(petstore, pool_maxsize=4)
+        sessions = set()
+
+        def fetch(_):
+            sessions.add(id(client.session))
+            return client.get_pet_by_id(999999).status_code
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            assert set(executor.map(fetch, range(40))) == {404}
+
+        stats = client.pool_stats()
+        assert 1 < len(sessions) <= 4
+        assert stats["sessions_created"] == len(sessions) + 1
+        assert stats["connections_opened"] <= 4
+        assert stats["connections_discarded"] == 0
+        client.close()
+
+    def test_small_connection_pool_discards_connections(self, petstore: PetStoreServer):
+        client = pooled_client(petstore, pool_maxsize=1)
+        petstore.faults.delay_next(4, seconds=0.1)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: client.get_pet_by_id(999999), range(4)))
+
+        stats = client.pool_stats()
+        assert stats["connections_opened"] == 4
+        assert stats["connections_discarded"] == 3
+        client.close()
+
+    def test_blocking_connection_pool_waits(self, petstore: PetStoreServer):
+        client = pooled_client(petstore, pool_maxsize=1, pool_block=True)
+        petstore.faults.delay_next(2, seconds=0.1)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(lambda _: client.get_pet_by_id(999999), range(2)))
+
+        stats = client.pool_stats()
+        assert stats["connections_opened"] == 1
+        assert stats["connection_waits"] >= 1
+        assert stats["connection_wait_ms"] > 50
+        client.close()
+
+    def test_checkout_mode_caps_sessions(self, petstore: PetStoreServer):
+        client = pooled_client(petstore, mode="checkout", size=2)
+        petstore.faults.delay_next(4, seconds=0.1)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            statuses = set(executor.map(lambda _: client.get_pet_by_id(999999).status_code, range(4)))
+
+        assert statuses == {404}
+
+        stats = client.pool_stats()
+        assert stats["sessions_created"] == 2
+        assert stats["checkouts"] == 4
+        assert stats["session_waits"] >= 1
+        client.close()
+
+    def test_checkout_times_out_when_pool_is_exhausted(self):
+        pool = SessionPool(PooledHTTPAdapter(), mode="checkout", size=1, timeout=0.05)
+
+        with pool.checkout():
+            errors = []
+            worker = threading.Thread(target=lambda: errors.append(_try_checkout(pool)))
+            worker.start()
+            worker.join()
+
+        assert isinstance(errors[0], TimeoutError)
+        assert pool.stats()["session_waits"] == 1
+        pool.close()
+
+    def test_unknown_mode_is_rejected(self):
+        with pytest.raises(ValueError):
+            SessionPool(PooledHTTPAdapter(), mode="shared")
+
+
+def _try_checkout(pool: SessionPool):
+    try:
+        with pool.checkout():
+            return None
+    except TimeoutError as error:
+        return error
@@ -0,0 +1,70 @@
+import sys
+import types
+
+import pytest
+
+from api_tests.benchmarks.startup import PROBES, StartupResult, regressions, run_probe
+from api_tests.utils.lazy import lazy_exports
+
+
+@pytest.fixture
+def lazy_package(monkeypatch):
+    package = types.ModuleType("lazy_pkg")
+    package.__path__ = []
+    submodule = types.ModuleType("lazy_pkg.things")
+    submodule.Thing = object()
+    monkeypatch.setitem(sys.modules, "lazy_pkg", package)
+    monkeypatch.setitem(sys.modules, "lazy_pkg.things", submodule)
+    package.__getattr__, package.__dir__ = lazy_exports("lazy_pkg", {"Thing": ".things"})
+    return package, submodule
+
+
+@pytest.mark.regression
+class TestLazyExports:
+
+    def test_names_resolve_on_first_access_and_are_cached(self, lazy_package):
+        package, submodule = lazy_package
+
+        assert "Thing" not in vars(package)
+        assert package.Thing is submodule.Thing
+        assert vars(package)["Thing"] is submodule.Thing
+        assert "Thing" in dir(package)
+
+    def test_unknown_names_raise_attribute_error(self, lazy_package):
+        package, _ = lazy_package
+
+        with pytest.raises(AttributeError, match="Missing"):
+            package.Missing
+
+
+@pytest.mark.regression
+class TestStartup:
+
+    @pytest.mark.parametrize("name", ["import_api_conftest", "import_ui_conftest"])
+    def test_conftests_do_not_import_heavy_modules(self, name: str):
+        result = run_probe(PROBES[name], repeat=1)
+
+        assert result.forbidden_loaded == [], result.loaded
+
+    def test_regressions_report_slowdowns_and_forbidden_imports(self):
+        results = [
+            StartupResult("fast", seconds=1.0, runs=[1.0], loaded=[]),
+            StartupResult("slow", seconds=1.5, runs=[1.5], loaded=[]),
+            StartupResult("heavy", seconds=0.1, runs=[0.1], loaded=["httpx"], forbidden_loaded=["httpx"]),
+        ]
+        baselines = {"fast": {"seconds": 1.0}, "slow": {"seconds": 1.0}, "heavy": {"seconds": 1.0}}
+
+        problems = regressions(results, baselines, threshold=0.3)
+
+        assert problems == ["slow is +50% slower than its 1.000s baseline", "heavy imports httpx"]
+        assert regressions(results[1:2], {"slow": {"seconds": 1.0, "threshold": 0.6}}, threshold=0.3) == []
+
+    def test_slowdowns_within_the_floor_pass(self):
+        results = [StartupResult("small", seconds=0.21, runs=[0.21], loaded=[])]
+        baselines = {"small": {"seconds": 0.15}}
+
+        assert regressions(results, baselines, threshold=0.3, floor=0.1) == []
+        assert regressions(results, baselines, threshold=0.3, floor=0.05) == [
+            "small is +40% slower than its 0.150s baseline"
+        ]
+        assert regressions(results, {"small": {"seconds": 0.15, "floor": 0.01}}, threshold=0.3, floor=0.1)
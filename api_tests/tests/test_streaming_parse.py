@@ -0,0 +1,85 @@
+import json
+import uuid
+import pytest
+import requests
+from pydantic import ValidationError
+
+from api_tests.api.pet_client import PetClient
+from api_tests.models.pet import Pet
+from api_tests.server.http_server import PetStoreServer
+from api_tests.utils.json_stream import JsonArraySplitter, iter_json_array
+
+DOCUMENT = json.dumps([
+    {"id": 1, "name": "a, [b] {c}", "photoUrls": ["x\\\"]"], "tags": [{"id": 2, "name": "é"}]},
+    [1, [2, 3]],
+    "plain, string",
+    42,
+    None,
+]).encode()
+
+
+@pytest.fixture
+def streaming_status(petstore: PetStoreServer, local_api_client: PetClient):
+    status = f"streaming-{uuid.uuid4().hex[:8]}"
+    for index in range(25):
+        pet = Pet(name=f"stream-{index}", photoUrls=[f"https://example.com/{index}.jpg"], status=status)
+        petstore.store.upsert(pet.model_dump(exclude_none=True))
+    return status
+
+
+@pytest.mark.regression
+class TestJsonArraySplitter:
+
+    def test_split_at_every_offset(self):
+        expected = json.loads(DOCUMENT)
+        for offset in range(len(DOCUMENT) + 1):
+            elements = list(iter_json_array([DOCUMENT[:offset], DOCUMENT[offset:]]))
+            assert [json.loads(element) for element in elements] == expected
+
+    def test_byte_by_byte(self):
+        chunks = [DOCUMENT[index:index + 1] for index in range(len(DOCUMENT))]
+        assert [json.loads(element) for element in iter_json_array(chunks)] == json.loads(DOCUMENT)
+
+    def test_empty_array(self):
+        assert list(iter_json_array([b"  [ ", b"]\n"])) == []
+
+    def test_rejects_non_array(self):
+        with pytest.raises(ValueError):
+            JsonArraySplitter().feed(b'{"code": 1}')
+
+    def test_rejects_truncated_array(self):
+        with pytest.raises(ValueError):
+            list(iter_json_array([b'[{"id": 1}, {"id"']))
+
+
+@pytest.mark.regression
+class TestStreamingParse:
+
+    def test_streamed_pets_match_eager_parse(self, local_api_client: PetClient, streaming_status: str):
+        eager = [Pet.model_validate(pet) for pet in local_api_client.find_pets_by_status([streaming_status]).json()]
+
+        streamed = list(local_api_client.iter_pets_by_status([streaming_status], batch_size=7))
+
+        assert len(streamed) == 25
+        assert streamed == eager
+
+    def test_first_match_short_circuits(self, local_api_client: PetClient, streaming_status: str):
+        pets = local_api_client.iter_pets_by_status([streaming_status])
+
+        assert any(pet.name == "stream-0" for pet in pets)
+        pets.close()
+        assert local_api_client.get_pet_by_id(0).status_code == 404
+
+    def test_invalid_records(self, petstore: PetStoreServer, local_api_client: PetClient, streaming_status: str):
+        petstore.store.upsert({"name": "no photos", "status": streaming_status})
+
+        with pytest.raises(ValidationError):
+            list(local_api_client.iter_pets_by_status([streaming_status]))
+        valid = list(local_api_client.iter_pets_by_status([streaming_status], skip_invalid=True))
+        assert len(valid) == 25
+
+    def test_error_status_raises(self, petstore: PetStoreServer, local_api_client: PetClient):
+        petstore.faults.fail_next(status=400)
+
+        with pytest.raises(requests.HTTPError):
+            list(local_api_client.iter_pets_by_tags(["any-tag"]))
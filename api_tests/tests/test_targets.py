@@ -0,0 +1,70 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from api_tests.api.instrumentation import RequestTiming
+from api_tests.config.settings import parse_targets
+from api_tests.plugins.targets import TargetAggregator
+
+API_TESTS = Path(__file__).resolve().parents[1]
+
+
+def timing(url: str, total: float, status: int = 200) -> RequestTiming:
+    return RequestTiming(method="GET", url=url, endpoint="pet/{id}", status=status, total=total)
+
+
+@pytest.mark.regression
+class TestTargets:
+
+    def test_parse_targets(self):
+        targets = parse_targets("eu=https://eu.example.com/v2, https://us.example.com/v2 ,staging")
+
+        assert targets == {"eu": "https://eu.example.com/v2", "us.example.com": "https://us.example.com/v2",
+                           "staging": ""}
+        assert parse_targets("") == {}
+        with pytest.raises(ValueError, match="duplicate"):
+            parse_targets("eu=https://a.example.com,eu=https://b.example.com")
+
+    def test_requests_are_attributed_by_base_url(self):
+        aggregator = TargetAggregator()
+        aggregator.register("eu", "http://127.0.0.1:8001/v2/")
+        aggregator.register("us", "http://127.0.0.1:8002/v2")
+
+        aggregator.on_request(timing("http://127.0.0.1:8001/v2/pet/1", 0.010), None)
+        aggregator.on_request(timing("http://127.0.0.1:8002/v2/pet/1", 0.030, status=503), None)
+        aggregator.on_request(timing("http://127.0.0.1:8001/v20/pet/1", 0.5), None)
+        aggregator.record_outcome("eu", "passed")
+        report = aggregator.report()["targets"]
+
+        assert report["eu"]["count"] == 1 and report["eu"]["passed"] == 1
+        assert report["us"]["errors"] == 1
+        assert report["us"]["endpoints"]["GET pet/{id}"]["p95_ms"] == pytest.approx(30, rel=0.01)
+        table = "\n".join(aggregator.format_table())
+        assert "p95 ms by endpoint" in table and "eu" in table and "us" in table
+
+    def test_suite_runs_against_each_target(self, tmp_path: Path):
+        report_path = tmp_path / "targets.json"
+        env = dict(os.environ, LOCAL_PETSTORE="true", BASE_URLS="eu,us")
+
+        completed = subprocess.run(
+            [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", "tests/test_pet_api.py",
+             "-k", "test_add_pet or test_get_pet_by_id_not_found", f"--html={tmp_path / 'report.html'}",
+             f"--targets-report={report_path}", f"--request-timings={tmp_path / 'timings.json'}"],
+            cwd=API_TESTS,
+            env=env,
+            capture_output=True,
+            text=True
+        )
+
+        assert completed.returncode == 0, completed.stdout[-2000:]
+        assert "6 passed" in completed.stdout
+        assert "targets side by side" in completed.stdout
+        targets = json.loads(report_path.read_text())["targets"]
+        assert set(targets) == {"eu", "us"}
+        for summary in targets.values():
+            assert summary["passed"] == 3 and summary["failed"] == 0
+            assert "POST pet" in summary["endpoints"]
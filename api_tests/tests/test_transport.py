@@ -0,0 +1,102 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+import requests
+from urllib3.util.retry import Retry
+
+from api_tests.api.pet_client import PetClient
+from api_tests.api.httpx_transport import HttpxTransport
+from api_tests.api.transport import RequestsTransport, Transport
+from api_tests.config.settings import settings
+from api_tests.models.pet import Pet
+from api_tests.server.asgi import H2PetStoreServer
+from api_tests.utils.assertions import assert_status_code
+
+pytest.importorskip("hypercorn")
+pytest.importorskip("h2")
+
+TEST_DATA = Path(__file__).parent / "test_data"
+
+
+@pytest.fixture(scope="module")
+def h2_server():
+    server = H2PetStoreServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def h2_client(h2_server: H2PetStoreServer):
+    client = PetClient(base_url=h2_server.base_url, transport=HttpxTransport(prior_knowledge=True))
+    yield client
+    client.close()
+    h2_server.faults.reset()
+
+
+@pytest.mark.regression
+class TestTransport:
+
+    def test_transport_follows_settings(self, api_client: PetClient):
+        expected = HttpxTransport if settings.TRANSPORT == "httpx" else RequestsTransport
+        assert isinstance(api_client.transport, expected)
+        assert api_client.pool_stats()["transport"] == settings.TRANSPORT
+
+    def test_pet_lifecycle_over_http2(self, h2_client: PetClient, sample_pet: Pet):
+        response = h2_client.add_pet(sample_pet)
+        assert_status_code(response, 200)
+        assert response.http_version == "HTTP/2"
+        assert response.json()["id"] == sample_pet.id
+
+        assert_status_code(h2_client.update_pet_with_form(sample_pet.id, name="Renamed", status="sold"), 200)
+        fetched = h2_client.get_pet_by_id(sample_pet.id)
+        assert fetched.json()["name"] == "Renamed"
+        assert sample_pet.id in [pet.id for pet in h2_client.iter_pets_by_status(["sold"])]
+
+        assert_status_code(h2_client.upload_image(sample_pet.id, str(TEST_DATA / "test_image.png")), 200)
+
+        assert_status_code(h2_client.delete_pet(sample_pet.id), 200)
+        assert_status_code(h2_client.get_pet_by_id(sample_pet.id), 404)
+
+    def test_concurrent_requests_share_one_connection(self, h2_server: H2PetStoreServer, h2_client: PetClient):
+        h2_server.faults.delay_next(16, seconds=0.1)
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            statuses = set(executor.map(lambda _: h2_client.get_pet_by_id(999999).status_code, range(16)))
+
+        stats = h2_client.pool_stats()
+        assert statuses == {404}
+        assert stats["connections"] == 1
+        assert stats["http_versions"] == {"HTTP/2": 16}
+
+    def test_status_retries_match_the_requests_transport(self, h2_server: H2PetStoreServer, h2_client: PetClient):
+        h2_client.transport.retry = Retry(total=2, status_forcelist=[503], backoff_factor=0)
+        h2_server.faults.fail_next(2, status=503)
+
+        assert_status_code(h2_client.get_pet_by_id(999999), 404)
+        assert h2_client.pool_stats()["retries"] == 2
+
+        h2_server.faults.fail_next(3, status=503)
+        with pytest.raises(requests.exceptions.RetryError):
+            h2_client.get_pet_by_id(999999)
+
+    def test_connection_errors_are_raised_as_requests_errors(self):
+        client = PetClient(base_url="http://127.0.0.1:9/v2", transport=HttpxTransport(prior_knowledge=True))
+
+        with pytest.raises(requests.ConnectionError):
+            client.get_pet_by_id(1)
+        client.close()
+
+    def test_unsupported_options_are_rejected(self):
+        transport = HttpxTransport()
+
+        with pytest.raises(TypeError):
+            transport.request("GET", "http://127.0.0.1:9/", cert="client.pem")
+        transport.close()
+
+    def test_transport_without_request_cannot_be_instantiated(self):
+        class Incomplete(Transport):
+            name = "incomplete"
+
+        with pytest.raises(TypeError, match="request"):
+            Incomplete()
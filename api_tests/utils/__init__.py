@@ -1,3 +1,19 @@
-from .assertions import assert_status_code, assert_response_schema
+from typing import TYPE_CHECKING
 
-__all__ = ["assert_status_code", "assert_response_schema"]
+from .lazy import lazy_exports
+
+_EXPORTS = {
+    "assert_status_code": ".assertions",
+    "assert_response_schema": ".assertions",
+    "endpoint_template": ".endpoints",
+    "iter_json_array": ".json_stream",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .assertions import assert_status_code, assert_response_schema
+    from .endpoints import endpoint_template
+    from .json_stream import iter_json_array
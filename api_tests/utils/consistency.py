@@ -0,0 +1,119 @@
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from api_tests.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ConsistencyTimeout(AssertionError):
+    """The observed state did not converge before the deadline; ``last`` is the final observation."""
+
+    def __init__(self, message: str, last: Any, convergence: "Convergence"):
+        super().__init__(message)
+        self.last = last
+        self.convergence = convergence
+
+
+@dataclass
+class Convergence:
+    """How a wait went: the converged value, attempts made and seconds until convergence."""
+
+    value: Any
+    attempts: int
+    elapsed: float
+    slept: float
+
+
+class ConvergenceStats:
+    """Thread-safe totals over every wait a client has made."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.waits = 0
+        self.timeouts = 0
+        self.attempts = 0
+        self.total_elapsed = 0.0
+        self.max_elapsed = 0.0
+
+    def record(self, convergence: Convergence, converged: bool = True) -> None:
+        with self._lock:
+            self.waits += 1
+            self.timeouts += 0 if converged else 1
+            self.attempts += convergence.attempts
+            self.total_elapsed += convergence.elapsed
+            self.max_elapsed = max(self.max_elapsed, convergence.elapsed)
+
+    def summary(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "waits": self.waits,
+                "timeouts": self.timeouts,
+                "attempts": self.attempts,
+                "mean_elapsed": self.total_elapsed / self.waits if self.waits else 0.0,
+                "max_elapsed": self.max_elapsed,
+            }
+
+
+class Backoff:
+    """Exponential delays with jitter: attempt ``n`` waits ``initial * multiplier**n``, capped at
+    ``maximum`` and scaled down by up to ``jitter`` so concurrent pollers spread out."""
+
+    def __init__(
+        self,
+        initial: Optional[float] = None,
+        maximum: Optional[float] = None,
+        multiplier: Optional[float] = None,
+        jitter: Optional[float] = None,
+        rng: Optional[random.Random] = None
+    ):
+        self.initial = settings.CONSISTENCY_INITIAL_DELAY if initial is None else initial
+        self.maximum = settings.CONSISTENCY_MAX_DELAY if maximum is None else maximum
+        self.multiplier = settings.CONSISTENCY_BACKOFF if multiplier is None else multiplier
+        self.jitter = settings.CONSISTENCY_JITTER if jitter is None else jitter
+        self.random = rng or random.Random()
+
+    def delay(self, attempt: int) -> float:
+        delay = min(self.maximum, self.initial * self.multiplier ** attempt)
+        return delay * (1 - self.jitter * self.random.random())
+
+
+def wait_until(
+    observe: Callable[[], Any],
+    converged: Callable[[Any], bool],
+    timeout: Optional[float] = None,
+    backoff: Optional[Backoff] = None,
+    description: str = "state"
+) -> Tuple[Any, Convergence]:
+    """Call ``observe`` until ``converged`` accepts its result or ``timeout`` seconds have passed.
+
+    The first observation is made immediately and the last one no later than
+    the deadline. Raises ConsistencyTimeout with the last observation.
+    """
+    timeout = settings.CONSISTENCY_TIMEOUT if timeout is None else timeout
+    backoff = backoff or Backoff()
+    started = time.monotonic()
+    deadline = started + timeout
+    attempts, slept = 0, 0.0
+    while True:
+        observed = observe()
+        attempts += 1
+        now = time.monotonic()
+        convergence = Convergence(value=observed, attempts=attempts, elapsed=now - started, slept=slept)
+        if converged(observed):
+            if attempts > 1:
+                logger.info("%s converged after %.3fs (%d attempts)", description, convergence.elapsed, attempts)
+            return observed, convergence
+        if now >= deadline:
+            raise ConsistencyTimeout(
+                f"{description} did not converge within {timeout}s ({attempts} attempts); last: {observed!r}",
+                observed,
+                convergence
+            )
+        delay = min(backoff.delay(attempts - 1), deadline - now)
+        time.sleep(delay)
+        slept += delay
@@ -0,0 +1,4 @@
+def endpoint_template(endpoint: str) -> str:
+    """Collapse numeric path segments so ``pet/123/uploadImage`` becomes ``pet/{id}/uploadImage``."""
+    path = endpoint.split("?", 1)[0].strip("/")
+    return "/".join("{id}" if segment.isdigit() else segment for segment in path.split("/"))
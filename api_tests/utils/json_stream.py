@@ -0,0 +1,106 @@
+import re
+from typing import Iterable, Iterator, List
+
+_STRUCTURAL = re.compile(rb'["\[\]{},]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+_WHITESPACE = b" \t\r\n"
+
+
+class JsonArraySplitter:
+    """Incrementally splits a top-level JSON array into the raw bytes of its elements.
+
+    Only brackets, braces, commas and string boundaries are tracked; elements
+    are handed out unparsed so they can be validated in batches.
+    """
+
+    def __init__(self):
+        self._buffer = b""
+        self._position = 0
+        self._start = 0
+        self._depth = 0
+        self._in_string = False
+        self._opened = False
+        self._closed = False
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        if self._closed:
+            if chunk.strip(_WHITESPACE):
+                raise ValueError("Unexpected data after the end of the JSON array")
+            return []
+        buffer = self._buffer + chunk
+        elements = []
+        position = self._position
+        start = self._start
+        if not self._opened:
+            stripped = buffer.lstrip(_WHITESPACE)
+            if not stripped:
+                self._buffer = b""
+                return elements
+            if stripped[:1] != b"[":
+                raise ValueError("Response body is not a JSON array")
+            self._opened = True
+            self._depth = 1
+            position = start = len(buffer) - len(stripped) + 1
+
+        while position < len(buffer):
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buffer, position)
+                if match is None:
+                    position = len(buffer)
+                    break
+                position = match.end()
+                if match.group() == b"\\":
+                    if position >= len(buffer):
+                        position -= 1
+                        break
+                    position += 1
+                else:
+                    self._in_string = False
+                continue
+
+            match = _STRUCTURAL.search(buffer, position)
+            if match is None:
+                position = len(buffer)
+                break
+            token = match.group()
+            position = match.end()
+            if token == b'"':
+                self._in_string = True
+            elif token in (b"{", b"["):
+                self._depth += 1
+            elif token in (b"}", b"]"):
+                self._depth -= 1
+                if self._depth == 0:
+                    self._append(elements, buffer[start:match.start()])
+                    self._closed = True
+                    if buffer[position:].strip(_WHITESPACE):
+                        raise ValueError("Unexpected data after the end of the JSON array")
+                    self._buffer = b""
+                    return elements
+            elif token == b"," and self._depth == 1:
+                if not self._append(elements, buffer[start:match.start()]):
+                    raise ValueError("Empty element in JSON array")
+                start = position
+
+        self._buffer = buffer[start:]
+        self._position = position - start
+        self._start = 0
+        return elements
+
+    @staticmethod
+    def _append(elements: List[bytes], raw: bytes) -> bool:
+        raw = raw.strip(_WHITESPACE)
+        if raw:
+            elements.append(raw)
+        return bool(raw)
+
+    def close(self) -> None:
+        if not self._closed:
+            raise ValueError("Truncated JSON array")
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    splitter = JsonArraySplitter()
+    for chunk in chunks:
+        yield from splitter.feed(chunk)
+    splitter.close()
@@ -0,0 +1,20 @@
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+def start_queue_logging(level: int, format: str) -> QueueListener:
+    """Route root logging through a QueueHandler; stream I/O happens on a listener thread.
+
+    ``QueueHandler.prepare`` still formats each record on the logging thread, so
+    lazy %-style arguments only save work for records below the level.
+    """
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(format))
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    return listener
@@ -0,0 +1,144 @@
+import hashlib
+import mimetypes
+import mmap
+import os
+import uuid
+from typing import BinaryIO, Callable, Dict, List, Optional, Tuple, Union
+
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+
+_SIGNATURES: List[Tuple[bytes, int, str]] = [
+    (b"\x89PNG\r\n\x1a\n", 0, "image/png"),
+    (b"\xff\xd8\xff", 0, "image/jpeg"),
+    (b"GIF87a", 0, "image/gif"),
+    (b"GIF89a", 0, "image/gif"),
+    (b"WEBP", 8, "image/webp"),
+    (b"BM", 0, "image/bmp"),
+    (b"II*\x00", 0, "image/tiff"),
+    (b"MM\x00*", 0, "image/tiff"),
+]
+SNIFF_BYTES = 16
+
+
+def sniff_content_type(head: bytes, filename: Optional[str] = None) -> str:
+    """Content type from the file's magic bytes, falling back to its extension."""
+    for signature, offset, content_type in _SIGNATURES:
+        if head[offset:offset + len(signature)] == signature:
+            if content_type == "image/webp" and head[:4] != b"RIFF":
+                continue
+            return content_type
+    if filename:
+        guessed, _ = mimetypes.guess_type(filename)
+        if guessed:
+            return guessed
+    return DEFAULT_CONTENT_TYPE
+
+
+def _quote(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+class MultipartEncoder:
+    """Streaming ``multipart/form-data`` body with a known length.
+
+    File parts are read from their handles in ``chunk_size`` pieces as the body
+    is consumed, so memory use does not grow with file size. ``tell``/``seek(0)``
+    let requests and urllib3 rewind the body for redirects and retries.
+    ``on_read`` is called with the size of every chunk handed out, before it is
+    returned, which is where rate limiting hooks in.
+    """
+
+    def __init__(
+        self,
+        fields: Optional[Dict[str, str]] = None,
+        files: Optional[Dict[str, Tuple[str, Union[BinaryIO, mmap.mmap], str]]] = None,
+        chunk_size: int = 64 * 1024,
+        on_read: Optional[Callable[[int], None]] = None
+    ):
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self.chunk_size = chunk_size
+        self.on_read = on_read
+        self._fingerprint = hashlib.sha256()
+        self._segments: List[Union[bytes, Tuple[Union[BinaryIO, mmap.mmap], int, int]]] = []
+        for name, value in (fields or {}).items():
+            self._segments.append(
+                self._part_header(name) + value.encode("utf-8") + b"\r\n"
+            )
+            self._fingerprint.update(f"field:{name}={value}".encode())
+        for name, (filename, handle, content_type) in (files or {}).items():
+            self._segments.append(self._part_header(name, filename, content_type))
+            start = handle.tell()
+            size = self._size(handle) - start
+            self._segments.append((handle, start, size))
+            self._segments.append(b"\r\n")
+            self._fingerprint.update(f"file:{name}={filename};{content_type};{size}".encode())
+        self._segments.append(f"--{self.boundary}--\r\n".encode())
+        self.len = sum(len(segment) if isinstance(segment, bytes) else segment[2] for segment in self._segments)
+        self.seek(0)
+
+    def _part_header(self, name: str, filename: Optional[str] = None, content_type: Optional[str] = None) -> bytes:
+        disposition = f'form-data; name="{_quote(name)}"'
+        if filename is not None:
+            disposition += f'; filename="{_quote(filename)}"'
+        header = f"--{self.boundary}\r\nContent-Disposition: {disposition}\r\n"
+        if content_type is not None:
+            header += f"Content-Type: {content_type}\r\n"
+        return (header + "\r\n").encode("utf-8")
+
+    @staticmethod
+    def _size(handle: Union[BinaryIO, mmap.mmap]) -> int:
+        if isinstance(handle, mmap.mmap):
+            return handle.size()
+        return os.fstat(handle.fileno()).st_size
+
+    def __len__(self) -> int:
+        return self.len
+
+    def fingerprint(self) -> str:
+        """Hash of field values and file names, types and sizes (file contents are not read)."""
+        return self._fingerprint.hexdigest()
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if offset != 0 or whence != os.SEEK_SET:
+            raise OSError("MultipartEncoder can only be rewound to the start")
+        self._position = 0
+        self._segment = 0
+        self._segment_offset = 0
+        return 0
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self.len - self._position
+        pieces = []
+        remaining = size
+        while remaining > 0 and self._segment < len(self._segments):
+            segment = self._segments[self._segment]
+            if isinstance(segment, bytes):
+                piece = segment[self._segment_offset:self._segment_offset + remaining]
+                segment_length = len(segment)
+            else:
+                handle, start, segment_length = segment
+                handle.seek(start + self._segment_offset)
+                piece = handle.read(min(remaining, segment_length - self._segment_offset))
+            pieces.append(piece)
+            remaining -= len(piece)
+            self._segment_offset += len(piece)
+            if self._segment_offset >= segment_length or not piece:
+                self._segment += 1
+                self._segment_offset = 0
+        data = b"".join(pieces)
+        self._position += len(data)
+        if data and self.on_read is not None:
+            self.on_read(len(data))
+        return data
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
@@ -0,0 +1,224 @@
+import itertools
+import logging
+import os
+import queue
+import random
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, List, Optional
+
+from api_tests.api import instrumentation
+from api_tests.api.pet_client import PetClient
+from api_tests.models.pet import Category, Pet, Tag
+
+logger = logging.getLogger(__name__)
+
+ID_RANGE_BASE = 7_000_000_000_000
+ID_RANGE_WIDTH = 1_000_000_000_000
+ID_RUN_SPAN = 1_000_000
+
+
+def worker_index(worker_id: Optional[str] = None) -> int:
+    """Index of the xdist worker (``gw3`` -> 3); 0 when not running under xdist."""
+    worker_id = worker_id or os.getenv("PYTEST_XDIST_WORKER", "master")
+    digits = worker_id.lstrip("gw")
+    return int(digits) if digits.isdigit() else 0
+
+
+class PetIdAllocator:
+    """Hands out ids from a half-open range reserved for one worker process."""
+
+    def __init__(self, start: int, end: int):
+        self.start = start
+        self.end = end
+        self._ids = itertools.count(start)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_worker(cls, worker_id: Optional[str] = None, rng: Optional[random.Random] = None) -> "PetIdAllocator":
+        """A random ``ID_RUN_SPAN`` slice of the worker's range.
+
+        Workers of one run never overlap; the random slice keeps concurrent runs
+        against a shared server (two CI jobs, say) from reusing each other's ids.
+        """
+        rng = rng or random.SystemRandom()
+        start = ID_RANGE_BASE + worker_index(worker_id) * ID_RANGE_WIDTH
+        start += rng.randrange(ID_RANGE_WIDTH // ID_RUN_SPAN) * ID_RUN_SPAN
+        return cls(start, start + ID_RUN_SPAN)
+
+    def next_id(self) -> int:
+        with self._lock:
+            pet_id = next(self._ids)
+        if pet_id >= self.end:
+            raise RuntimeError(f"Pet id range [{self.start}, {self.end}) exhausted")
+        return pet_id
+
+
+def build_pet(pet_id: int) -> Pet:
+    return Pet(
+        id=pet_id,
+        category=Category(id=1, name="Dogs"),
+        name=f"Test Dog {pet_id}",
+        photoUrls=["https://example.com/photo.jpg"],
+        tags=[Tag(id=1, name="test-tag")],
+        status="available"
+    )
+
+
+class PetPool:
+    """Per-worker pool of pre-created pets.
+
+    ``lease()`` lends an existing pet to a test that only reads it; the pet is
+    re-written on return if the test reports it dirty. ``take_fresh()`` hands
+    out a pet the test may mutate or delete, from a queue a background thread
+    keeps topped up; taken pets are deleted in the background afterwards.
+    """
+
+    def __init__(
+        self,
+        client: PetClient,
+        allocator: PetIdAllocator,
+        size: int = 20,
+        refill_size: int = 10,
+        fresh_timeout: float = 30.0
+    ):
+        self.client = client
+        self.allocator = allocator
+        self.size = size
+        self.refill_size = refill_size
+        self.fresh_timeout = fresh_timeout
+        self._idle: Deque[Pet] = deque()
+        self._available = threading.Condition()
+        self._fresh: "queue.Queue[Pet]" = queue.Queue()
+        self._discarded: "queue.Queue[int]" = queue.Queue()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._pooled_ids: List[int] = []
+        self.leases = 0
+        self.lease_waits = 0
+        self.resets = 0
+        self.fresh_taken = 0
+        self.fresh_waits = 0
+        self.created = 0
+
+    def _create(self, count: int) -> List[Pet]:
+        pets = [build_pet(self.allocator.next_id()) for _ in range(count)]
+        result = self.client.add_pets(pets)
+        created = [result_item.item for result_item in result if result_item.ok]
+        for failure in result.failures:
+            logger.warning("Failed to provision pet %s: %s", failure.item.id, failure.error or failure.response)
+        self.created += len(created)
+        return created
+
+    def start(self) -> "PetPool":
+        pets = self._create(self.size + self.refill_size)
+        pooled, fresh = pets[:self.size], pets[self.size:]
+        self._idle.extend(pooled)
+        self._pooled_ids = [pet.id for pet in pooled]
+        for pet in fresh:
+            self._fresh.put(pet)
+        self._worker = threading.Thread(target=self._run, name="pet-pool-refill", daemon=True)
+        self._worker.start()
+        logger.info("Pet pool ready: %s pooled, %s fresh (ids from %s)", len(pooled), len(fresh), self.allocator.start)
+        return self
+
+    def _refill(self, count: int) -> None:
+        for _ in range(count):
+            if self._stopped.is_set():
+                return
+            pet = build_pet(self.allocator.next_id())
+            response = self.client.add_pet(pet)
+            if not response.ok:
+                logger.warning("Failed to provision pet %s: %s", pet.id, response.status_code)
+                return
+            self.created += 1
+            self._fresh.put(pet)
+
+    def _run(self) -> None:
+        instrumentation.detach_thread()
+        while not self._stopped.is_set():
+            self._wake.wait(timeout=1.0)
+            self._wake.clear()
+            discarded = []
+            while True:
+                try:
+                    discarded.append(self._discarded.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                for pet_id in discarded:
+                    self.client.delete_pet(pet_id)
+                self._refill(self.refill_size - self._fresh.qsize())
+            except Exception:
+                logger.exception("Pet pool maintenance failed")
+
+    def acquire(self) -> Pet:
+        with self._available:
+            if not self._idle:
+                self.lease_waits += 1
+                if not self._available.wait_for(lambda: self._idle, timeout=self.fresh_timeout):
+                    raise TimeoutError("No pooled pet became available")
+            self.leases += 1
+            return self._idle.popleft()
+
+    def release(self, pet: Pet, dirty: bool = False) -> None:
+        if dirty:
+            self.resets += 1
+            self.client.update_pet(pet)
+        with self._available:
+            self._idle.append(pet)
+            self._available.notify()
+
+    @contextmanager
+    def lease(self) -> Iterator[Pet]:
+        pet = self.acquire()
+        dirty = True
+        try:
+            yield pet
+            dirty = False
+        finally:
+            self.release(pet, dirty=dirty)
+
+    def take_fresh(self) -> Pet:
+        if self._fresh.empty():
+            self.fresh_waits += 1
+            self._wake.set()
+        pet = self._fresh.get(timeout=self.fresh_timeout)
+        self.fresh_taken += 1
+        self._wake.set()
+        return pet
+
+    def discard(self, pet: Pet) -> None:
+        self._discarded.put(pet.id)
+        self._wake.set()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._wake.set()
+        if self._worker is not None:
+            self._worker.join(timeout=self.fresh_timeout)
+        leftover = list(self._pooled_ids)
+        while True:
+            try:
+                leftover.append(self._fresh.get_nowait().id)
+            except queue.Empty:
+                break
+        while True:
+            try:
+                leftover.append(self._discarded.get_nowait())
+            except queue.Empty:
+                break
+        if leftover:
+            self.client.delete_pets(leftover)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "created": self.created,
+            "leases": self.leases,
+            "lease_waits": self.lease_waits,
+            "resets": self.resets,
+            "fresh_taken": self.fresh_taken,
+            "fresh_waits": self.fresh_waits,
+        }
@@ -0,0 +1,211 @@
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from api_tests.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Thread-safe token bucket; ``consume`` blocks until enough tokens have accrued.
+
+    ``rate`` tokens are added per second up to ``capacity``. Requests larger
+    than the capacity are paid for in capacity-sized installments.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.waited = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def consume(self, tokens: float) -> float:
+        """Take ``tokens``, sleeping as needed; returns the time spent waiting."""
+        waited = 0.0
+        while tokens > 0:
+            installment = min(tokens, self.capacity)
+            with self._lock:
+                self._refill(time.monotonic())
+                self._tokens -= installment
+                delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+                self.waited += delay
+            if delay:
+                time.sleep(delay)
+                waited += delay
+            tokens -= installment
+        return waited
+
+
+def parse_limits(text: str) -> Dict[str, float]:
+    """``"pet/{id}=5, pet/findByStatus=2"`` -> ``{"pet/{id}": 5.0, "pet/findByStatus": 2.0}``."""
+    limits = {}
+    for item in filter(None, (part.strip() for part in text.split(","))):
+        template, separator, rate = item.rpartition("=")
+        if not separator or not template.strip():
+            raise ValueError(f"Invalid rate limit {item!r}, expected TEMPLATE=RATE")
+        limits[template.strip().strip("/")] = float(rate)
+    return limits
+
+
+def default_state_path(base_url: str) -> str:
+    """State file shared by every process on this host that targets ``base_url``."""
+    digest = hashlib.sha1(base_url.rstrip("/").encode()).hexdigest()[:12]
+    return os.path.join(tempfile.gettempdir(), f"api_tests_rate_limit_{digest}.json")
+
+
+class SharedRateLimiter:
+    """Token buckets per endpoint template, shared by all processes that open the same state file.
+
+    Each bucket is kept as its theoretical arrival time (GCRA), so taking a
+    token is one read-modify-write of the state file under ``flock``; xdist
+    workers therefore reserve distinct send slots instead of all firing and
+    backing off together. ``limits`` maps endpoint templates to requests per
+    second; other templates use ``rate`` (0 leaves them unlimited). ``burst``
+    requests may go out back to back before pacing starts.
+
+    ``throttle`` is called when the server answers 429 anyway. It pauses the
+    bucket for every worker until ``Retry-After`` has passed, drops the burst
+    and halves the bucket's rate, which then recovers by ``recovery`` of the
+    configured rate per second.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        rate: float = 0.0,
+        limits: Optional[Dict[str, float]] = None,
+        burst: float = 1.0,
+        min_scale: float = 1 / 16,
+        recovery: float = 0.05
+    ):
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.path = path
+        self.rate = rate
+        self.limits = dict(limits or {})
+        self.burst = burst
+        self.min_scale = min_scale
+        self.recovery = recovery
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        # flock excludes other processes only; threads share this descriptor.
+        self._lock = threading.Lock()
+        self.acquired = 0
+        self.throttled = 0
+        self.waited = 0.0
+
+    @classmethod
+    def from_settings(cls, base_url: str) -> Optional["SharedRateLimiter"]:
+        """A limiter configured by ``RATE_LIMIT*`` settings; None when no limit is set."""
+        limits = parse_limits(settings.RATE_LIMITS)
+        if settings.RATE_LIMIT <= 0 and not limits:
+            return None
+        return cls(
+            settings.RATE_LIMIT_PATH or default_state_path(base_url),
+            rate=settings.RATE_LIMIT,
+            limits=limits,
+            burst=settings.RATE_LIMIT_BURST
+        )
+
+    def rate_for(self, key: str) -> float:
+        return self.limits.get(key, self.rate)
+
+    def acquire(self, key: str) -> float:
+        """Reserve the next send slot for ``key`` and sleep until it; returns the time waited.
+
+        A key without a rate is not paced, but still waits out a pause that
+        :meth:`throttle` recorded for it after a 429.
+        """
+        rate = self.rate_for(key)
+        if rate <= 0:
+            return self._wait_out_throttle(key)
+        with self._state() as state:
+            now = time.time()
+            bucket = self._bucket(state, key, now)
+            interval = 1 / (rate * bucket["scale"])
+            start = max(now, bucket["tat"] - (self.burst - 1) * interval)
+            bucket["tat"] = max(bucket["tat"], now) + interval
+            delay = start - now
+            self.acquired += 1
+            self.waited += delay
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def _wait_out_throttle(self, key: str) -> float:
+        with self._state() as state:
+            now = time.time()
+            bucket = state.get(key)
+            delay = max(0.0, bucket["tat"] - now) if bucket is not None else 0.0
+            if bucket is not None and delay == 0:
+                # The pause is over; the key is unlimited again.
+                del state[key]
+            self.waited += delay
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def throttle(self, key: str, retry_after: Optional[float] = None) -> None:
+        """Back off every worker's use of ``key`` after the server rejected a request."""
+        with self._state() as state:
+            now = time.time()
+            bucket = self._bucket(state, key, now)
+            bucket["scale"] = max(self.min_scale, bucket["scale"] / 2)
+            rate = self.rate_for(key) or 1.0
+            interval = 1 / (rate * bucket["scale"])
+            pause = retry_after if retry_after is not None else interval
+            # The next reservation starts after the pause, with no burst allowance left.
+            bucket["tat"] = max(bucket["tat"], now + pause + (self.burst - 1) * interval)
+            self.throttled += 1
+        logger.warning("Rate limited on %s; pausing all workers for %.2fs", key, pause)
+
+    def stats(self) -> Dict[str, float]:
+        return {"acquired": self.acquired, "throttled": self.throttled, "waited": self.waited}
+
+    def reset(self) -> None:
+        with self._state() as state:
+            state.clear()
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _bucket(self, state: Dict[str, Dict[str, float]], key: str, now: float) -> Dict[str, float]:
+        bucket = state.setdefault(key, {"tat": now, "scale": 1.0, "updated": now})
+        bucket["scale"] = min(1.0, bucket["scale"] + (now - bucket["updated"]) * self.recovery)
+        bucket["updated"] = now
+        return bucket
+
+    @contextmanager
+    def _state(self) -> Iterator[Dict[str, Dict[str, float]]]:
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                raw = os.pread(self._fd, os.fstat(self._fd).st_size, 0)
+                try:
+                    state = json.loads(raw) if raw else {}
+                except ValueError:
+                    logger.warning("Discarding unreadable rate limit state in %s", self.path)
+                    state = {}
+                yield state
+                data = json.dumps(state).encode()
+                os.ftruncate(self._fd, len(data))
+                os.pwrite(self._fd, data, 0)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
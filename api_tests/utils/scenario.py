@@ -0,0 +1,294 @@
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+from pydantic import BaseModel
+
+from api_tests.api.base_client import BaseAPIClient
+from api_tests.config.settings import settings
+from api_tests.utils.assertions import assert_response_schema, assert_status_code
+
+logger = logging.getLogger(__name__)
+
+
+class ScenarioError(ValueError):
+    """A scenario that cannot run: duplicate steps, unknown dependencies or a cycle."""
+
+
+@dataclass(frozen=True)
+class From:
+    """Step input taken from the value of an earlier step, optionally transformed."""
+
+    step: str
+    transform: Optional[Callable[[Any], Any]] = None
+
+    def resolve(self, values: Dict[str, Any]) -> Any:
+        value = values[self.step]
+        return self.transform(value) if self.transform else value
+
+
+@dataclass
+class Step:
+    """One call in a scenario and the assertions attached to it.
+
+    ``action`` is called as ``action(client, **inputs)`` with every ``From``
+    input resolved. Its result goes through ``expect`` (status code),
+    ``schema`` (validated model replaces the response), ``check`` (which may
+    assert, or return False to fail the step) and finally ``output``, whose
+    return value is what dependent steps receive.
+    """
+
+    name: str
+    action: Callable[..., Any]
+    inputs: Dict[str, Any] = field(default_factory=dict)
+    after: Tuple[str, ...] = ()
+    expect: Optional[int] = None
+    schema: Optional[Type[BaseModel]] = None
+    check: Optional[Callable[[Any], Any]] = None
+    output: Optional[Callable[[Any], Any]] = None
+
+    @property
+    def dependencies(self) -> List[str]:
+        inputs = [value.step for value in self.inputs.values() if isinstance(value, From)]
+        return list(dict.fromkeys([*inputs, *self.after]))
+
+    def resolve_inputs(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: value.resolve(values) if isinstance(value, From) else value
+                for key, value in self.inputs.items()}
+
+    def execute(self, client: BaseAPIClient, inputs: Dict[str, Any]) -> Tuple[Any, Any]:
+        """Run the action and its assertions; returns ``(response, value)``."""
+        response = self.action(client, **inputs)
+        if self.expect is not None:
+            assert_status_code(response, self.expect)
+        value = assert_response_schema(response, self.schema) if self.schema is not None else response
+        if self.check is not None and self.check(value) is False:
+            raise AssertionError(f"Check of step {self.name!r} failed for {value!r}")
+        if self.output is not None:
+            value = self.output(value)
+        return response, value
+
+
+@dataclass
+class StepResult:
+    name: str
+    status: str = "pending"
+    started: float = 0.0
+    elapsed: float = 0.0
+    response: Any = None
+    value: Any = None
+    error: Optional[BaseException] = None
+    blocked_by: Optional[str] = None
+
+    @property
+    def finished(self) -> float:
+        return self.started + self.elapsed
+
+
+@dataclass
+class ScenarioResult:
+    """Per-step outcomes and timings; ``started`` offsets are from the scenario start."""
+
+    name: str
+    steps: Dict[str, StepResult]
+    dependencies: Dict[str, List[str]]
+    elapsed: float = 0.0
+
+    @property
+    def passed(self) -> bool:
+        return all(step.status == "passed" for step in self.steps.values())
+
+    @property
+    def failures(self) -> List[StepResult]:
+        return [step for step in self.steps.values() if step.status == "failed"]
+
+    @property
+    def sum_of_steps(self) -> float:
+        return sum(step.elapsed for step in self.steps.values())
+
+    def critical_path(self) -> List[str]:
+        """The dependency chain with the largest total step time."""
+        longest: Dict[str, Tuple[float, List[str]]] = {}
+        for name in self.steps:
+            before = max((longest[dependency] for dependency in self.dependencies[name]),
+                         key=lambda entry: entry[0], default=(0.0, []))
+            longest[name] = (before[0] + self.steps[name].elapsed, before[1] + [name])
+        return max(longest.values(), key=lambda entry: entry[0], default=(0.0, []))[1]
+
+    @property
+    def critical_path_time(self) -> float:
+        return sum(self.steps[name].elapsed for name in self.critical_path())
+
+    def value(self, step: str) -> Any:
+        return self.steps[step].value
+
+    def summary(self) -> str:
+        critical = set(self.critical_path())
+        lines = [f"Scenario {self.name}: {self.elapsed * 1000:.1f}ms "
+                 f"(critical path {self.critical_path_time * 1000:.1f}ms, "
+                 f"sum of steps {self.sum_of_steps * 1000:.1f}ms)"]
+        for step in sorted(self.steps.values(), key=lambda step: step.started):
+            marker = "*" if step.name in critical else " "
+            line = (f" {marker} {step.name:<20}{step.status:<9}"
+                    f"+{step.started * 1000:>8.1f}ms {step.elapsed * 1000:>8.1f}ms")
+            if step.error is not None:
+                line += f"  {type(step.error).__name__}: {step.error}"
+            elif step.blocked_by is not None:
+                line += f"  ({step.blocked_by} did not pass)"
+            lines.append(line)
+        return "\n".join(lines)
+
+    def raise_for_failures(self) -> None:
+        if not self.passed:
+            raise ScenarioFailed(self)
+
+
+class ScenarioFailed(AssertionError):
+    """Raised when any step fails; the first failure is chained as the cause."""
+
+    def __init__(self, result: ScenarioResult):
+        failed = ", ".join(step.name for step in result.failures)
+        super().__init__(f"Scenario {result.name} failed at step(s): {failed}\n{result.summary()}")
+        self.result = result
+        if result.failures:
+            self.__cause__ = min(result.failures, key=lambda step: step.finished).error
+
+
+class Scenario:
+    """Declarative multi-step flow whose independent steps run concurrently.
+
+    Steps name their inputs, e.g. ``pet_id=From("create")``; the engine builds
+    the dependency graph from those inputs (plus ``after``, for ordering
+    without data) and starts each step as soon as everything it depends on
+    has passed, so a scenario takes roughly its critical-path time. A failed
+    step skips its dependents while unrelated branches finish.
+    """
+
+    def __init__(self, name: str = "scenario"):
+        self.name = name
+        self.steps: Dict[str, Step] = {}
+
+    def step(
+        self,
+        name: str,
+        action: Callable[..., Any],
+        *,
+        after: Sequence[str] = (),
+        expect: Optional[int] = None,
+        schema: Optional[Type[BaseModel]] = None,
+        check: Optional[Callable[[Any], Any]] = None,
+        output: Optional[Callable[[Any], Any]] = None,
+        **inputs: Any
+    ) -> "Scenario":
+        if name in self.steps:
+            raise ScenarioError(f"Duplicate step {name!r} in scenario {self.name}")
+        self.steps[name] = Step(name, action, inputs, tuple(after), expect, schema, check, output)
+        return self
+
+    def order(self) -> List[str]:
+        """Step names in a dependency-respecting order; raises ScenarioError on bad graphs."""
+        for step in self.steps.values():
+            unknown = [name for name in step.dependencies if name not in self.steps]
+            if unknown:
+                raise ScenarioError(f"Step {step.name!r} depends on unknown step(s): {', '.join(unknown)}")
+
+        remaining = {name: set(step.dependencies) for name, step in self.steps.items()}
+        order: List[str] = []
+        while remaining:
+            ready = [name for name, dependencies in remaining.items() if not dependencies]
+            if not ready:
+                raise ScenarioError(f"Dependency cycle between steps: {', '.join(sorted(remaining))}")
+            for name in ready:
+                order.append(name)
+                del remaining[name]
+            for dependencies in remaining.values():
+                dependencies.difference_update(ready)
+        return order
+
+    def run(
+        self,
+        client: BaseAPIClient,
+        max_workers: Optional[int] = None,
+        raise_on_failure: bool = True
+    ) -> ScenarioResult:
+        order = self.order()
+        result = ScenarioResult(
+            name=self.name,
+            steps={name: StepResult(name) for name in order},
+            dependencies={name: self.steps[name].dependencies for name in order}
+        )
+        dependents: Dict[str, List[str]] = {name: [] for name in order}
+        waiting = {name: set(dependencies) for name, dependencies in result.dependencies.items()}
+        for name, dependencies in result.dependencies.items():
+            for dependency in dependencies:
+                dependents[dependency].append(name)
+        values: Dict[str, Any] = {}
+        started = time.perf_counter()
+
+        def execute(step: Step, inputs: Dict[str, Any]) -> None:
+            step_result = result.steps[step.name]
+            step_started = time.perf_counter()
+            step_result.started = step_started - started
+            try:
+                step_result.response, step_result.value = step.execute(client, inputs)
+                step_result.status = "passed"
+            except Exception as e:
+                step_result.error = e
+                step_result.status = "failed"
+            finally:
+                step_result.elapsed = time.perf_counter() - step_started
+
+        def skip(name: str, blocked_by: str) -> None:
+            step_result = result.steps[name]
+            if step_result.status != "pending":
+                return
+            step_result.status = "skipped"
+            step_result.blocked_by = blocked_by
+            for dependent in dependents[name]:
+                skip(dependent, name)
+
+        workers = max(1, min(max_workers or settings.SCENARIO_MAX_WORKERS, len(order)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"scenario-{self.name}") as executor:
+            running: Dict[Future, str] = {}
+
+            def launch(name: str) -> None:
+                step = self.steps[name]
+                try:
+                    inputs = step.resolve_inputs(values)
+                except Exception as e:
+                    result.steps[name].error = e
+                    result.steps[name].status = "failed"
+                    for dependent in dependents[name]:
+                        skip(dependent, name)
+                    return
+                result.steps[name].status = "running"
+                running[executor.submit(execute, step, inputs)] = name
+
+            for name in order:
+                if not waiting[name]:
+                    launch(name)
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    step_result = result.steps[name]
+                    if step_result.status != "passed":
+                        for dependent in dependents[name]:
+                            skip(dependent, name)
+                        continue
+                    values[name] = step_result.value
+                    for dependent in dependents[name]:
+                        waiting[dependent].discard(name)
+                        if not waiting[dependent] and result.steps[dependent].status == "pending":
+                            launch(dependent)
+
+        result.elapsed = time.perf_counter() - started
+        logger.info(
+            "Scenario %s: %d steps in %.3fs (critical path %.3fs, sum of steps %.3fs)",
+            self.name, len(order), result.elapsed, result.critical_path_time, result.sum_of_steps
+        )
+        if raise_on_failure:
+            result.raise_for_failures()
+        return result
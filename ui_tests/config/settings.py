@@ -12,5 +12,8 @@ class Settings:
     HOME_PAGE_URL: str = f"{BASE_URL}/"
     QA_JOBS_PAGE_URL: str = f"{BASE_URL}/careers/quality-assurance/"
     IMPLICIT_WAIT: int = int(os.getenv("IMPLICIT_WAIT", "10"))
+    DRIVER_POOL: bool = os.getenv("DRIVER_POOL", "true").lower() == "true"
+    DRIVER_POOL_SIZE: int = int(os.getenv("DRIVER_POOL_SIZE", "1"))
+    DRIVER_MAX_USES: int = int(os.getenv("DRIVER_MAX_USES", "50"))
 
 settings = Settings()
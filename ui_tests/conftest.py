@@ -1,9 +1,15 @@
+from __future__ import annotations
+
 import pytest
 import logging
-import allure
-from selenium import webdriver
-from ui_tests.utils.driver_factory import create_driver, BrowserType
-from ui_tests.utils.screenshot import take_screenshot
+from typing import TYPE_CHECKING
+
+# selenium, webdriver_manager and allure are imported by the fixtures and
+# hooks that use them, so collection and narrowly selected runs skip them.
+if TYPE_CHECKING:
+    from selenium import webdriver
+    from ui_tests.utils.driver_factory import BrowserType
+    from ui_tests.utils.driver_pool import DriverPool
 
 logging.basicConfig(
     level=logging.INFO,
@@ -16,20 +22,46 @@ logger = logging.getLogger(__name__)
 _cookies_set_for_drivers = set()
 
 
+@pytest.fixture(scope="session")
+def driver_pool() -> DriverPool:
+    """Warm drivers per browser for this worker, so tests skip the browser launch."""
+    from ui_tests.config.settings import settings
+    from ui_tests.utils.driver_factory import create_driver
+    from ui_tests.utils.driver_pool import DriverPool
+
+    pool = DriverPool(create_driver, size=settings.DRIVER_POOL_SIZE, max_uses=settings.DRIVER_MAX_USES)
+    yield pool
+    pool.close()
+    logger.info("Driver pool stats: %s", pool.stats())
+
+
 @pytest.fixture(scope="function", params=["chrome", "firefox"])
 def driver(request) -> webdriver.Remote:
+    import allure
+    from ui_tests.config.settings import settings
+    from ui_tests.utils.driver_factory import create_driver
+
     browser: BrowserType = request.param
     allure.dynamic.label("browser", browser)
-    driver = create_driver(browser)
+    pool = request.getfixturevalue("driver_pool") if settings.DRIVER_POOL else None
+    driver = pool.acquire(browser) if pool else create_driver(browser)
     yield driver
     driver_id = id(driver)
     if driver_id in _cookies_set_for_drivers:
         _cookies_set_for_drivers.remove(driver_id)
-    driver.quit()
+    if pool:
+        pool.release(driver)
+    else:
+        driver.quit()
 
 
 @pytest.fixture(autouse=True)
-def set_cookies(driver):
+def set_cookies(request):
+    # Only browser tests get the cookie banner handled; others must not launch a browser.
+    if "driver" not in request.fixturenames:
+        yield
+        return
+    driver = request.getfixturevalue("driver")
     driver_id = id(driver)
     
     if driver_id in _cookies_set_for_drivers:
@@ -85,6 +117,9 @@ def pytest_runtest_makereport(item, call):
             driver = item.funcargs.get("driver")
             if driver:
                 try:
+                    import allure
+                    from ui_tests.utils.screenshot import take_screenshot
+
                     screenshot_path = take_screenshot(driver, item.name)
                     logger.error(f"Screenshot saved: {screenshot_path}")
                     
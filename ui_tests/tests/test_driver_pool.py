@@ -0,0 +1,139 @@
+from typing import List
+
+import pytest
+
+from ui_tests.utils.driver_pool import BLANK_PAGE, DriverPool
+
+
+class FakeSwitchTo:
+
+    def __init__(self, driver: "FakeDriver"):
+        self.driver = driver
+
+    def window(self, handle: str) -> None:
+        self.driver.current_handle = handle
+
+
+class FakeDriver:
+    """Just enough of a WebDriver for the pool: windows, cookies, navigation and quit."""
+
+    def __init__(self, browser: str):
+        self.browser = browser
+        self.window_handles: List[str] = ["main"]
+        self.current_handle = "main"
+        self.cookies = []
+        self.url = "https://example.com/"
+        self.crashed = False
+        self.quit_called = False
+        self.switch_to = FakeSwitchTo(self)
+
+    def close(self) -> None:
+        self.window_handles.remove(self.current_handle)
+
+    def delete_all_cookies(self) -> None:
+        if self.crashed:
+            raise RuntimeError("invalid session id")
+        self.cookies = []
+
+    def execute_script(self, script: str) -> None:
+        pass
+
+    def get(self, url: str) -> None:
+        self.url = url
+
+    def quit(self) -> None:
+        self.quit_called = True
+
+
+class FakeFactory:
+    """Creates FakeDrivers; the ``factory`` fixture makes each launch take ``launch_seconds``."""
+
+    def __init__(self, launch_seconds: float = 2.0):
+        self.launch_seconds = launch_seconds
+        self.launched: List[FakeDriver] = []
+
+    def __call__(self, browser: str) -> FakeDriver:
+        driver = FakeDriver(browser)
+        self.launched.append(driver)
+        return driver
+
+
+@pytest.fixture
+def factory(monkeypatch) -> FakeFactory:
+    factory = FakeFactory()
+    clock = iter(range(1000))
+    # A launch reads perf_counter before and after the factory, so each one takes launch_seconds.
+    monkeypatch.setattr("ui_tests.utils.driver_pool.time.perf_counter",
+                        lambda: next(clock) * factory.launch_seconds)
+    return factory
+
+
+@pytest.mark.regression
+class TestDriverPool:
+
+    def test_idle_driver_is_reset_and_reused(self, factory: FakeFactory):
+        pool = DriverPool(factory)
+        driver = pool.acquire("chrome")
+        driver.window_handles.append("popup")
+        driver.cookies.append({"name": "session", "value": "1"})
+
+        pool.release(driver)
+
+        assert driver.window_handles == ["main"]
+        assert driver.cookies == [] and driver.url == BLANK_PAGE
+        assert pool.acquire("chrome") is driver
+        assert pool.acquire("firefox") is not driver
+        assert len(factory.launched) == 2
+
+    def test_driver_is_recycled_after_max_uses(self, factory: FakeFactory):
+        pool = DriverPool(factory, max_uses=2)
+        first = pool.acquire("chrome")
+        pool.release(first)
+        pool.release(pool.acquire("chrome"))
+
+        assert first.quit_called
+        second = pool.acquire("chrome")
+        assert second is not first
+        assert pool.stats()["chrome"]["recycled"] == 1
+
+    def test_driver_that_fails_to_reset_is_discarded(self, factory: FakeFactory):
+        pool = DriverPool(factory)
+        driver = pool.acquire("chrome")
+        driver.crashed = True
+
+        pool.release(driver)
+
+        assert driver.quit_called
+        assert pool.acquire("chrome") is not driver
+        assert pool.stats()["chrome"]["crashed"] == 1
+
+    def test_idle_drivers_are_capped_at_size(self, factory: FakeFactory):
+        pool = DriverPool(factory, size=2)
+        drivers = [pool.acquire("chrome") for _ in range(3)]
+
+        for driver in drivers:
+            pool.release(driver)
+
+        assert [driver.quit_called for driver in drivers] == [False, False, True]
+        assert {pool.acquire("chrome"), pool.acquire("chrome")} == set(drivers[:2])
+        pool.close()
+        assert all(driver.quit_called for driver in drivers)
+
+    def test_launch_time_saved_is_accounted_per_reuse(self, factory: FakeFactory):
+        pool = DriverPool(factory)
+        for _ in range(4):
+            pool.release(pool.acquire("chrome"))
+        pool.warm("firefox")
+        pool.release(pool.acquire("firefox"))
+
+        stats = pool.stats()
+
+        assert stats["chrome"] == {
+            "launches": 1,
+            "reuses": 3,
+            "recycled": 0,
+            "crashed": 0,
+            "mean_launch_seconds": 2.0,
+            "launch_seconds_saved": 6.0,
+        }
+        assert stats["firefox"]["launches"] == 1 and stats["firefox"]["launch_seconds_saved"] == 2.0
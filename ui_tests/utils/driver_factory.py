@@ -3,8 +3,6 @@ from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
 from typing import Literal
 
 BrowserType = Literal["chrome", "firefox"]
@@ -23,6 +21,8 @@ def create_driver(browser: BrowserType = "chrome") -> webdriver.Remote:
         options.add_argument("--disable-dev-shm-usage")
         options.add_experimental_option("excludeSwitches", ["enable-logging", "enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
+        from webdriver_manager.chrome import ChromeDriverManager
+
         service = ChromeService(ChromeDriverManager().install())
         driver = webdriver.Chrome(service=service, options=options)
         
@@ -31,6 +31,8 @@ def create_driver(browser: BrowserType = "chrome") -> webdriver.Remote:
         options.add_argument("--width=1920")
         options.add_argument("--height=1080")
         
+        from webdriver_manager.firefox import GeckoDriverManager
+
         service = FirefoxService(GeckoDriverManager().install())
         driver = webdriver.Firefox(service=service, options=options)
         driver.maximize_window()
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Dict, List
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+logger = logging.getLogger(__name__)
+
+BLANK_PAGE = "about:blank"
+
+
+@dataclass
+class PooledDriver:
+    browser: str
+    driver: webdriver.Remote
+    launch_seconds: float
+    uses: int = 0
+
+
+@dataclass
+class BrowserStats:
+    launches: int = 0
+    reuses: int = 0
+    recycled: int = 0
+    crashed: int = 0
+    launch_seconds: float = 0.0
+    saved_seconds: float = 0.0
+
+    @property
+    def mean_launch(self) -> float:
+        return self.launch_seconds / self.launches if self.launches else 0.0
+
+
+@dataclass
+class DriverPool:
+    """Warm WebDriver instances per browser, reset between leases instead of relaunched.
+
+    A driver goes back to the pool after its cookies, storage and extra windows
+    are cleared. It is quit instead when the reset fails (the browser crashed or
+    hung), after ``max_uses`` leases, or when ``size`` idle drivers are already kept.
+    """
+
+    factory: Callable[[str], webdriver.Remote]
+    size: int = 1
+    max_uses: int = 50
+    _idle: Dict[str, List[PooledDriver]] = field(default_factory=lambda: defaultdict(list))
+    _leased: Dict[int, PooledDriver] = field(default_factory=dict)
+    _stats: Dict[str, BrowserStats] = field(default_factory=lambda: defaultdict(BrowserStats))
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def acquire(self, browser: str) -> webdriver.Remote:
+        with self._lock:
+            idle = self._idle[browser]
+            pooled = idle.pop() if idle else None
+            stats = self._stats[browser]
+            if pooled is not None:
+                stats.reuses += 1
+                stats.saved_seconds += pooled.launch_seconds
+        if pooled is None:
+            pooled = self._launch(browser)
+        pooled.uses += 1
+        with self._lock:
+            self._leased[id(pooled.driver)] = pooled
+        return pooled.driver
+
+    def release(self, driver: webdriver.Remote, discard: bool = False) -> None:
+        with self._lock:
+            pooled = self._leased.pop(id(driver))
+            stats = self._stats[pooled.browser]
+        if not discard and pooled.uses >= self.max_uses:
+            logger.info("Recycling %s driver after %d uses", pooled.browser, pooled.uses)
+            with self._lock:
+                stats.recycled += 1
+            discard = True
+        if not discard and not self._reset(pooled):
+            with self._lock:
+                stats.crashed += 1
+            discard = True
+        with self._lock:
+            idle = self._idle[pooled.browser]
+            if not discard and len(idle) < self.size:
+                idle.append(pooled)
+                return
+        self._quit(pooled)
+
+    def warm(self, browser: str, count: int = 1) -> None:
+        """Launch drivers ahead of the first lease, up to ``size`` idle ones."""
+        with self._lock:
+            missing = min(count, self.size) - len(self._idle[browser])
+        for _ in range(max(missing, 0)):
+            pooled = self._launch(browser)
+            with self._lock:
+                self._idle[browser].append(pooled)
+
+    def close(self) -> None:
+        with self._lock:
+            pooled = [driver for idle in self._idle.values() for driver in idle] + list(self._leased.values())
+            self._idle.clear()
+            self._leased.clear()
+        for driver in pooled:
+            self._quit(driver)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {
+                browser: {
+                    "launches": stats.launches,
+                    "reuses": stats.reuses,
+                    "recycled": stats.recycled,
+                    "crashed": stats.crashed,
+                    "mean_launch_seconds": round(stats.mean_launch, 3),
+                    "launch_seconds_saved": round(stats.saved_seconds, 3),
+                }
+                for browser, stats in self._stats.items()
+            }
+
+    def _launch(self, browser: str) -> PooledDriver:
+        started = time.perf_counter()
+        driver = self.factory(browser)
+        elapsed = time.perf_counter() - started
+        logger.info("Launched %s driver in %.2fs", browser, elapsed)
+        with self._lock:
+            stats = self._stats[browser]
+            stats.launches += 1
+            stats.launch_seconds += elapsed
+        return PooledDriver(browser=browser, driver=driver, launch_seconds=elapsed)
+
+    def _reset(self, pooled: PooledDriver) -> bool:
+        """Return the browser to a blank state; False when it no longer responds."""
+        driver = pooled.driver
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            driver.delete_all_cookies()
+            try:
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except Exception as e:
+                # Pages without an origin (about:blank, data: URLs) have no storage to clear.
+                logger.debug("Storage not cleared: %s", e)
+            driver.get(BLANK_PAGE)
+            return True
+        except Exception as e:
+            logger.warning("Discarding %s driver that failed to reset: %s", pooled.browser, e)
+            return False
+
+    def _quit(self, pooled: PooledDriver) -> None:
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            logger.warning("Failed to quit %s driver: %s", pooled.browser, e)
@@ -1,7 +1,12 @@
+from __future__ import annotations
+
 import os
 from datetime import datetime
 from pathlib import Path
-from selenium import webdriver
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from selenium import webdriver
 
 
 def take_screenshot(driver: webdriver.Remote, test_name: str) -> str: